@@ -5,5 +5,23 @@ Path planning algorithms package.
 from .dijkstra import DijkstraPathfinder
 from .astar import AStarPathfinder
 from .base import BasePathfinder, PathResult
+from .path import GridPath, CompressedPath, line_of_sight
+from .expansion_log import ExpansionLog
+from .flow_field import FlowField
+from .wavefront import WavefrontPathfinder
+from .ida_star import IDAStarPathfinder
+from .fringe_search import FringeSearchPathfinder
+from .contraction_hierarchy import ContractionHierarchy
+from .path_database import PathDatabase
+from .subgoal_graph import SubgoalGraph
+from .quadtree import QuadtreePathfinder
+from .rsr import RectangularSymmetryReduction
+from .goal_index import GoalIndex
+from .csr_graph import CSRGraph
 
-__all__ = ['DijkstraPathfinder', 'AStarPathfinder', 'BasePathfinder', 'PathResult'] 
\ No newline at end of file
+__all__ = ['DijkstraPathfinder', 'AStarPathfinder', 'BasePathfinder', 'PathResult', 'ExpansionLog',
+           'GridPath', 'CompressedPath', 'line_of_sight',
+           'FlowField', 'WavefrontPathfinder', 'IDAStarPathfinder', 'FringeSearchPathfinder',
+           'ContractionHierarchy', 'PathDatabase',
+           'SubgoalGraph', 'QuadtreePathfinder', 'RectangularSymmetryReduction',
+           'GoalIndex', 'CSRGraph'] 
\ No newline at end of file
@@ -1,19 +1,26 @@
 import heapq
 import time
-import psutil
-import os
-from typing import Tuple, Dict, Set
+from typing import Callable, Tuple, Dict, Iterable, Set
 from .base import BasePathfinder, PathResult
+from .goal_index import GoalIndex
+from .instrumentation import current_process
 
 
 class AStarPathfinder(BasePathfinder):
-    def __init__(self, grid, heuristic_type: str = "euclidean"):
-        super().__init__(grid)
+    def __init__(self, grid, heuristic_type: str = "euclidean", record_expansions: bool = False,
+                 agent_radius: int = 0, neighbor_provider=None):
+        super().__init__(grid, record_expansions, agent_radius, neighbor_provider)
         self.algorithm_name = "A*"
         self.heuristic_type = heuristic_type
     
     def heuristic(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         #We use a heuristic to guide search quicker
+        if self.graph is not None:
+            return self._graph_heuristic(pos1, pos2)
+        #Every move costs at least the cheapest cell, so scaling by it keeps the estimate admissible
+        return self.distance(pos1, pos2) * self.grid.min_cost
+    
+    def distance(self, pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
         x1, y1 = pos1
         x2, y2 = pos2
         
@@ -27,19 +34,69 @@ class AStarPathfinder(BasePathfinder):
         else:
             return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
     
+    def _graph_heuristic(self, node1: int, node2: int) -> float:
+        #Coordinate distance scaled down to the cheapest cost per unit distance of any edge;
+        #graphs without coordinates fall back to plain Dijkstra ordering
+        graph = self.graph
+        if graph.coordinates is None:
+            return 0.0
+        scale = graph.cost_scale(self.heuristic_type)
+        return scale * self.distance(graph.position(node1), graph.position(node2))
+    
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.reset_metrics()
+        self.begin_search(start, goal)
+        return self._search(start, {goal}, lambda position: self.heuristic(position, goal))
+    
+    def find_path_to_any(self, start: Tuple[int, int], goals: Iterable[Tuple[int, int]]) -> PathResult:
+        #Nearest of many goals, guided by the distance to the closest goal (still admissible).
+        #A bucket index keeps each lookup local and values are cached per node
+        goal_set = self._check_multi_goal(goals)
+        self.reset_metrics()
+        h_cache: Dict[Tuple[int, int], float] = {}
+        graph = self.graph
+        if graph is not None and graph.coordinates is None:
+            def nearest(node):
+                return 0.0
+        elif graph is not None:
+            #Bucket goal nodes by their coordinates, sized to the goals' spread
+            goal_index = GoalIndex(goal_set, self.distance, bucket_size=None, position=graph.position)
+            scale = graph.cost_scale(self.heuristic_type)
+            
+            def nearest(node):
+                return goal_index.nearest(graph.position(node))[1] * scale
+        else:
+            #Index on the unscaled distance its ring bound is derived from, then apply min_cost
+            goal_index = GoalIndex(goal_set, self.distance)
+            min_cost = self.grid.min_cost
+            
+            def nearest(position):
+                return goal_index.nearest(position)[1] * min_cost
+        
+        def nearest_goal_heuristic(position: Tuple[int, int]) -> float:
+            h_cost = h_cache.get(position)
+            if h_cost is None:
+                h_cost = h_cache[position] = nearest(position)
+            return h_cost
+        
+        return self._search(start, goal_set, nearest_goal_heuristic)
+    
+    def _search(self, start: Tuple[int, int], goals: Set[Tuple[int, int]],
+                heuristic: Callable[[Tuple[int, int]], float]) -> PathResult:
         start_time = time.time()
-        process = psutil.Process(os.getpid())
+        process = current_process()
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
         
-        self.reset_metrics()
+        expansion_log = self.expansion_log
         
         #Our priority queue holds (f_cost, g_cost, position), here f_cost = g_cost + h_cost
         start_g = 0.0
-        start_h = self.heuristic(start, goal)
+        start_h = heuristic(start)
         start_f = start_g + start_h
         
         min_heap = [(start_f, start_g, start)]
+        if expansion_log is not None:
+            expansion_log.record_insertion(start)
         visited: Set[Tuple[int, int]] = set()
         g_costs: Dict[Tuple[int, int], float] = {start: 0.0}
         parent_map: Dict[Tuple[int, int], Tuple[int, int]] = {start: None}
@@ -53,9 +110,11 @@ class AStarPathfinder(BasePathfinder):
             
             visited.add(current_pos)
             self.nodes_expanded += 1
+            if expansion_log is not None:
+                expansion_log.record_expansion(current_pos)
 
-            if current_pos == goal:
-                path = self.reconstruct_path(goal, parent_map)
+            if current_pos in goals:
+                path = self.reconstruct_path(current_pos, parent_map)
                 path_length = self.calculate_path_length(path)
                 computation_time = time.time() - start_time
                 
@@ -69,7 +128,10 @@ class AStarPathfinder(BasePathfinder):
                     computation_time=computation_time,
                     memory_usage=memory_usage,
                     algorithm_name=self.algorithm_name,
-                    found=True
+                    found=True,
+                    expansion_log=expansion_log,
+                    goal=current_pos,
+                    path_cost=current_g
                 )
             
             for neighbor_pos, move_cost in self.get_neighbors(current_pos):
@@ -81,10 +143,12 @@ class AStarPathfinder(BasePathfinder):
                         g_costs[neighbor_pos] = tentative_g
                         parent_map[neighbor_pos] = current_pos
                         
-                        h_cost = self.heuristic(neighbor_pos, goal)
+                        h_cost = heuristic(neighbor_pos)
                         f_cost = tentative_g + h_cost
                         
                         heapq.heappush(min_heap, (f_cost, tentative_g, neighbor_pos))
+                        if expansion_log is not None:
+                            expansion_log.record_insertion(neighbor_pos)
         
         computation_time = time.time() - start_time
         current_memory = process.memory_info().rss / 1024 / 1024
@@ -97,5 +161,6 @@ class AStarPathfinder(BasePathfinder):
             computation_time=computation_time,
             memory_usage=memory_usage,
             algorithm_name=self.algorithm_name,
-            found=False
+            found=False,
+            expansion_log=expansion_log
         ) 
\ No newline at end of file
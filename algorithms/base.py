@@ -4,39 +4,118 @@ Base pathfinding class with common functionality.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from array import array
+from typing import List, Sequence, Tuple, Optional, Set
 import time
+from .expansion_log import ExpansionLog
+from .path import GridPath
+from .csr_graph import CSRGraph
 
 
 @dataclass
 class PathResult:
-    path: List[Tuple[int, int]]
+    #Dijkstra and A* return a GridPath; other planners may still hand back a plain list
+    path: Sequence[Tuple[int, int]]
     path_length: float
     nodes_expanded: int
     computation_time: float
     memory_usage: float
     algorithm_name: str
     found: bool = True
+    expansion_log: Optional[ExpansionLog] = None
+    goal: Optional[Tuple[int, int]] = None
+    #Sum of move costs along the path; equals path_length on unit-cost grids
+    path_cost: Optional[float] = None
+
+
+class GridListener:
+    #Mixin for structures kept in sync with grid edits. The grid only holds a weak reference, so
+    #a discarded structure stops updating once collected; detach() or a with-block stops it at once
+    def detach(self):
+        #Stop tracking grid edits; the structure is left as of the last update
+        self.grid.remove_edit_listener(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.detach()
 
 
 class BasePathfinder(ABC):
     
-    def __init__(self, grid):
+    def __init__(self, grid, record_expansions: bool = False, agent_radius: int = 0,
+                 neighbor_provider=None):
         self.grid = grid
+        #A CSRGraph passed in place of a Grid: positions are node ids and moves come from its edges
+        self.graph: Optional[CSRGraph] = grid if isinstance(grid, CSRGraph) else None
         self.nodes_expanded = 0
         self.algorithm_name = "Base"
+        self.record_expansions = record_expansions
+        #Agents occupy a (2r+1)x(2r+1) square; r > 0 filters neighbours through the grid's clearance map
+        self.agent_radius = agent_radius
+        #Optional object replacing the grid moves: get_neighbors(pos), prepare(start, goal), expand_path(path)
+        self.neighbor_provider = neighbor_provider
+        if neighbor_provider is not None and agent_radius > 0:
+            #Providers replace the grid moves wholesale, so the clearance filter would never run
+            raise ValueError("agent_radius cannot be combined with a neighbour provider")
+        self.expansion_log: Optional[ExpansionLog] = None
     
     def reset_metrics(self):
         self.nodes_expanded = 0
+        #Only allocate a log when recording is on; searches skip all logging when it is None
+        if not self.record_expansions:
+            self.expansion_log = None
+        elif self.graph is not None:
+            self.expansion_log = ExpansionLog.for_graph(self.graph.num_nodes)
+        else:
+            self.expansion_log = ExpansionLog(self.grid.width, self.grid.height)
+    
+    @property
+    def num_nodes(self) -> int:
+        #Size of the search space: graph node ids, or flat cell indices (y * width + x) on grids
+        if self.graph is not None:
+            return self.graph.num_nodes
+        return self.grid.width * self.grid.height
+    
+    def begin_search(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        if self.neighbor_provider is not None:
+            self.neighbor_provider.prepare(start, goal)
     
     def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[Tuple[int, int], float]]:
         #finding neighbours on the basis of manhattan distance
+        if self.graph is not None:
+            return self.graph.neighbors(position)
+        if self.neighbor_provider is not None:
+            return self.neighbor_provider.get_neighbors(position)
+        
         x, y = position
         neighbors = []
+        #Entering a cell costs its cost-layer value, one array lookup per neighbour
+        costs = self.grid.costs
        
         #Manhattan distance
         directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
         
+        if self.agent_radius > 0:
+            radius = self.agent_radius
+            clearance = self.grid.clearance_for(radius)
+            width, height = self.grid.width, self.grid.height
+            for dx, dy in directions:
+                new_x, new_y = x + dx, y + dy
+                if (0 <= new_x < width and 0 <= new_y < height and
+                        clearance[new_y * width + new_x] > radius):
+                    neighbors.append(((new_x, new_y), 1.0 if costs is None else costs[new_y * width + new_x]))
+            return neighbors
+        
+        if costs is not None:
+            width = self.grid.width
+            for dx, dy in directions:
+                new_x, new_y = x + dx, y + dy
+                if self.grid.is_valid_position(new_x, new_y):
+                    neighbors.append(((new_x, new_y), costs[new_y * width + new_x]))
+            return neighbors
+        
         for dx, dy in directions:
             new_x, new_y = x + dx, y + dy
             
@@ -45,16 +124,51 @@ class BasePathfinder(ABC):
         
         return neighbors
     
-    def reconstruct_path(self, goal: Tuple[int, int], parent_map: dict) -> List[Tuple[int, int]]:
-        #Backtracking to get the path from goal to start
-        path = []
+    def require_unit_costs(self):
+        #Planners built around unit moves cannot honour a cost layer; fail rather than mislead
+        if getattr(self.grid, 'costs', None) is not None:
+            raise ValueError(f"{self.algorithm_name} assumes unit move costs but the grid has a cost layer")
+    
+    def trace_parents(self, goal, parent_map: dict) -> list:
+        #Backtracking from goal to start, written back to front so no reverse pass is needed
+        depth = 0
+        current = goal
+        while current is not None:
+            depth += 1
+            current = parent_map.get(current)
+        nodes = [None] * depth
+        current = goal
+        while current is not None:
+            depth -= 1
+            nodes[depth] = current
+            current = parent_map.get(current)
+        return nodes
+    
+    def reconstruct_path(self, goal: Tuple[int, int], parent_map: dict) -> Sequence:
+        #Same back-to-front walk, filling the flat int32 buffer of a GridPath directly
+        if self.graph is not None:
+            return self.trace_parents(goal, parent_map)
+        depth = 0
         current = goal
         while current is not None:
-            path.append(current)
+            depth += 1
             current = parent_map.get(current)
-        return path[::-1]  
+        flat = array('i', bytes(8 * depth))
+        current = goal
+        while current is not None:
+            depth -= 1
+            flat[2 * depth], flat[2 * depth + 1] = current
+            current = parent_map.get(current)
+        path = GridPath(flat)
+        if self.neighbor_provider is not None:
+            path = GridPath.from_points(self.neighbor_provider.expand_path(path.to_list()))
+        return path
     
-    def calculate_path_length(self, path: List[Tuple[int, int]]) -> float:
+    def calculate_path_length(self, path: Sequence[Tuple[int, int]]) -> float:
+        if isinstance(path, GridPath):
+            return path.length()
+        if self.graph is not None:
+            return self.graph.path_cost(path)
         if len(path) < 2:
             return 0.0
         
@@ -67,6 +181,23 @@ class BasePathfinder(ABC):
         
         return length
     
+    def calculate_path_cost(self, path: Sequence[Tuple[int, int]]) -> float:
+        #Sum of the entry costs of every cell after the start
+        if self.graph is not None:
+            return self.graph.path_cost(path)
+        if self.grid.costs is None:
+            return float(max(len(path) - 1, 0))
+        costs, width = self.grid.costs, self.grid.width
+        return float(sum(costs[y * width + x] for x, y in path[1:]))
+    
     @abstractmethod
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
-        pass 
\ No newline at end of file
+        pass
+    
+    def _check_multi_goal(self, goals) -> Set[Tuple[int, int]]:
+        if self.neighbor_provider is not None:
+            raise ValueError("find_path_to_any does not support neighbour providers")
+        goal_set = set(goals)
+        if not goal_set:
+            raise ValueError("find_path_to_any needs at least one goal")
+        return goal_set 
\ No newline at end of file
@@ -0,0 +1,295 @@
+import heapq
+import time
+from array import array
+from typing import Dict, List, Tuple
+from .base import BasePathfinder, PathResult
+from .serialization import load_arrays, map_checksum, save_arrays
+from .instrumentation import current_process
+
+
+INF = float('inf')
+FILE_MAGIC = b"CHGRID1\n"
+
+
+class ContractionHierarchy(BasePathfinder):
+    #Contraction hierarchy over the free cells of a static grid.
+    #build() contracts cells one by one, adding shortcut edges that preserve shortest paths;
+    #queries then run a bidirectional Dijkstra that only climbs to higher-ranked cells
+    #and unpack shortcuts back into cells.
+    ARRAYS = ['node_cells', 'ranks', 'up_offsets', 'up_targets', 'up_weights', 'up_middles']
+
+    def __init__(self, grid, agent_radius: int = 0, witness_settle_limit: int = 60):
+        super().__init__(grid, agent_radius=agent_radius)
+        self.algorithm_name = "Contraction Hierarchy"
+        self.witness_settle_limit = witness_settle_limit
+        self.preprocessing_time = 0.0
+        self.preprocessing_memory = 0.0
+        self.num_shortcuts = 0
+        self._built_version = None
+        self._clear()
+
+    def _clear(self):
+        #node_cells maps node id -> flat cell index; cell_nodes maps the reverse (-1 for blocked)
+        self.node_cells = array('i')
+        self.cell_nodes = array('i', [-1]) * (self.grid.width * self.grid.height)
+        self.ranks = array('i')
+        #Upward graph in CSR form: edges from each node to higher-ranked nodes,
+        #middle is the contracted node a shortcut bypasses, -1 for original grid moves
+        self.up_offsets = array('i', [0])
+        self.up_targets = array('i')
+        self.up_weights = array('d')
+        self.up_middles = array('i')
+        self._middles: Dict[Tuple[int, int], int] = {}
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_version is not None
+
+    def _cell(self, node: int) -> Tuple[int, int]:
+        index = self.node_cells[node]
+        return (index % self.grid.width, index // self.grid.width)
+
+    def build(self):
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+
+        self._clear()
+        width = self.grid.width
+        for y in range(self.grid.height):
+            for x in range(width):
+                if self._is_traversable(x, y):
+                    self.cell_nodes[y * width + x] = len(self.node_cells)
+                    self.node_cells.append(y * width + x)
+
+        #Remaining (uncontracted) graph: adjacency[node][neighbor] = (weight, middle)
+        num_nodes = len(self.node_cells)
+        adjacency: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(num_nodes)]
+        for node in range(num_nodes):
+            for neighbor_pos, move_cost in self.get_neighbors(self._cell(node)):
+                neighbor = self.cell_nodes[neighbor_pos[1] * width + neighbor_pos[0]]
+                adjacency[node][neighbor] = (move_cost, -1)
+
+        contracted_neighbors = [0] * num_nodes
+        up_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(num_nodes)]
+        self.ranks = array('i', [0]) * num_nodes
+        self.num_shortcuts = 0
+
+        #Lazy-update ordering by edge difference plus already-contracted neighbours
+        order_heap = [(self._priority(node, adjacency, contracted_neighbors), node)
+                      for node in range(num_nodes)]
+        heapq.heapify(order_heap)
+        rank = 0
+        while order_heap:
+            _, node = heapq.heappop(order_heap)
+            priority = self._priority(node, adjacency, contracted_neighbors)
+            if order_heap and priority > order_heap[0][0]:
+                heapq.heappush(order_heap, (priority, node))
+                continue
+
+            self.ranks[node] = rank
+            rank += 1
+            neighbors = adjacency[node]
+            for neighbor, (weight, middle) in neighbors.items():
+                up_edges[node].append((neighbor, weight, middle))
+
+            for u, w, weight in self._required_shortcuts(node, adjacency):
+                existing = adjacency[u].get(w)
+                if existing is None or weight < existing[0]:
+                    if existing is None:
+                        self.num_shortcuts += 1
+                    adjacency[u][w] = (weight, node)
+                    adjacency[w][u] = (weight, node)
+
+            for neighbor in neighbors:
+                del adjacency[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            adjacency[node] = {}
+
+        for node in range(num_nodes):
+            for target, weight, middle in up_edges[node]:
+                self.up_targets.append(target)
+                self.up_weights.append(weight)
+                self.up_middles.append(middle)
+            self.up_offsets.append(len(self.up_targets))
+        self._index_middles()
+
+        self._built_version = self.grid.version
+        self.preprocessing_time = time.time() - start_time
+        self.preprocessing_memory = process.memory_info().rss / 1024 / 1024 - initial_memory
+
+    def _is_traversable(self, x: int, y: int) -> bool:
+        if self.agent_radius > 0:
+            clearance = self.grid.clearance_for(self.agent_radius)
+            return clearance[y * self.grid.width + x] > self.agent_radius
+        return self.grid.is_valid_position(x, y)
+
+    def _required_shortcuts(self, node: int, adjacency) -> List[Tuple[int, int, float]]:
+        #Shortcuts u-w needed when node is removed: pairs whose only shortest path runs through node
+        neighbors = list(adjacency[node].items())
+        shortcuts = []
+        for i, (u, (weight_u, _)) in enumerate(neighbors):
+            targets = {w: weight_u + weight_w for w, (weight_w, _) in neighbors[i + 1:]}
+            if not targets:
+                continue
+            witnessed = self._witness_search(u, node, targets, max(targets.values()), adjacency)
+            for w, via_cost in targets.items():
+                if witnessed.get(w, INF) > via_cost:
+                    shortcuts.append((u, w, via_cost))
+        return shortcuts
+
+    def _witness_search(self, source: int, excluded: int, targets: Dict[int, float],
+                        max_cost: float, adjacency) -> Dict[int, float]:
+        #Bounded Dijkstra from source that avoids the node being contracted
+        distances = {source: 0.0}
+        min_heap = [(0.0, source)]
+        settled = 0
+        remaining = set(targets)
+        while min_heap and remaining and settled < self.witness_settle_limit:
+            distance, current = heapq.heappop(min_heap)
+            if distance > distances[current]:
+                continue
+            if distance > max_cost:
+                break
+            settled += 1
+            remaining.discard(current)
+            for neighbor, (weight, _) in adjacency[current].items():
+                if neighbor == excluded:
+                    continue
+                tentative = distance + weight
+                if tentative < distances.get(neighbor, INF):
+                    distances[neighbor] = tentative
+                    heapq.heappush(min_heap, (tentative, neighbor))
+        return distances
+
+    def _priority(self, node: int, adjacency, contracted_neighbors) -> int:
+        shortcuts = len(self._required_shortcuts(node, adjacency))
+        return shortcuts - len(adjacency[node]) + contracted_neighbors[node]
+
+    def _index_middles(self):
+        self._middles = {}
+        for node in range(len(self.node_cells)):
+            for edge in range(self.up_offsets[node], self.up_offsets[node + 1]):
+                self._middles[(node, self.up_targets[edge])] = self.up_middles[edge]
+
+    def _upward_search(self, distances: Dict[int, float], parents: Dict[int, int],
+                       min_heap: List[Tuple[float, int]]):
+        #Settle one node of a one-directional upward search
+        distance, node = heapq.heappop(min_heap)
+        if distance > distances[node]:
+            return None
+        self.nodes_expanded += 1
+        for edge in range(self.up_offsets[node], self.up_offsets[node + 1]):
+            target = self.up_targets[edge]
+            tentative = distance + self.up_weights[edge]
+            if tentative < distances.get(target, INF):
+                distances[target] = tentative
+                parents[target] = node
+                heapq.heappush(min_heap, (tentative, target))
+        return node
+
+    def _unpack_edge(self, a: int, b: int, out: List[int]):
+        #Append the nodes after a on the original path a -> b
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            lower, higher = (a, b) if self.ranks[a] < self.ranks[b] else (b, a)
+            middle = self._middles[(lower, higher)]
+            if middle < 0:
+                out.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.require_unit_costs()
+        if self._built_version != self.grid.version:
+            self.build()
+
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        self.reset_metrics()
+
+        path = []
+        #Off-map coordinates would alias other cells' flat indices
+        source = target = -1
+        if self.grid.is_valid_position(*start) and self.grid.is_valid_position(*goal):
+            source = self.cell_nodes[start[1] * self.grid.width + start[0]]
+            target = self.cell_nodes[goal[1] * self.grid.width + goal[0]]
+        if source >= 0 and target >= 0:
+            forward = ({source: 0.0}, {source: -1}, [(0.0, source)])
+            backward = ({target: 0.0}, {target: -1}, [(0.0, target)])
+            best, meeting = INF, -1
+
+            while forward[2] or backward[2]:
+                #Both searches only climb, so stop once neither frontier can beat the best meeting
+                for distances, parents, min_heap in (forward, backward):
+                    if min_heap and min_heap[0][0] >= best:
+                        min_heap.clear()
+                    if not min_heap:
+                        continue
+                    node = self._upward_search(distances, parents, min_heap)
+                    if node is None:
+                        continue
+                    other = backward[0] if distances is forward[0] else forward[0]
+                    if node in other and distances[node] + other[node] < best:
+                        best = distances[node] + other[node]
+                        meeting = node
+
+            if meeting >= 0:
+                up_chain = [meeting]
+                while forward[1][up_chain[-1]] >= 0:
+                    up_chain.append(forward[1][up_chain[-1]])
+                up_chain.reverse()
+                down_chain = [meeting]
+                while backward[1][down_chain[-1]] >= 0:
+                    down_chain.append(backward[1][down_chain[-1]])
+
+                chain = up_chain + down_chain[1:]
+                nodes = [chain[0]]
+                for a, b in zip(chain, chain[1:]):
+                    self._unpack_edge(a, b, nodes)
+                path = [self._cell(node) for node in nodes]
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=bool(path)
+        )
+
+    def save(self, filename: str):
+        if not self.is_built:
+            raise ValueError("Contraction hierarchy has not been built")
+        header = {
+            'map_checksum': map_checksum(self.grid),
+            'agent_radius': self.agent_radius,
+            'num_shortcuts': self.num_shortcuts,
+            'preprocessing_time': self.preprocessing_time,
+            'preprocessing_memory': self.preprocessing_memory,
+        }
+        save_arrays(filename, FILE_MAGIC, header, {name: getattr(self, name) for name in self.ARRAYS})
+
+    @classmethod
+    def load(cls, filename: str, grid) -> 'ContractionHierarchy':
+        header, arrays = load_arrays(filename, FILE_MAGIC, grid)
+        hierarchy = cls(grid, agent_radius=header['agent_radius'])
+        for name, data in arrays.items():
+            setattr(hierarchy, name, data)
+
+        for node, cell in enumerate(hierarchy.node_cells):
+            hierarchy.cell_nodes[cell] = node
+        hierarchy._index_middles()
+        hierarchy.num_shortcuts = header['num_shortcuts']
+        hierarchy.preprocessing_time = header['preprocessing_time']
+        hierarchy.preprocessing_memory = header['preprocessing_memory']
+        hierarchy._built_version = grid.version
+        return hierarchy
@@ -0,0 +1,148 @@
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+from .serialization import load_arrays, map_arrays, save_arrays
+
+
+FILE_MAGIC = b"CSRGRAPH1\n"
+#Vectorized forms of AStarPathfinder.distance over per-edge |dx|, |dy| arrays
+EDGE_DISTANCES = {
+    'manhattan': lambda dx, dy: dx + dy,
+    'euclidean': lambda dx, dy: (dx ** 2 + dy ** 2) ** 0.5,
+    'diagonal': lambda dx, dy: 1.414 * (dx + dy - abs(dx - dy)) / 2 + abs(dx - dy),
+}
+
+
+class CSRGraph:
+    #Weighted directed graph in compressed sparse row form: the edges leaving node u are
+    #targets[offsets[u]:offsets[u + 1]] with matching float32 weights. Nodes are ints, and optional
+    #float32 coordinates (x0, y0, x1, y1, ...) give A* a geometric heuristic.
+    #Pass it in place of a Grid to DijkstraPathfinder or AStarPathfinder.
+    ARRAYS = ('offsets', 'targets', 'weights', 'coordinates')
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int], weights: Sequence[float],
+                 coordinates: Optional[Sequence[float]] = None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.coordinates = coordinates
+        self.num_nodes = len(offsets) - 1
+        self.num_edges = len(targets)
+        self._cost_scales: Dict[str, float] = {}
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights=None, num_nodes: Optional[int] = None,
+                   coordinates=None, directed: bool = True) -> "CSRGraph":
+        #Bulk construction from parallel edge arrays with a counting sort on the source node
+        import numpy as np
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = (np.ones(len(sources), dtype=np.float32) if weights is None
+                   else np.asarray(weights, dtype=np.float32))
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            weights = np.concatenate([weights, weights])
+        if num_nodes is None:
+            num_nodes = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+            if coordinates is not None:
+                num_nodes = max(num_nodes, len(coordinates))
+
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+
+        def to_array(typecode, data, dtype):
+            return array(typecode, np.ascontiguousarray(data, dtype=dtype).tobytes())
+
+        coordinate_array = None
+        if coordinates is not None:
+            coordinate_array = to_array('f', np.asarray(coordinates).reshape(-1), np.float32)
+        return cls(to_array('i', offsets, np.int32), to_array('i', targets[order], np.int32),
+                   to_array('f', weights[order], np.float32), coordinate_array)
+
+    @classmethod
+    def from_edge_list(cls, filename: str, directed: bool = True,
+                       coordinates_file: Optional[str] = None) -> "CSRGraph":
+        #Whitespace-separated "source target [weight]" lines, '#' comments allowed.
+        #Coordinates files hold one "x y" line per node in node order
+        import numpy as np
+
+        def read_table(path):
+            with open(path) as f:
+                lines = [line for line in f if line.strip() and not line.lstrip().startswith('#')]
+            if not lines:
+                return np.zeros((0, 2))
+            columns = len(lines[0].split())
+            return np.array("".join(lines).split(), dtype=np.float64).reshape(-1, columns)
+
+        edges = read_table(filename)
+        coordinates = read_table(coordinates_file) if coordinates_file else None
+        return cls.from_edges(edges[:, 0], edges[:, 1], edges[:, 2] if edges.shape[1] > 2 else None,
+                              coordinates=coordinates, directed=directed)
+
+    @classmethod
+    def from_grid(cls, grid) -> "CSRGraph":
+        #4-connected unit-cost graph over the free cells; node id = y * width + x
+        width, height = grid.width, grid.height
+        offsets, targets, coordinates = array('i', [0]), array('i'), array('f')
+        for index in range(width * height):
+            x, y = index % width, index // width
+            coordinates.extend((x, y))
+            if grid.is_valid_position(x, y):
+                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                    if grid.is_valid_position(x + dx, y + dy):
+                        targets.append((y + dy) * width + x + dx)
+            offsets.append(len(targets))
+        return cls(offsets, targets, array('f', [1.0]) * len(targets), coordinates)
+
+    def neighbors(self, node: int) -> List[Tuple[int, float]]:
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return list(zip(self.targets[start:end], self.weights[start:end]))
+
+    def position(self, node: int) -> Tuple[float, float]:
+        return (self.coordinates[2 * node], self.coordinates[2 * node + 1])
+
+    def edge_weight(self, source: int, target: int) -> float:
+        #Cheapest of any parallel edges, inf when there is none
+        start, end = self.offsets[source], self.offsets[source + 1]
+        return min((weight for node, weight in zip(self.targets[start:end], self.weights[start:end])
+                    if node == target), default=float('inf'))
+
+    def path_cost(self, path: Sequence[int]) -> float:
+        return float(sum(self.edge_weight(u, v) for u, v in zip(path, path[1:])))
+
+    def cost_scale(self, name: str) -> float:
+        #Largest factor k with k * distance(u, v) <= weight for every edge; for a metric distance
+        #this keeps k * distance(node, goal) admissible. Computed once per distance over whole
+        #edge arrays and cached; name is an AStarPathfinder heuristic type (unknown = euclidean)
+        scale = self._cost_scales.get(name)
+        if scale is None:
+            import numpy as np
+            offsets = np.frombuffer(self.offsets, dtype=np.int32)
+            targets = np.frombuffer(self.targets, dtype=np.int32)
+            weights = np.frombuffer(self.weights, dtype=np.float32).astype(np.float64)
+            points = np.frombuffer(self.coordinates, dtype=np.float32).astype(np.float64).reshape(-1, 2)
+            sources = np.repeat(np.arange(self.num_nodes), np.diff(offsets))
+            dx = np.abs(points[sources, 0] - points[targets, 0])
+            dy = np.abs(points[sources, 1] - points[targets, 1])
+            length = EDGE_DISTANCES.get(name, EDGE_DISTANCES['euclidean'])(dx, dy)
+            positive = length > 0
+            scale = float((weights[positive] / length[positive]).min()) if positive.any() else 0.0
+            self._cost_scales[name] = scale
+        return scale
+
+    def save(self, filename: str):
+        arrays = {}
+        for name in self.ARRAYS:
+            data = getattr(self, name)
+            if data is not None:
+                arrays[name] = array(data.format, data) if isinstance(data, memoryview) else data
+        save_arrays(filename, FILE_MAGIC, {'num_nodes': self.num_nodes}, arrays)
+
+    @classmethod
+    def load(cls, filename: str, memory_map: bool = True) -> "CSRGraph":
+        #Memory-mapped graphs stay on disk and are paged in by the OS as searches touch them
+        if memory_map:
+            _, arrays = map_arrays(filename, FILE_MAGIC)
+        else:
+            _, arrays = load_arrays(filename, FILE_MAGIC)
+        return cls(arrays['offsets'], arrays['targets'], arrays['weights'], arrays.get('coordinates'))
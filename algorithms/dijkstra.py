@@ -1,28 +1,41 @@
 import heapq
 import time
-import psutil
-import os
-from typing import Tuple, Dict, Set
+from typing import Tuple, Dict, Iterable, Set
 from .base import BasePathfinder, PathResult
+from .instrumentation import current_process
 
 
 class DijkstraPathfinder(BasePathfinder):
     
-    def __init__(self, grid):
-        super().__init__(grid)
+    def __init__(self, grid, record_expansions: bool = False, agent_radius: int = 0,
+                 neighbor_provider=None):
+        super().__init__(grid, record_expansions, agent_radius, neighbor_provider)
         self.algorithm_name = "Dijkstra"
     
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
         #We use Dijkstra's algorithm to find the shortest path between two points in a grid
         #This is done using a heap -> priority queue to keep track of shortest path
+        self.reset_metrics()
+        self.begin_search(start, goal)
+        return self._search(start, {goal})
+    
+    def find_path_to_any(self, start: Tuple[int, int], goals: Iterable[Tuple[int, int]]) -> PathResult:
+        #Nearest of many goals: the first goal settled is the closest one
+        goal_set = self._check_multi_goal(goals)
+        self.reset_metrics()
+        return self._search(start, goal_set)
+    
+    def _search(self, start: Tuple[int, int], goals: Set[Tuple[int, int]]) -> PathResult:
         start_time = time.time()
-        process = psutil.Process(os.getpid())
+        process = current_process()
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
         
-        self.reset_metrics()
+        expansion_log = self.expansion_log
         
         #Initialize data structures with min_heap holding (cost, pos)
-        min_heap = [(0.0, start)]  
+        min_heap = [(0.0, start)]
+        if expansion_log is not None:
+            expansion_log.record_insertion(start)
         visited: Set[Tuple[int, int]] = set()
         distances: Dict[Tuple[int, int], float] = {start: 0.0}
         parent_map: Dict[Tuple[int, int], Tuple[int, int]] = {start: None}
@@ -36,10 +49,12 @@ class DijkstraPathfinder(BasePathfinder):
             
             visited.add(current_pos)
             self.nodes_expanded += 1
+            if expansion_log is not None:
+                expansion_log.record_expansion(current_pos)
             
 
-            if current_pos == goal:
-                path = self.reconstruct_path(goal, parent_map)
+            if current_pos in goals:
+                path = self.reconstruct_path(current_pos, parent_map)
                 path_length = self.calculate_path_length(path)
                 computation_time = time.time() - start_time
                 
@@ -53,7 +68,10 @@ class DijkstraPathfinder(BasePathfinder):
                     computation_time=computation_time,
                     memory_usage=memory_usage,
                     algorithm_name=self.algorithm_name,
-                    found=True
+                    found=True,
+                    expansion_log=expansion_log,
+                    goal=current_pos,
+                    path_cost=current_dist
                 )
             
             #Neighbour processing -> we follow a similar approach to bfs but with a priority queue
@@ -67,6 +85,8 @@ class DijkstraPathfinder(BasePathfinder):
                         distances[neighbor_pos] = tentative_distance
                         parent_map[neighbor_pos] = current_pos
                         heapq.heappush(min_heap, (tentative_distance, neighbor_pos))
+                        if expansion_log is not None:
+                            expansion_log.record_insertion(neighbor_pos)
         
         computation_time = time.time() - start_time
         current_memory = process.memory_info().rss / 1024 / 1024
@@ -80,5 +100,6 @@ class DijkstraPathfinder(BasePathfinder):
             computation_time=computation_time,
             memory_usage=memory_usage,
             algorithm_name=self.algorithm_name,
-            found=False
+            found=False,
+            expansion_log=expansion_log
         ) 
\ No newline at end of file
@@ -0,0 +1,59 @@
+from array import array
+from typing import List, Optional, Tuple, Union
+
+
+class ExpansionLog:
+    #Compact record of where a search spent its effort
+    #Cells are stored as flat indices (y * width + x) in preallocated int32 arrays.
+    #Logs made with for_graph() record CSR graph node ids as-is and have no width or height
+    def __init__(self, width: Optional[int], height: Optional[int], num_nodes: Optional[int] = None):
+        self.graph = num_nodes is not None
+        self.width = width
+        self.height = height
+        self.num_nodes = num_nodes if self.graph else width * height
+        self.order = array('i', bytes(4 * self.num_nodes))
+        self.num_expanded = 0
+        self.insertions = array('i', bytes(4 * self.num_nodes))
+        self.num_insertions = 0
+
+    @classmethod
+    def for_graph(cls, num_nodes: int) -> "ExpansionLog":
+        return cls(None, None, num_nodes)
+
+    def _index(self, position) -> int:
+        if self.graph:
+            return position
+        x, y = position
+        return y * self.width + x
+
+    def record_expansion(self, position: Union[Tuple[int, int], int]):
+        self.order[self.num_expanded] = self._index(position)
+        self.num_expanded += 1
+
+    def record_insertion(self, position: Union[Tuple[int, int], int]):
+        self.insertions[self._index(position)] += 1
+        self.num_insertions += 1
+
+    def expanded_positions(self) -> Union[List[Tuple[int, int]], List[int]]:
+        order = self.order[:self.num_expanded]
+        if self.graph:
+            return order.tolist()
+        width = self.width
+        return [(index % width, index // width) for index in order]
+
+    def _shape(self) -> Tuple[int, ...]:
+        return (self.num_nodes,) if self.graph else (self.height, self.width)
+
+    def expansion_heatmap(self):
+        #(height, width) int32 array holding each cell's expansion rank, -1 if never expanded;
+        #one entry per node for graph logs
+        import numpy as np
+        heatmap = np.full(self.num_nodes, -1, dtype=np.int32)
+        order = np.frombuffer(self.order, dtype=np.int32)[:self.num_expanded]
+        heatmap[order] = np.arange(self.num_expanded, dtype=np.int32)
+        return heatmap.reshape(self._shape())
+
+    def insertion_heatmap(self):
+        #(height, width) int32 array counting open-list insertions per cell (per node for graphs)
+        import numpy as np
+        return np.frombuffer(self.insertions, dtype=np.int32).reshape(self._shape()).copy()
@@ -0,0 +1,188 @@
+import heapq
+import time
+from array import array
+from typing import List, Optional, Tuple
+from .base import BasePathfinder, GridListener, PathResult
+from .instrumentation import current_process
+
+
+INF = float('inf')
+
+#Direction codes stored per cell; -1 means no move (goal or unreachable)
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+class FlowField(GridListener, BasePathfinder):
+    #Goal-rooted flow field: one reverse Dijkstra gives every cell its cost-to-goal and next move,
+    #so any number of agents heading to the same goal step with O(1) lookups
+    def __init__(self, grid, goal: Optional[Tuple[int, int]] = None, agent_radius: int = 0):
+        super().__init__(grid, agent_radius=agent_radius)
+        self.algorithm_name = "Flow Field"
+        self.goal = None
+        num_cells = grid.width * grid.height
+        self.costs = array('d', [INF]) * num_cells
+        self.directions = array('b', [-1]) * num_cells
+        if goal is not None:
+            self.build(goal)
+
+    def _index(self, position: Tuple[int, int]) -> int:
+        return position[1] * self.grid.width + position[0]
+
+    def build(self, goal: Tuple[int, int]):
+        self.reset_metrics()
+        if self.goal is None:
+            self.grid.add_edit_listener(self)
+        self.goal = goal
+        num_cells = self.grid.width * self.grid.height
+        self.costs = array('d', [INF]) * num_cells
+        self.directions = array('b', [-1]) * num_cells
+        if not self.grid.is_valid_position(*goal):
+            return
+
+        self.costs[self._index(goal)] = 0.0
+        self._propagate([(0.0, goal)])
+
+    def _propagate(self, min_heap: List[Tuple[float, Tuple[int, int]]]):
+        #Reverse Dijkstra: a neighbour v of u reaches the goal through u by paying u's entry cost
+        costs, directions, width = self.costs, self.directions, self.grid.width
+        cell_costs = self.grid.costs
+        heapq.heapify(min_heap)
+        while min_heap:
+            current_cost, current_pos = heapq.heappop(min_heap)
+            current_index = current_pos[1] * width + current_pos[0]
+            if current_cost > costs[current_index]:
+                continue
+            self.nodes_expanded += 1
+            entry_cost = 1.0 if cell_costs is None else cell_costs[current_index]
+
+            for neighbor_pos, _ in self.get_neighbors(current_pos):
+                neighbor_index = neighbor_pos[1] * width + neighbor_pos[0]
+                tentative_cost = current_cost + entry_cost
+                if tentative_cost < costs[neighbor_index]:
+                    costs[neighbor_index] = tentative_cost
+                    directions[neighbor_index] = DIRECTION_CODES[
+                        (current_pos[0] - neighbor_pos[0], current_pos[1] - neighbor_pos[1])]
+                    heapq.heappush(min_heap, (tentative_cost, neighbor_pos))
+
+    def _on_map(self, position: Tuple[int, int]) -> bool:
+        #Off-map positions would index the flat arrays from the wrong end
+        return 0 <= position[0] < self.grid.width and 0 <= position[1] < self.grid.height
+
+    def cost_to_goal(self, position: Tuple[int, int]) -> float:
+        if not self._on_map(position):
+            return INF
+        return self.costs[self._index(position)]
+
+    def next_step(self, position: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        if not self._on_map(position):
+            return None
+        direction = self.directions[self._index(position)]
+        if direction < 0:
+            return None
+        dx, dy = DIRECTIONS[direction]
+        return (position[0] + dx, position[1] + dy)
+
+    def step_agents(self, positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        #Advance every agent one cell; agents at the goal or cut off stay put
+        steps = []
+        for position in positions:
+            step = self.next_step(position)
+            steps.append(position if step is None else step)
+        return steps
+
+    def on_cell_changed(self, x: int, y: int, blocked: bool):
+        self.reset_metrics()
+        if self.agent_radius > 0 or (x, y) == self.goal:
+            #An edit moves clearance across a whole window (or the goal itself); start over
+            self.build(self.goal)
+        elif blocked:
+            self._repair_blocked((x, y))
+        else:
+            self._repair_freed((x, y))
+
+    def on_grid_reset(self):
+        self.build(self.goal)
+
+    def on_costs_changed(self, x0: int, y0: int, x1: int, y1: int):
+        #Any cost change can reroute the whole field
+        self.build(self.goal)
+
+    def _repair_blocked(self, position: Tuple[int, int]):
+        #Only cells whose flow ran through the new obstacle lose their cost; find that subtree
+        costs, directions, width = self.costs, self.directions, self.grid.width
+        root = self._index(position)
+        if costs[root] == INF:
+            return
+
+        affected = [position]
+        costs[root] = INF
+        directions[root] = -1
+        i = 0
+        while i < len(affected):
+            ux, uy = affected[i]
+            i += 1
+            for dx, dy in DIRECTIONS:
+                vx, vy = ux + dx, uy + dy
+                if 0 <= vx < width and 0 <= vy < self.grid.height:
+                    v_index = vy * width + vx
+                    if directions[v_index] >= 0 and DIRECTIONS[directions[v_index]] == (-dx, -dy):
+                        costs[v_index] = INF
+                        directions[v_index] = -1
+                        affected.append((vx, vy))
+
+        #Reseed the subtree from its intact border and let Dijkstra fill it back in
+        min_heap = []
+        for cell in affected[1:]:
+            for neighbor_pos, _ in self.get_neighbors(cell):
+                neighbor_cost = costs[neighbor_pos[1] * width + neighbor_pos[0]]
+                if neighbor_cost < INF:
+                    min_heap.append((neighbor_cost, neighbor_pos))
+        self._propagate(min_heap)
+
+    def _repair_freed(self, position: Tuple[int, int]):
+        #A freed cell can only shorten routes; pull its cost from neighbours and push decreases outwards
+        costs, directions, width = self.costs, self.directions, self.grid.width
+        index = self._index(position)
+        for neighbor_pos, move_cost in self.get_neighbors(position):
+            tentative_cost = costs[neighbor_pos[1] * width + neighbor_pos[0]] + move_cost
+            if tentative_cost < costs[index]:
+                costs[index] = tentative_cost
+                directions[index] = DIRECTION_CODES[
+                    (neighbor_pos[0] - position[0], neighbor_pos[1] - position[1])]
+        if costs[index] < INF:
+            self._propagate([(costs[index], position)])
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+
+        if goal != self.goal:
+            self.build(goal)
+        else:
+            self.reset_metrics()
+
+        found = self.cost_to_goal(start) < INF
+        path = []
+        if found:
+            path = [start]
+            current = start
+            while current != goal:
+                current = self.next_step(current)
+                path.append(current)
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=found,
+            path_cost=self.cost_to_goal(start) if found else None
+        )
@@ -0,0 +1,166 @@
+import time
+from array import array
+from typing import Callable, Set, Tuple
+from .astar import AStarPathfinder
+from .base import PathResult
+from .instrumentation import current_process
+
+
+INF = float('inf')
+NONE = -1
+
+
+class FringeSearchPathfinder(AStarPathfinder):
+    #Fringe Search: A*-ordered by f-cost thresholds like IDA*, but keeps its frontier in a doubly
+    #linked list so nothing is re-expanded from scratch and no priority queue is maintained.
+    #Nodes at or under the threshold are expanded in list order ("now"), children are spliced in
+    #right after the current node, and the rest wait for the next, higher threshold ("later").
+    #All per-node state (g, cached h, links, parent) lives in flat arrays indexed by cell.
+    #Each threshold rescans the waiting nodes, so Manhattan (few distinct f values) is the default.
+    #find_path and find_path_to_any come from AStarPathfinder and run this _search loop instead.
+    def __init__(self, grid, heuristic_type: str = "manhattan", record_expansions: bool = False,
+                 agent_radius: int = 0, neighbor_provider=None):
+        super().__init__(grid, heuristic_type, record_expansions, agent_radius, neighbor_provider)
+        self.algorithm_name = "Fringe Search"
+        self.iterations = 0
+
+    def _search(self, start: Tuple[int, int], goals: Set[Tuple[int, int]],
+                heuristic: Callable[[Tuple[int, int]], float]) -> PathResult:
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+
+        self.iterations = 0
+        expansion_log = self.expansion_log
+
+        #Node ids: flat cell index on grids, the node itself on CSR graphs
+        graph = self.graph is not None
+        width = None if graph else self.grid.width
+        height = None if graph else self.grid.height
+        num_nodes = self.num_nodes
+
+        g_costs = array('d', [INF]) * num_nodes
+        h_costs = array('d', [-1.0]) * num_nodes
+        next_node = array('i', [NONE]) * num_nodes
+        prev_node = array('i', [NONE]) * num_nodes
+        in_fringe = bytearray(num_nodes)
+        parents = array('i', [NONE]) * num_nodes
+
+        def on_map(position) -> bool:
+            return graph or (0 <= position[0] < width and 0 <= position[1] < height)
+
+        #Off-map endpoints would alias other cells' flat indices: such goals are never matched,
+        #and an off-map start leaves the fringe empty
+        goal_ids = {goal if graph else goal[1] * width + goal[0] for goal in goals if on_map(goal)}
+        goal_id = NONE
+        head = NONE
+        f_limit = INF
+        if on_map(start):
+            start_id = start if graph else start[1] * width + start[0]
+            g_costs[start_id] = 0.0
+            h_costs[start_id] = f_limit = heuristic(start)
+            in_fringe[start_id] = 1
+            head = start_id
+            if expansion_log is not None:
+                expansion_log.record_insertion(start)
+
+        found = False
+        while head != NONE and not found:
+            self.iterations += 1
+            f_min = INF
+            node = head
+            while node != NONE:
+                g_cost = g_costs[node]
+                f_cost = g_cost + h_costs[node]
+                if f_cost > f_limit + 1e-9:
+                    #Later: stays in the list for the next threshold
+                    if f_cost < f_min:
+                        f_min = f_cost
+                    node = next_node[node]
+                    continue
+
+                if node in goal_ids:
+                    goal_id = node
+                    found = True
+                    break
+
+                position = node if graph else (node % width, node // width)
+                self.nodes_expanded += 1
+                if expansion_log is not None:
+                    expansion_log.record_expansion(position)
+
+                for neighbor_pos, move_cost in self.get_neighbors(position):
+                    neighbor = neighbor_pos if graph else neighbor_pos[1] * width + neighbor_pos[0]
+                    tentative_g = g_cost + move_cost
+                    if tentative_g >= g_costs[neighbor]:
+                        continue
+                    if h_costs[neighbor] < 0:
+                        h_costs[neighbor] = heuristic(neighbor_pos)
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = node
+
+                    #Unlink the neighbour if it is already waiting, then splice it in after node
+                    if in_fringe[neighbor]:
+                        before, after = prev_node[neighbor], next_node[neighbor]
+                        if before != NONE:
+                            next_node[before] = after
+                        else:
+                            head = after
+                        if after != NONE:
+                            prev_node[after] = before
+                    after = next_node[node]
+                    prev_node[neighbor], next_node[neighbor] = node, after
+                    if after != NONE:
+                        prev_node[after] = neighbor
+                    next_node[node] = neighbor
+                    in_fringe[neighbor] = 1
+                    if expansion_log is not None:
+                        expansion_log.record_insertion(neighbor_pos)
+
+                #Expanded: drop node from the list and continue with whatever follows it
+                before, after = prev_node[node], next_node[node]
+                if before != NONE:
+                    next_node[before] = after
+                else:
+                    head = after
+                if after != NONE:
+                    prev_node[after] = before
+                prev_node[node] = next_node[node] = NONE
+                in_fringe[node] = 0
+                node = after
+
+            f_limit = f_min
+
+        path = []
+        path_cost = None
+        goal = None
+        if found:
+            goal = goal_id if graph else (goal_id % width, goal_id // width)
+            #Hand the parent chain to reconstruct_path so providers and graphs expand it as usual
+            parent_map = {}
+            node = goal_id
+            while node != NONE:
+                parent = parents[node]
+                position = node if graph else (node % width, node // width)
+                parent_map[position] = None if parent == NONE else (
+                    parent if graph else (parent % width, parent // width))
+                node = parent
+            path = self.reconstruct_path(goal, parent_map)
+            path_cost = g_costs[goal_id]
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=found,
+            expansion_log=expansion_log,
+            goal=goal,
+            path_cost=path_cost
+        )
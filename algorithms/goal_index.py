@@ -0,0 +1,71 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class GoalIndex:
+    #Grid-bucket spatial index over many goals for nearest-goal heuristic lookups.
+    #Buckets are scanned in rings of growing Chebyshev radius; every supported heuristic is at
+    #least the Chebyshev distance, so the scan stops once a ring cannot beat the best goal found.
+    #Goals that are not points themselves (CSR graph node ids) are bucketed by position(goal);
+    #bucket_size=None picks one from the goals' extent so each bucket holds about one goal.
+    def __init__(self, goals: Iterable, distance: Callable[[Tuple[float, float], Tuple[float, float]], float],
+                 bucket_size: Optional[float] = 8,
+                 position: Optional[Callable[[Any], Tuple[float, float]]] = None):
+        self.distance = distance
+        goals = list(goals)
+        points = [position(goal) for goal in goals] if position is not None else goals
+        if bucket_size is None:
+            extent = max((max(p[0] for p in points) - min(p[0] for p in points),
+                          max(p[1] for p in points) - min(p[1] for p in points)), default=0.0) if points else 0.0
+            bucket_size = max(extent / max(len(points), 1) ** 0.5, 1e-9)
+        self.bucket_size = bucket_size
+        self.buckets: Dict[Tuple[int, int], List[Tuple[Any, Tuple[float, float]]]] = {}
+        for goal, point in zip(goals, points):
+            self.buckets.setdefault(self._key(point), []).append((goal, point))
+        keys = list(self.buckets)
+        self._min_bx = min((k[0] for k in keys), default=0)
+        self._max_bx = max((k[0] for k in keys), default=0)
+        self._min_by = min((k[1] for k in keys), default=0)
+        self._max_by = max((k[1] for k in keys), default=0)
+
+    def _key(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        return (int(point[0] // self.bucket_size), int(point[1] // self.bucket_size))
+
+    def _ring(self, bx: int, by: int, k: int):
+        #Ring cells clipped to the box of occupied buckets, so far-away queries stay cheap
+        if k == 0:
+            yield (bx, by)
+            return
+        x0, x1 = max(bx - k, self._min_bx), min(bx + k, self._max_bx)
+        y0, y1 = max(by - k + 1, self._min_by), min(by + k - 1, self._max_by)
+        for y in (by - k, by + k):
+            if self._min_by <= y <= self._max_by:
+                for x in range(x0, x1 + 1):
+                    yield (x, y)
+        for x in (bx - k, bx + k):
+            if self._min_bx <= x <= self._max_bx:
+                for y in range(y0, y1 + 1):
+                    yield (x, y)
+
+    def nearest(self, position: Tuple[float, float]) -> Tuple[Any, float]:
+        #position is always a point, also for graph goals (pass the query node's coordinates)
+        if not self.buckets:
+            return None, float('inf')
+        bx, by = self._key(position)
+        last_ring = max(abs(bx - self._min_bx), abs(bx - self._max_bx),
+                        abs(by - self._min_by), abs(by - self._max_by))
+
+        #Rings closer than the occupied box hold no goals
+        first_ring = max(0, self._min_bx - bx, bx - self._max_bx, self._min_by - by, by - self._max_by)
+
+        best_goal, best_distance = None, float('inf')
+        for k in range(first_ring, last_ring + 1):
+            #Goals k rings out lie more than (k - 1) buckets away along some axis
+            lower_bound = (k - 1) * self.bucket_size if k > 0 else 0
+            if lower_bound >= best_distance:
+                break
+            for key in self._ring(bx, by, k):
+                for goal, point in self.buckets.get(key, ()):
+                    goal_distance = self.distance(position, point)
+                    if goal_distance < best_distance:
+                        best_goal, best_distance = goal, goal_distance
+        return best_goal, best_distance
@@ -0,0 +1,121 @@
+import time
+from collections import deque
+from typing import Dict, Tuple
+from .astar import AStarPathfinder
+from .base import PathResult
+from .instrumentation import current_process
+
+
+class IDAStarPathfinder(AStarPathfinder):
+    #Iterative deepening A*: repeated depth-first searches bounded by an f-cost threshold.
+    #Memory is the current DFS path plus a transposition table capped at max_table_size entries,
+    #trading re-expansions for a fixed ceiling. Manhattan keeps thresholds on few distinct values.
+    #reachability_check runs a BFS first so unreachable goals fail fast instead of deepening until
+    #the bound covers the whole component; it stores every node it reaches, so turn it off when
+    #max_table_size must be a hard memory ceiling.
+    def __init__(self, grid, heuristic_type: str = "manhattan", max_table_size: int = 100000,
+                 agent_radius: int = 0, reachability_check: bool = True):
+        super().__init__(grid, heuristic_type, agent_radius=agent_radius)
+        self.algorithm_name = "IDA*"
+        self.max_table_size = max_table_size
+        self.reachability_check = reachability_check
+        self.iterations = 0
+        self.peak_stored_nodes = 0
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        peak_memory = initial_memory
+
+        self.reset_metrics()
+        self.iterations = 0
+        self.peak_stored_nodes = 0
+
+        path = []
+        threshold = self.heuristic(start, goal)
+        if start == goal:
+            path = [start]
+        elif self.reachability_check and not self._reachable(start, goal):
+            threshold = float('inf')
+
+        while not path and threshold != float('inf'):
+            self.iterations += 1
+            path, threshold = self._bounded_search(start, goal, threshold)
+            peak_memory = max(peak_memory, process.memory_info().rss / 1024 / 1024)
+
+        computation_time = time.time() - start_time
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=peak_memory - initial_memory,
+            algorithm_name=self.algorithm_name,
+            found=bool(path),
+            path_cost=self.calculate_path_cost(path) if path else None
+        )
+
+    def _reachable(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        #Plain BFS over the same moves; its visits and stored nodes count towards the search stats
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            self.nodes_expanded += 1
+            for neighbor_pos, _ in self.get_neighbors(queue.popleft()):
+                if neighbor_pos == goal:
+                    return True
+                if neighbor_pos not in seen:
+                    seen.add(neighbor_pos)
+                    queue.append(neighbor_pos)
+            self.peak_stored_nodes = max(self.peak_stored_nodes, len(seen) + len(queue))
+        return False
+
+    def _ordered_neighbors(self, position: Tuple[int, int], goal: Tuple[int, int]):
+        #Try moves towards the goal first so the final iteration hits it early
+        return sorted(self.get_neighbors(position), key=lambda item: self.heuristic(item[0], goal))
+
+    def _bounded_search(self, start: Tuple[int, int], goal: Tuple[int, int], threshold: float):
+        #One depth-first pass; returns (path, threshold) with the next threshold if no path fits
+        next_threshold = float('inf')
+        #Cheapest g seen per cell this pass; re-reaching a cell no cheaper cannot find anything new
+        table: Dict[Tuple[int, int], float] = {start: 0.0}
+        on_path = {start}
+        #Frames are [position, g_cost, neighbors, next_neighbor_index]
+        stack = [[start, 0.0, self._ordered_neighbors(start, goal), 0]]
+        self.nodes_expanded += 1
+
+        while stack:
+            frame = stack[-1]
+            position, g_cost, neighbors, index = frame
+            if index == len(neighbors):
+                stack.pop()
+                on_path.discard(position)
+                continue
+            frame[3] += 1
+
+            neighbor_pos, move_cost = neighbors[index]
+            if neighbor_pos in on_path:
+                continue
+
+            tentative_g = g_cost + move_cost
+            f_cost = tentative_g + self.heuristic(neighbor_pos, goal)
+            if f_cost > threshold + 1e-9:
+                next_threshold = min(next_threshold, f_cost)
+                continue
+
+            if table.get(neighbor_pos, float('inf')) <= tentative_g:
+                continue
+            if neighbor_pos in table or len(table) < self.max_table_size:
+                table[neighbor_pos] = tentative_g
+
+            if neighbor_pos == goal:
+                return [f[0] for f in stack] + [goal], threshold
+
+            self.nodes_expanded += 1
+            stack.append([neighbor_pos, tentative_g, self._ordered_neighbors(neighbor_pos, goal), 0])
+            on_path.add(neighbor_pos)
+            self.peak_stored_nodes = max(self.peak_stored_nodes, len(table) + len(stack))
+
+        return [], next_threshold
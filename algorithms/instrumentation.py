@@ -0,0 +1,13 @@
+import os
+
+_process = None
+
+
+def current_process():
+    #psutil is only needed to report memory, so it is imported on the first measured search
+    #rather than when the package loads; the handle is reused until the pid changes (fork)
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        import psutil
+        _process = psutil.Process(os.getpid())
+    return _process
@@ -0,0 +1,209 @@
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from math import hypot
+from operator import sub
+from typing import Iterable, List, Optional, Tuple
+
+
+#Move codes used by run-length compression; index = code
+MOVES = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+_MOVE_CODE = {move: code for code, move in enumerate(MOVES)}
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+class GridPath(Sequence):
+    #Path stored as one flat int32 buffer (x0, y0, x1, y1, ...) instead of a list of tuples.
+    #coords() is a zero-copy N x 2 NumPy view of the buffer; indexing and iteration yield
+    #(x, y) tuples built on the fly, and nothing but the buffer is ever kept.
+    __slots__ = ('_flat',)
+
+    def __init__(self, flat: Optional[array] = None):
+        self._flat = flat if flat is not None else array('i')
+
+    @classmethod
+    def from_points(cls, points: Iterable[Tuple[int, int]]) -> "GridPath":
+        flat = array('i')
+        for x, y in points:
+            flat.append(x)
+            flat.append(y)
+        return cls(flat)
+
+    @property
+    def flat(self) -> array:
+        return self._flat
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._flat) * self._flat.itemsize
+
+    def coords(self):
+        import numpy as np
+        return np.frombuffer(self._flat, dtype=np.int32).reshape(-1, 2)
+
+    def __array__(self, dtype=None, copy=None):
+        coords = self.coords()
+        return coords if dtype is None or coords.dtype == dtype else coords.astype(dtype)
+
+    def to_list(self) -> List[Tuple[int, int]]:
+        #A fresh list each call; the path itself never holds on to one
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self._flat) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            flat = array('i')
+            for position in range(*index.indices(len(self))):
+                flat.extend(self._flat[2 * position:2 * position + 2])
+            return GridPath(flat)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("path index out of range")
+        return (self._flat[2 * index], self._flat[2 * index + 1])
+
+    def __iter__(self):
+        flat = self._flat
+        return zip(islice(flat, 0, None, 2), islice(flat, 1, None, 2))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GridPath):
+            return self._flat == other._flat
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                point == tuple(item) for point, item in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"GridPath({self.to_list()!r})"
+
+    def length(self) -> float:
+        #Sum of Euclidean step lengths in one pass over the buffer; map() keeps the loop in C
+        #and avoids pulling NumPy into a plain search
+        if len(self) < 2:
+            return 0.0
+        xs, ys = self._flat[0::2], self._flat[1::2]
+        return float(sum(map(hypot, map(sub, xs[1:], xs[:-1]), map(sub, ys[1:], ys[:-1]))))
+
+    def is_valid(self, grid, diagonal: bool = False) -> bool:
+        #Every cell free and in bounds, and every step moves to an adjacent cell
+        if len(self) == 0:
+            return True
+        import numpy as np
+        coords = self.coords()
+        xs, ys = coords[:, 0], coords[:, 1]
+        if xs.min() < 0 or ys.min() < 0 or xs.max() >= grid.width or ys.max() >= grid.height:
+            return False
+        if grid.occupancy_array()[ys, xs].any():
+            return False
+        steps = np.abs(np.diff(coords, axis=0))
+        if diagonal:
+            return bool((steps.max(axis=1) == 1).all()) if len(steps) else True
+        return bool((steps.sum(axis=1) == 1).all()) if len(steps) else True
+
+    def smooth(self, grid) -> "GridPath":
+        #String pulling: from each anchor jump to the furthest later cell still in line of sight.
+        #The result is an any-angle waypoint path with length() <= the original
+        if len(self) < 3:
+            return GridPath(array('i', self._flat))
+        points = self.to_list()
+        smoothed = array('i', points[0])
+        anchor = 0
+        while anchor < len(points) - 1:
+            reach = anchor + 1
+            while reach + 1 < len(points) and line_of_sight(grid, points[anchor], points[reach + 1]):
+                reach += 1
+            smoothed.extend(points[reach])
+            anchor = reach
+        return GridPath(smoothed)
+
+    def compress(self, mode: str = "waypoints") -> "CompressedPath":
+        #Lossless for paths made of unit (4- or 8-connected) steps; anything else (e.g. a
+        #smooth()ed path) cannot be re-expanded cell by cell and is rejected
+        points = self.to_list()
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            if (x2 - x1, y2 - y1) not in _MOVE_CODE:
+                raise ValueError(f"Cannot compress non-unit step {(x1, y1)} -> {(x2, y2)}")
+        if mode == "waypoints":
+            #Keep the endpoints and every cell where the step direction changes
+            data = array('i')
+            for index, point in enumerate(points):
+                if 0 < index < len(points) - 1:
+                    before, after = points[index - 1], points[index + 1]
+                    if (point[0] - before[0], point[1] - before[1]) == (after[0] - point[0], after[1] - point[1]):
+                        continue
+                data.extend(point)
+            return CompressedPath(mode, data)
+        if mode == "runs":
+            #Start cell followed by (move code, repeat count) pairs
+            data = array('i', points[0]) if points else array('i')
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                code = _MOVE_CODE[(x2 - x1, y2 - y1)]
+                if len(data) > 2 and data[-2] == code:
+                    data[-1] += 1
+                else:
+                    data.extend((code, 1))
+            return CompressedPath(mode, data)
+        raise ValueError(f"Unknown compression mode: {mode}")
+
+
+class CompressedPath:
+    #Waypoint or run-length encoded GridPath; expand() restores the full cell sequence
+    __slots__ = ('mode', 'data')
+
+    def __init__(self, mode: str, data: array):
+        self.mode = mode
+        self.data = data
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) * self.data.itemsize
+
+    def expand(self) -> GridPath:
+        data = self.data
+        flat = array('i', data[:2])
+        if self.mode == "waypoints":
+            for index in range(2, len(data), 2):
+                x, y = flat[-2], flat[-1]
+                x2, y2 = data[index], data[index + 1]
+                dx, dy = _sign(x2 - x), _sign(y2 - y)
+                while (x, y) != (x2, y2):
+                    x, y = x + dx, y + dy
+                    flat.extend((x, y))
+        else:
+            for index in range(2, len(data), 2):
+                dx, dy = MOVES[data[index]]
+                for _ in range(data[index + 1]):
+                    flat.extend((flat[-2] + dx, flat[-1] + dy))
+        return GridPath(flat)
+
+
+def line_of_sight(grid, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+    #Conservative check between cell centres: every cell the segment enters must be free,
+    #and passing exactly through a corner needs all four cells around it free
+    import numpy as np
+    (x0, y0), (x1, y1) = a, b
+    dx, dy = x1 - x0, y1 - y0
+    crossings = [np.zeros(1), np.ones(1)]
+    if dx:
+        lines = np.arange(min(x0, x1) + 1, max(x0, x1) + 1)
+        crossings.append((lines - (x0 + 0.5)) / dx)
+    if dy:
+        lines = np.arange(min(y0, y1) + 1, max(y0, y1) + 1)
+        crossings.append((lines - (y0 + 0.5)) / dy)
+    t = np.concatenate(crossings)
+    px, py = x0 + 0.5 + t * dx, y0 + 0.5 + t * dy
+
+    eps = 1e-9
+    low_x, high_x = np.floor(px - eps).astype(np.int64), np.floor(px + eps).astype(np.int64)
+    low_y, high_y = np.floor(py - eps).astype(np.int64), np.floor(py + eps).astype(np.int64)
+    xs = np.concatenate([low_x, low_x, high_x, high_x])
+    ys = np.concatenate([low_y, high_y, low_y, high_y])
+    if xs.min() < 0 or ys.min() < 0 or xs.max() >= grid.width or ys.max() >= grid.height:
+        return False
+    return not grid.occupancy_array()[ys, xs].any()
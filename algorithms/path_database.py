@@ -0,0 +1,206 @@
+import heapq
+import time
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+from typing import List, Optional, Tuple
+from .base import BasePathfinder, PathResult
+from .serialization import load_arrays, map_checksum, save_arrays
+from .instrumentation import current_process
+
+
+FILE_MAGIC = b"CPDGRID1\n"
+
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+NO_MOVE = 255
+
+
+def _first_move_rows(width: int, height: int, traversable: bytes, node_cells: array,
+                     sources: List[int]) -> List[Tuple[bytes, bytes]]:
+    #One-to-many Dijkstra per source; each target inherits the first move of its parent.
+    #Rows are run-length encoded over node ids as (run start ids, run moves).
+    num_nodes = len(node_cells)
+    cell_nodes = {cell: node for node, cell in enumerate(node_cells)}
+    rows = []
+    for source in sources:
+        first_moves = bytearray([NO_MOVE]) * num_nodes
+        distances = {source: 0.0}
+        min_heap = [(0.0, source)]
+        while min_heap:
+            distance, node = heapq.heappop(min_heap)
+            if distance > distances[node]:
+                continue
+            cell = node_cells[node]
+            x, y = cell % width, cell // width
+            for move, (dx, dy) in enumerate(DIRECTIONS):
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height) or not traversable[ny * width + nx]:
+                    continue
+                neighbor = cell_nodes[ny * width + nx]
+                tentative = distance + 1.0
+                if tentative < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = tentative
+                    first_moves[neighbor] = move if node == source else first_moves[node]
+                    heapq.heappush(min_heap, (tentative, neighbor))
+
+        run_starts = array('i')
+        run_moves = bytearray()
+        previous = -1
+        for target, move in enumerate(first_moves):
+            if move != previous:
+                run_starts.append(target)
+                run_moves.append(move)
+                previous = move
+        rows.append((run_starts.tobytes(), bytes(run_moves)))
+    return rows
+
+
+class PathDatabase(BasePathfinder):
+    #Compressed path database: for every (source, target) pair of free cells the first move of a
+    #shortest path, stored as run-length encoded rows. Queries walk the path by table lookups alone.
+    ARRAYS = ['node_cells', 'row_offsets', 'run_starts', 'run_moves']
+
+    def __init__(self, grid, agent_radius: int = 0):
+        super().__init__(grid, agent_radius=agent_radius)
+        self.algorithm_name = "Path Database"
+        self.build_time = 0.0
+        self.build_memory = 0.0
+        self._built_version = None
+        self._clear()
+
+    def _clear(self):
+        self.node_cells = array('i')
+        self.cell_nodes = array('i', [-1]) * (self.grid.width * self.grid.height)
+        #Row r owns runs row_offsets[r]:row_offsets[r + 1]; each run covers targets from its start id
+        self.row_offsets = array('i', [0])
+        self.run_starts = array('i')
+        self.run_moves = array('B')
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_version is not None
+
+    @property
+    def compression_ratio(self) -> float:
+        #Uncompressed table (one byte per pair) over the run-length encoded size
+        num_nodes = len(self.node_cells)
+        compressed = (len(self.run_starts) * self.run_starts.itemsize +
+                      len(self.run_moves) * self.run_moves.itemsize)
+        return num_nodes * num_nodes / compressed if compressed else 0.0
+
+    def _traversable_mask(self) -> bytes:
+        if self.agent_radius > 0:
+            clearance = self.grid.clearance_for(self.agent_radius)
+            return bytes(value > self.agent_radius for value in clearance)
+        return bytes(1 - value for value in self.grid.occupancy)
+
+    def build(self, workers: Optional[int] = None, chunk_size: int = 64):
+        #workers=None uses every core; workers=1 builds in this process
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+
+        self._clear()
+        traversable = self._traversable_mask()
+        for cell, free in enumerate(traversable):
+            if free:
+                self.cell_nodes[cell] = len(self.node_cells)
+                self.node_cells.append(cell)
+
+        width, height = self.grid.width, self.grid.height
+        sources = list(range(len(self.node_cells)))
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        if workers == 1 or len(chunks) <= 1:
+            results = [_first_move_rows(width, height, traversable, self.node_cells, chunk)
+                       for chunk in chunks]
+        else:
+            #multiprocessing is slow to import; only builds that fan out pay for it
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_first_move_rows, repeat(width), repeat(height),
+                                            repeat(traversable), repeat(self.node_cells), chunks))
+
+        for rows in results:
+            for run_starts, run_moves in rows:
+                self.run_starts.frombytes(run_starts)
+                self.run_moves.frombytes(run_moves)
+                self.row_offsets.append(len(self.run_starts))
+
+        self._built_version = self.grid.version
+        self.build_time = time.time() - start_time
+        self.build_memory = process.memory_info().rss / 1024 / 1024 - initial_memory
+
+    def first_move(self, source: int, target: int) -> int:
+        row_start, row_end = self.row_offsets[source], self.row_offsets[source + 1]
+        run = bisect_right(self.run_starts, target, row_start, row_end) - 1
+        return self.run_moves[run]
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.require_unit_costs()
+        if self._built_version != self.grid.version:
+            self.build()
+
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        self.reset_metrics()
+
+        width = self.grid.width
+        #Off-map coordinates would alias other cells' flat indices
+        source = target = -1
+        if self.grid.is_valid_position(*start) and self.grid.is_valid_position(*goal):
+            source = self.cell_nodes[start[1] * width + start[0]]
+            target = self.cell_nodes[goal[1] * width + goal[0]]
+        path = []
+        if source >= 0 and target >= 0:
+            path = [start]
+            current, node = start, source
+            while node != target:
+                move = self.first_move(node, target)
+                if move == NO_MOVE:
+                    path = []
+                    break
+                self.nodes_expanded += 1
+                dx, dy = DIRECTIONS[move]
+                current = (current[0] + dx, current[1] + dy)
+                node = self.cell_nodes[current[1] * width + current[0]]
+                path.append(current)
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=bool(path)
+        )
+
+    def save(self, filename: str):
+        if not self.is_built:
+            raise ValueError("Path database has not been built")
+        header = {
+            'map_checksum': map_checksum(self.grid),
+            'agent_radius': self.agent_radius,
+            'build_time': self.build_time,
+            'build_memory': self.build_memory,
+        }
+        save_arrays(filename, FILE_MAGIC, header, {name: getattr(self, name) for name in self.ARRAYS})
+
+    @classmethod
+    def load(cls, filename: str, grid) -> 'PathDatabase':
+        header, arrays = load_arrays(filename, FILE_MAGIC, grid)
+        database = cls(grid, agent_radius=header['agent_radius'])
+        for name, data in arrays.items():
+            setattr(database, name, data)
+
+        for node, cell in enumerate(database.node_cells):
+            database.cell_nodes[cell] = node
+        database.build_time = header['build_time']
+        database.build_memory = header['build_memory']
+        database._built_version = grid.version
+        return database
@@ -0,0 +1,218 @@
+import heapq
+import time
+from array import array
+from typing import Dict, List, Set, Tuple
+from .base import BasePathfinder, GridListener, PathResult
+from .instrumentation import current_process
+
+
+class QuadtreePathfinder(GridListener, BasePathfinder):
+    #Multi-resolution search over a quadtree of free space.
+    #Free leaves are maximal obstacle-free aligned squares; A* runs over the leaf adjacency graph
+    #and the coarse leaf corridor is then refined into cells with a corridor-restricted A*.
+    #Paths are near-optimal rather than optimal; open areas cost one node instead of thousands.
+    def __init__(self, grid, refine: bool = True):
+        super().__init__(grid)
+        self.algorithm_name = "Quadtree"
+        self.refine = refine
+        self.root_size = 1
+        while self.root_size < max(grid.width, grid.height):
+            self.root_size *= 2
+        self.build()
+        grid.add_edit_listener(self)
+
+    def build(self):
+        #leaf_of maps each cell to its free leaf id (-1 for obstacles); leaves holds aligned boxes
+        self.leaf_of = array('i', [-1]) * (self.grid.width * self.grid.height)
+        self.leaves: Dict[int, Tuple[int, int, int]] = {}
+        self._next_leaf = 0
+        self._adjacency: Dict[int, Set[int]] = {}
+        self._decompose(0, 0, self.root_size)
+
+    def _clip(self, x: int, y: int, size: int) -> Tuple[int, int, int, int]:
+        return x, y, min(x + size, self.grid.width), min(y + size, self.grid.height)
+
+    def _count_obstacles(self, x: int, y: int, size: int) -> Tuple[int, int]:
+        x0, y0, x1, y1 = self._clip(x, y, size)
+        if x0 >= x1 or y0 >= y1:
+            return 0, 0
+        occupancy, width = self.grid.occupancy, self.grid.width
+        blocked = sum(occupancy[row * width + x0:row * width + x1].count(1) for row in range(y0, y1))
+        return blocked, (x1 - x0) * (y1 - y0)
+
+    def _add_leaf(self, x: int, y: int, size: int):
+        leaf = self._next_leaf
+        self._next_leaf += 1
+        self.leaves[leaf] = (x, y, size)
+        x0, y0, x1, y1 = self._clip(x, y, size)
+        width = self.grid.width
+        for row in range(y0, y1):
+            self.leaf_of[row * width + x0:row * width + x1] = array('i', [leaf]) * (x1 - x0)
+
+    def _remove_leaves_in(self, x: int, y: int, size: int):
+        x0, y0, x1, y1 = self._clip(x, y, size)
+        width = self.grid.width
+        for row in range(y0, y1):
+            for leaf in set(self.leaf_of[row * width + x0:row * width + x1]):
+                self.leaves.pop(leaf, None)
+            self.leaf_of[row * width + x0:row * width + x1] = array('i', [-1]) * (x1 - x0)
+
+    def _decompose(self, x: int, y: int, size: int):
+        blocked, total = self._count_obstacles(x, y, size)
+        if total == 0 or blocked == total:
+            return
+        if blocked == 0:
+            self._add_leaf(x, y, size)
+            return
+        half = size // 2
+        for dx, dy in ((0, 0), (half, 0), (0, half), (half, half)):
+            self._decompose(x + dx, y + dy, half)
+
+    def on_cell_changed(self, x: int, y: int, blocked: bool):
+        self._adjacency = {}
+        if blocked:
+            #The leaf that held the cell splits; its box is re-decomposed on its own
+            leaf = self.leaf_of[y * self.grid.width + x]
+            if leaf >= 0:
+                box = self.leaves[leaf]
+                self._remove_leaves_in(*box)
+                self._decompose(*box)
+            return
+
+        #Grow the freed cell to the largest aligned all-free box and merge everything inside it
+        size, bx, by = 1, x, y
+        while size < self.root_size:
+            parent_x, parent_y = (x // (size * 2)) * size * 2, (y // (size * 2)) * size * 2
+            if self._count_obstacles(parent_x, parent_y, size * 2)[0] > 0:
+                break
+            size, bx, by = size * 2, parent_x, parent_y
+        self._remove_leaves_in(bx, by, size)
+        self._add_leaf(bx, by, size)
+
+    def on_grid_reset(self):
+        self.build()
+
+    def _center(self, leaf: int) -> Tuple[float, float]:
+        x0, y0, x1, y1 = self._clip(*self.leaves[leaf])
+        return ((x0 + x1 - 1) / 2, (y0 + y1 - 1) / 2)
+
+    def leaf_neighbors(self, leaf: int) -> Set[int]:
+        #Leaves sharing an edge with this one, found from the cells just outside its border
+        neighbors = self._adjacency.get(leaf)
+        if neighbors is not None:
+            return neighbors
+
+        x0, y0, x1, y1 = self._clip(*self.leaves[leaf])
+        width, height = self.grid.width, self.grid.height
+        border = [(x, y0 - 1) for x in range(x0, x1)] + [(x, y1) for x in range(x0, x1)]
+        border += [(x0 - 1, y) for y in range(y0, y1)] + [(x1, y) for y in range(y0, y1)]
+        neighbors = set()
+        for x, y in border:
+            if 0 <= x < width and 0 <= y < height and self.leaf_of[y * width + x] >= 0:
+                neighbors.add(self.leaf_of[y * width + x])
+        self._adjacency[leaf] = neighbors
+        return neighbors
+
+    def _coarse_search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[int]:
+        width = self.grid.width
+        start_leaf = self.leaf_of[start[1] * width + start[0]]
+        goal_leaf = self.leaf_of[goal[1] * width + goal[0]]
+
+        def distance(a, b):
+            return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+
+        #Each leaf is represented by its centre, except the end leaves which use the endpoints
+        def anchor(leaf):
+            if leaf == start_leaf:
+                return start
+            if leaf == goal_leaf:
+                return goal
+            return self._center(leaf)
+
+        min_heap = [(distance(start, goal), 0.0, start_leaf)]
+        g_costs = {start_leaf: 0.0}
+        parent_map = {start_leaf: None}
+        visited = set()
+        while min_heap:
+            _, current_g, current = heapq.heappop(min_heap)
+            if current in visited:
+                continue
+            visited.add(current)
+            self.nodes_expanded += 1
+            if current == goal_leaf:
+                return self.trace_parents(goal_leaf, parent_map)
+
+            current_anchor = anchor(current)
+            for neighbor in self.leaf_neighbors(current):
+                if neighbor in visited:
+                    continue
+                neighbor_anchor = anchor(neighbor)
+                tentative_g = current_g + distance(current_anchor, neighbor_anchor)
+                if tentative_g < g_costs.get(neighbor, float('inf')):
+                    g_costs[neighbor] = tentative_g
+                    parent_map[neighbor] = current
+                    heapq.heappush(min_heap, (tentative_g + distance(neighbor_anchor, goal),
+                                              tentative_g, neighbor))
+        return []
+
+    def _refine_corridor(self, start: Tuple[int, int], goal: Tuple[int, int],
+                         corridor: Set[int]) -> List[Tuple[int, int]]:
+        #Cell-level A* that may only enter cells belonging to the coarse corridor.
+        #Ties on f prefer deeper cells (heap holds -g), so open leaves are crossed without flooding
+        width = self.grid.width
+        min_heap = [(0.0, 0.0, start)]
+        g_costs = {start: 0.0}
+        parent_map = {start: None}
+        visited = set()
+        while min_heap:
+            _, negative_g, current = heapq.heappop(min_heap)
+            current_g = -negative_g
+            if current in visited:
+                continue
+            visited.add(current)
+            self.nodes_expanded += 1
+            if current == goal:
+                return self.reconstruct_path(goal, parent_map)
+            for neighbor_pos, move_cost in self.get_neighbors(current):
+                if self.leaf_of[neighbor_pos[1] * width + neighbor_pos[0]] not in corridor:
+                    continue
+                tentative_g = current_g + move_cost
+                if tentative_g < g_costs.get(neighbor_pos, float('inf')):
+                    g_costs[neighbor_pos] = tentative_g
+                    parent_map[neighbor_pos] = current
+                    h_cost = abs(neighbor_pos[0] - goal[0]) + abs(neighbor_pos[1] - goal[1])
+                    heapq.heappush(min_heap, (tentative_g + h_cost, -tentative_g, neighbor_pos))
+        return []
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.require_unit_costs()
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        self.reset_metrics()
+
+        path = []
+        if self.grid.is_valid_position(*start) and self.grid.is_valid_position(*goal):
+            leaf_path = self._coarse_search(start, goal)
+            if leaf_path and self.refine:
+                path = self._refine_corridor(start, goal, set(leaf_path))
+            elif leaf_path:
+                #Waypoints only: endpoints joined through the centre cells of the intermediate leaves
+                centers = [self._center(leaf) for leaf in leaf_path[1:-1]]
+                path = [start] + [(int(cx), int(cy)) for cx, cy in centers] + [goal]
+                if start == goal:
+                    path = [start]
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=bool(path)
+        )
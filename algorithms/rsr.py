@@ -0,0 +1,177 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+from .base import GridListener
+
+
+class RectangularSymmetryReduction(GridListener):
+    #Rectangular Symmetry Reduction neighbour provider for 4-connected unit-cost grids.
+    #Free space is split into empty rectangles; searches never enter rectangle interiors and
+    #instead cross them with macro edges between opposite perimeter cells, which removes the
+    #many symmetric shortest paths an open area offers while keeping path costs optimal.
+    #Pass it as neighbor_provider to DijkstraPathfinder or AStarPathfinder.
+    def __init__(self, grid):
+        self.grid = grid
+        self._start: Optional[Tuple[int, int]] = None
+        self._start_links: List[Tuple[Tuple[int, int], float]] = []
+        self._goal_links: Dict[Tuple[int, int], List[Tuple[Tuple[int, int], float]]] = {}
+        self.build()
+        grid.add_edit_listener(self)
+
+    def build(self):
+        #rect_of maps each free cell to its rectangle id; rects holds inclusive (x0, y0, x1, y1)
+        self.rect_of = array('i', [-1]) * (self.grid.width * self.grid.height)
+        self.rects: Dict[int, Tuple[int, int, int, int]] = {}
+        self._next_rect = 0
+        self._decompose(0, 0, self.grid.width - 1, self.grid.height - 1)
+
+    def _unassigned(self, x: int, y: int) -> bool:
+        return self.grid.is_valid_position(x, y) and self.rect_of[y * self.grid.width + x] < 0
+
+    def _assign(self, rect: int, x0: int, y0: int, x1: int, y1: int):
+        width = self.grid.width
+        self.rects[rect] = (x0, y0, x1, y1)
+        for row in range(y0, y1 + 1):
+            self.rect_of[row * width + x0:row * width + x1 + 1] = array('i', [rect]) * (x1 - x0 + 1)
+
+    def _dissolve(self, rect: int) -> Tuple[int, int, int, int]:
+        x0, y0, x1, y1 = self.rects.pop(rect)
+        width = self.grid.width
+        for row in range(y0, y1 + 1):
+            self.rect_of[row * width + x0:row * width + x1 + 1] = array('i', [-1]) * (x1 - x0 + 1)
+        return x0, y0, x1, y1
+
+    def _decompose(self, x0: int, y0: int, x1: int, y1: int):
+        #Greedy cover of the unassigned free cells in a box: grow right, then grow down row by row
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                if not self._unassigned(x, y):
+                    continue
+                right = x
+                while right + 1 <= x1 and self._unassigned(right + 1, y):
+                    right += 1
+                bottom = y
+                while bottom + 1 <= y1 and all(self._unassigned(cx, bottom + 1)
+                                               for cx in range(x, right + 1)):
+                    bottom += 1
+
+                self._assign(self._next_rect, x, y, right, bottom)
+                self._next_rect += 1
+
+    def _merge(self, rect: int):
+        #Absorb neighbouring rectangles that share a whole side, until none is left
+        width = self.grid.width
+        merged = True
+        while merged:
+            merged = False
+            x0, y0, x1, y1 = self.rects[rect]
+            for nx, ny, horizontal in ((x1 + 1, y0, True), (x0 - 1, y0, True),
+                                       (x0, y1 + 1, False), (x0, y0 - 1, False)):
+                if not self.grid.is_valid_position(nx, ny):
+                    continue
+                other = self.rect_of[ny * width + nx]
+                ox0, oy0, ox1, oy1 = self.rects[other]
+                if (oy0, oy1) == (y0, y1) if horizontal else (ox0, ox1) == (x0, x1):
+                    self._dissolve(other)
+                    self._assign(rect, min(x0, ox0), min(y0, oy0), max(x1, ox1), max(y1, oy1))
+                    merged = True
+                    break
+
+    def on_cell_changed(self, x: int, y: int, blocked: bool):
+        width = self.grid.width
+        if blocked:
+            #Only the rectangle that held the cell is rebuilt
+            rect = self.rect_of[y * width + x]
+            if rect < 0:
+                return
+            self._decompose(*self._dissolve(rect))
+            return
+
+        #A freed cell is rebuilt together with the rectangles around it, and the rectangle
+        #it ends up in then absorbs any neighbour lined up with it along a whole side
+        x0, y0, x1, y1 = x, y, x, y
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if not self.grid.is_valid_position(nx, ny):
+                continue
+            rx0, ry0, rx1, ry1 = self._dissolve(self.rect_of[ny * width + nx])
+            x0, y0, x1, y1 = min(x0, rx0), min(y0, ry0), max(x1, rx1), max(y1, ry1)
+        self._decompose(x0, y0, x1, y1)
+        self._merge(self.rect_of[y * width + x])
+
+    def on_grid_reset(self):
+        self.build()
+
+    def _is_interior(self, x: int, y: int, rect: Tuple[int, int, int, int]) -> bool:
+        x0, y0, x1, y1 = rect
+        return x0 < x < x1 and y0 < y < y1
+
+    def _perimeter_links(self, position: Tuple[int, int]) -> List[Tuple[Tuple[int, int], float]]:
+        #Straight-line links from a cell to the perimeter of its rectangle on all four sides
+        x, y = position
+        x0, y0, x1, y1 = self.rects[self.rect_of[y * self.grid.width + x]]
+        links = []
+        for target in ((x0, y), (x1, y), (x, y0), (x, y1)):
+            if target != position and target not in [link[0] for link in links]:
+                links.append((target, float(abs(target[0] - x) + abs(target[1] - y))))
+        return links
+
+    def prepare(self, start: Tuple[int, int], goal: Tuple[int, int]):
+        #Temporarily wire start and goal in when they sit inside a rectangle interior
+        if self.grid.costs is not None:
+            raise ValueError("Rectangular symmetry reduction assumes unit move costs but the grid has a cost layer")
+        width = self.grid.width
+        self._start, self._start_links, self._goal_links = None, [], {}
+        if not (self.grid.is_valid_position(*start) and self.grid.is_valid_position(*goal)):
+            return
+
+        start_rect = self.rect_of[start[1] * width + start[0]]
+        goal_rect = self.rect_of[goal[1] * width + goal[0]]
+        if self._is_interior(*start, self.rects[start_rect]):
+            self._start = start
+            self._start_links = self._perimeter_links(start)
+            if start_rect == goal_rect:
+                self._start_links.append((goal, float(abs(goal[0] - start[0]) + abs(goal[1] - start[1]))))
+        if self._is_interior(*goal, self.rects[goal_rect]):
+            for cell, distance in self._perimeter_links(goal):
+                self._goal_links.setdefault(cell, []).append((goal, distance))
+
+    def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[Tuple[int, int], float]]:
+        if position == self._start:
+            return self._start_links
+
+        x, y = position
+        rect = self.rects[self.rect_of[y * self.grid.width + x]]
+        x0, y0, x1, y1 = rect
+        neighbors = []
+        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            new_x, new_y = x + dx, y + dy
+            if self.grid.is_valid_position(new_x, new_y) and not self._is_interior(new_x, new_y, rect):
+                neighbors.append(((new_x, new_y), 1.0))
+
+        #Macro edges jump straight across the rectangle to the opposite perimeter cell
+        if x1 - x0 > 1:
+            if x == x0:
+                neighbors.append(((x1, y), float(x1 - x0)))
+            elif x == x1:
+                neighbors.append(((x0, y), float(x1 - x0)))
+        if y1 - y0 > 1:
+            if y == y0:
+                neighbors.append(((x, y1), float(y1 - y0)))
+            elif y == y1:
+                neighbors.append(((x, y0), float(y1 - y0)))
+
+        return neighbors + self._goal_links.get(position, [])
+
+    def expand_path(self, path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        #Fill in macro-edge jumps; jumps stay inside one empty rectangle, so an L-shape is free
+        if not path:
+            return path
+        cells = [path[0]]
+        for x2, y2 in path[1:]:
+            x, y = cells[-1]
+            while x != x2:
+                x += 1 if x2 > x else -1
+                cells.append((x, y))
+            while y != y2:
+                y += 1 if y2 > y else -1
+                cells.append((x, y))
+        return cells
@@ -0,0 +1,65 @@
+import json
+import mmap
+import zlib
+from array import array
+from typing import Any, BinaryIO, Dict, Tuple
+
+
+def map_checksum(grid) -> Tuple[int, int, int]:
+    #Identifies the map a preprocessed structure was built for; cost layers are folded in
+    checksum = zlib.crc32(grid.occupancy)
+    if getattr(grid, 'costs', None) is not None:
+        checksum = zlib.crc32(grid.costs, checksum)
+    return (grid.width, grid.height, checksum)
+
+
+def save_arrays(filename: str, magic: bytes, header: Dict[str, Any], arrays: Dict[str, array]):
+    #Magic line, one JSON header line, then the raw contents of each array in order.
+    #The header line is space-padded so the array data starts 8-byte aligned for memory-mapping
+    header = dict(header)
+    header['arrays'] = [(name, data.typecode, len(data)) for name, data in arrays.items()]
+    header_line = json.dumps(header).encode()
+    header_line += b" " * (-(len(magic) + len(header_line) + 1) % 8) + b"\n"
+    with open(filename, 'wb') as f:
+        f.write(magic)
+        f.write(header_line)
+        for data in arrays.values():
+            data.tofile(f)
+
+
+def _read_header(f: BinaryIO, filename: str, magic: bytes) -> Dict[str, Any]:
+    if f.readline() != magic:
+        raise ValueError(f"{filename} is not a {magic.decode().strip()} file")
+    return json.loads(f.readline())
+
+
+def load_arrays(filename: str, magic: bytes, grid=None) -> Tuple[Dict[str, Any], Dict[str, array]]:
+    #grid=None skips the map check for structures that are not tied to a Grid
+    with open(filename, 'rb') as f:
+        header = _read_header(f, filename, magic)
+        if grid is not None and tuple(header['map_checksum']) != map_checksum(grid):
+            raise ValueError(f"{filename} was built for a different map")
+
+        arrays = {}
+        for name, typecode, length in header.pop('arrays'):
+            data = array(typecode)
+            data.fromfile(f, length)
+            arrays[name] = data
+    return header, arrays
+
+
+def map_arrays(filename: str, magic: bytes) -> Tuple[Dict[str, Any], Dict[str, memoryview]]:
+    #Like load_arrays but returns read-only memoryviews over a memory-mapped file, so only the
+    #pages a search touches are ever read from disk
+    with open(filename, 'rb') as f:
+        header = _read_header(f, filename, magic)
+        position = f.tell()
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    arrays = {}
+    for name, typecode, length in header.pop('arrays'):
+        itemsize = array(typecode).itemsize
+        arrays[name] = buffer[position:position + length * itemsize].cast(typecode)
+        position += length * itemsize
+    return header, arrays
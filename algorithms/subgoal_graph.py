@@ -0,0 +1,209 @@
+import heapq
+import time
+from typing import Dict, List, Set, Tuple
+from .base import BasePathfinder, GridListener, PathResult
+from .instrumentation import current_process
+
+
+QUADRANTS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class SubgoalGraph(GridListener, BasePathfinder):
+    #Simple subgoal graph for 4-connected unit-cost grids.
+    #Subgoals sit at convex obstacle corners and are joined when one can reach the other by a
+    #monotone (Manhattan-length) path that passes no other subgoal. Every shortest path bends
+    #only at such corners, so A* over this sparse graph plus a refinement pass stays optimal.
+    def __init__(self, grid, agent_radius: int = 0):
+        super().__init__(grid, agent_radius=agent_radius)
+        self.algorithm_name = "Subgoal Graph"
+        self.preprocessing_time = 0.0
+        self.subgoals: Set[Tuple[int, int]] = set()
+        self.edges: Dict[Tuple[int, int], Dict[Tuple[int, int], float]] = {}
+        #Cell -> subgoals whose exploration touched it; edits there invalidate those subgoals' edges
+        self._coverage: Dict[Tuple[int, int], Set[Tuple[int, int]]] = {}
+        #Subgoal -> cells its exploration touched, so disconnecting it can clear its coverage
+        self._touched: Dict[Tuple[int, int], Set[Tuple[int, int]]] = {}
+        self.build()
+        grid.add_edit_listener(self)
+
+    def _free(self, x: int, y: int) -> bool:
+        if self.agent_radius > 0:
+            if not (0 <= x < self.grid.width and 0 <= y < self.grid.height):
+                return False
+            return self.grid.clearance_for(self.agent_radius)[y * self.grid.width + x] > self.agent_radius
+        return self.grid.is_valid_position(x, y)
+
+    def _is_subgoal(self, x: int, y: int) -> bool:
+        if not self._free(x, y):
+            return False
+        for dx, dy in QUADRANTS:
+            if not self._free(x + dx, y + dy) and self._free(x + dx, y) and self._free(x, y + dy):
+                return True
+        return False
+
+    def _explore(self, source: Tuple[int, int], targets: Set[Tuple[int, int]]):
+        #Monotone sweeps into each quadrant from source, stopping at (but recording) targets.
+        #Returns reached targets with their Manhattan distances and every cell the sweeps touched.
+        reached: Dict[Tuple[int, int], float] = {}
+        touched: Set[Tuple[int, int]] = {source}
+        for sx, sy in QUADRANTS:
+            frontier = [source]
+            seen = {source}
+            while frontier:
+                x, y = frontier.pop()
+                for step in ((x + sx, y), (x, y + sy)):
+                    if step in seen:
+                        continue
+                    seen.add(step)
+                    touched.add(step)
+                    if not self._free(*step):
+                        continue
+                    if step in targets:
+                        reached[step] = float(abs(step[0] - source[0]) + abs(step[1] - source[1]))
+                        continue
+                    frontier.append(step)
+        return reached, touched
+
+    def _connect(self, subgoal: Tuple[int, int]):
+        reached, touched = self._explore(subgoal, self.subgoals)
+        self.edges[subgoal] = reached
+        self._touched[subgoal] = touched
+        for cell in touched:
+            self._coverage.setdefault(cell, set()).add(subgoal)
+
+    def _disconnect(self, subgoal: Tuple[int, int]):
+        for neighbor in self.edges.pop(subgoal, {}):
+            self.edges.get(neighbor, {}).pop(subgoal, None)
+        for cell in self._touched.pop(subgoal, ()):
+            covering = self._coverage[cell]
+            covering.discard(subgoal)
+            if not covering:
+                del self._coverage[cell]
+
+    def build(self):
+        start_time = time.time()
+        self.subgoals = {(x, y) for x in range(self.grid.width) for y in range(self.grid.height)
+                         if self._is_subgoal(x, y)}
+        self.edges = {}
+        self._coverage = {}
+        self._touched = {}
+        for subgoal in self.subgoals:
+            self._connect(subgoal)
+        self.preprocessing_time = time.time() - start_time
+
+    def on_cell_changed(self, x: int, y: int, blocked: bool):
+        if self.agent_radius > 0:
+            #Clearance shifts over a whole window; incremental bookkeeping is not worth it
+            self.build()
+            return
+
+        #Corner status can only change in the 3x3 block around the edit
+        affected = set()
+        for nx in range(x - 1, x + 2):
+            for ny in range(y - 1, y + 2):
+                if not (0 <= nx < self.grid.width and 0 <= ny < self.grid.height):
+                    continue
+                is_subgoal = self._is_subgoal(nx, ny)
+                if is_subgoal != ((nx, ny) in self.subgoals):
+                    if is_subgoal:
+                        self.subgoals.add((nx, ny))
+                    else:
+                        self.subgoals.discard((nx, ny))
+                        self._disconnect((nx, ny))
+                    affected.add((nx, ny))
+                affected |= self._coverage.get((nx, ny), set())
+
+        for subgoal in affected:
+            self._disconnect(subgoal)
+        for subgoal in affected & self.subgoals:
+            self._connect(subgoal)
+            #Reachability is symmetric; mirror the refreshed edges
+            for neighbor, distance in self.edges[subgoal].items():
+                self.edges.setdefault(neighbor, {})[subgoal] = distance
+
+    def on_grid_reset(self):
+        self.build()
+
+    def _refine(self, source: Tuple[int, int], target: Tuple[int, int]) -> List[Tuple[int, int]]:
+        #Expand one monotone edge into cells: mark cells in the bounding box that can still
+        #reach target monotonically, then walk from source through marked cells
+        sx = 1 if target[0] >= source[0] else -1
+        sy = 1 if target[1] >= source[1] else -1
+        can_reach = {target}
+        for x in range(target[0], source[0] - sx, -sx):
+            for y in range(target[1], source[1] - sy, -sy):
+                if (x, y) != target and self._free(x, y) and (
+                        (x + sx, y) in can_reach or (x, y + sy) in can_reach):
+                    can_reach.add((x, y))
+
+        cells = []
+        x, y = source
+        while (x, y) != target:
+            if (x + sx, y) in can_reach and x != target[0]:
+                x += sx
+            else:
+                y += sy
+            cells.append((x, y))
+        return cells
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.require_unit_costs()
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        self.reset_metrics()
+
+        path = []
+        if self._free(*start) and self._free(*goal):
+            #Temporarily hook start and goal into the graph
+            start_edges, _ = self._explore(start, self.subgoals | {goal})
+            goal_edges, _ = self._explore(goal, self.subgoals)
+
+            def heuristic(position):
+                return abs(position[0] - goal[0]) + abs(position[1] - goal[1])
+
+            min_heap = [(heuristic(start), 0.0, start)]
+            g_costs = {start: 0.0}
+            parent_map = {start: None}
+            visited = set()
+            while min_heap:
+                _, current_g, current = heapq.heappop(min_heap)
+                if current in visited:
+                    continue
+                visited.add(current)
+                self.nodes_expanded += 1
+                if current == goal:
+                    break
+
+                if current == start:
+                    successors = start_edges
+                else:
+                    successors = dict(self.edges.get(current, {}))
+                    if current in goal_edges:
+                        successors[goal] = goal_edges[current]
+                for neighbor, distance in successors.items():
+                    tentative_g = current_g + distance
+                    if tentative_g < g_costs.get(neighbor, float('inf')):
+                        g_costs[neighbor] = tentative_g
+                        parent_map[neighbor] = current
+                        heapq.heappush(min_heap, (tentative_g + heuristic(neighbor), tentative_g, neighbor))
+
+            if goal in visited:
+                waypoints = self.reconstruct_path(goal, parent_map)
+                path = [start]
+                for source, target in zip(waypoints, waypoints[1:]):
+                    path.extend(self._refine(source, target))
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=bool(path)
+        )
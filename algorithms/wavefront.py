@@ -0,0 +1,112 @@
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
+from .base import BasePathfinder, PathResult
+from .instrumentation import current_process
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class WavefrontPathfinder(BasePathfinder):
+    #Breadth-first search for 4-connected unit-cost grids that expands a whole frontier per step
+    #with NumPy shifts and masks, so no priority queue and no per-node Python work
+    def __init__(self, grid, agent_radius: int = 0):
+        super().__init__(grid, agent_radius=agent_radius)
+        self.algorithm_name = "Wavefront BFS"
+
+    def _free_mask(self) -> "np.ndarray":
+        if self.agent_radius > 0:
+            return self.grid.clearance_array(self.agent_radius) > self.agent_radius
+        return self.grid.occupancy_array() == 0
+
+    def distance_field(self, start: Tuple[int, int],
+                       goal: Optional[Tuple[int, int]] = None) -> "np.ndarray":
+        #(height, width) int32 step counts from start, -1 where unreachable (or not reached before goal)
+        import numpy as np
+        self.reset_metrics()
+        height, width = self.grid.height, self.grid.width
+        free = self._free_mask()
+        distances = np.full((height, width), -1, dtype=np.int32)
+
+        sx, sy = start
+        #Negative indices would wrap around to the far side of the array
+        if not (0 <= sx < width and 0 <= sy < height) or not free[sy, sx]:
+            return distances
+
+        frontier = np.zeros((height, width), dtype=bool)
+        frontier[sy, sx] = True
+        distances[sy, sx] = 0
+        self.nodes_expanded = 1
+        #The reached region grows by at most one cell per side per step; only touch its bounding box
+        y0, y1, x0, x1 = sy, sy + 1, sx, sx + 1
+        step = 0
+
+        while goal is None or distances[goal[1], goal[0]] < 0:
+            y0, y1 = max(0, y0 - 1), min(height, y1 + 1)
+            x0, x1 = max(0, x0 - 1), min(width, x1 + 1)
+            front = frontier[y0:y1, x0:x1]
+
+            grown = np.zeros_like(front)
+            grown[1:, :] |= front[:-1, :]
+            grown[:-1, :] |= front[1:, :]
+            grown[:, 1:] |= front[:, :-1]
+            grown[:, :-1] |= front[:, 1:]
+            grown &= free[y0:y1, x0:x1]
+            grown &= distances[y0:y1, x0:x1] < 0
+
+            if not grown.any():
+                break
+            step += 1
+            distances[y0:y1, x0:x1][grown] = step
+            frontier[y0:y1, x0:x1] = grown
+            self.nodes_expanded += int(np.count_nonzero(grown))
+
+        return distances
+
+    def reachable(self, start: Tuple[int, int]) -> "np.ndarray":
+        return self.distance_field(start) >= 0
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> PathResult:
+        self.require_unit_costs()
+        start_time = time.time()
+        process = current_process()
+        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+
+        path = []
+        found = False
+        #Off-map goals must not index the distance field, where negative coordinates wrap around
+        if self.grid.is_valid_position(*goal):
+            distances = self.distance_field(start, goal)
+            found = bool(distances[goal[1], goal[0]] >= 0)
+        else:
+            self.reset_metrics()
+
+        if found:
+            #Walk back down the distance field; any neighbour one step closer lies on a shortest path
+            height, width = distances.shape
+            current = goal
+            path.append(current)
+            while current != start:
+                x, y = current
+                remaining = distances[y, x] - 1
+                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < width and 0 <= ny < height and distances[ny, nx] == remaining:
+                        current = (nx, ny)
+                        break
+                path.append(current)
+            path.reverse()
+
+        computation_time = time.time() - start_time
+        current_memory = process.memory_info().rss / 1024 / 1024
+        memory_usage = current_memory - initial_memory
+
+        return PathResult(
+            path=path,
+            path_length=self.calculate_path_length(path),
+            nodes_expanded=self.nodes_expanded,
+            computation_time=computation_time,
+            memory_usage=memory_usage,
+            algorithm_name=self.algorithm_name,
+            found=found
+        )
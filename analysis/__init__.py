@@ -2,7 +2,19 @@
 Analysis package for performance metrics and reporting.
 """
 
-from .performance import PerformanceAnalyzer
-from .metrics import MetricsCollector
+import importlib
 
-__all__ = ['PerformanceAnalyzer', 'MetricsCollector'] 
\ No newline at end of file
+#Submodules pull in NumPy and psutil, so each one is imported on first attribute access
+_EXPORTS = {'PerformanceAnalyzer': '.performance', 'MetricsCollector': '.metrics',
+            'ResultsStore': '.results_store', 'ScenarioCorpus': '.scenarios',
+            'ScenarioSpec': '.scenarios', 'Scenario': '.scenarios'}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['PerformanceAnalyzer', 'MetricsCollector', 'ResultsStore',
+           'ScenarioCorpus', 'ScenarioSpec', 'Scenario'] 
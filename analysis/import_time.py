@@ -0,0 +1,47 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Sequence
+
+#Third-party packages the planning core must not load at import time
+HEAVY_MODULES = ('numpy', 'psutil', 'matplotlib')
+CORE_PACKAGES = ('environment', 'algorithms')
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def measure_import_time(packages: Sequence[str] = CORE_PACKAGES, repeats: int = 5) -> Dict:
+    #Every run uses a fresh interpreter so nothing is already sitting in sys.modules
+    probe = _PROBE.format(imports="\n".join(f"import {name}" for name in packages),
+                          heavy=HEAVY_MODULES)
+    runs: List[float] = []
+    heavy_loaded: List[str] = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", probe], cwd=_PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        elapsed, heavy_loaded = json.loads(output.strip().splitlines()[-1])
+        runs.append(elapsed)
+    return {
+        'packages': list(packages),
+        'median_seconds': statistics.median(runs),
+        'runs': runs,
+        'heavy_modules_loaded': heavy_loaded,
+    }
+
+
+if __name__ == "__main__":
+    report = measure_import_time(sys.argv[1:] or CORE_PACKAGES)
+    print(f"import {', '.join(report['packages'])}: {report['median_seconds'] * 1000:.1f} ms "
+          f"(median of {len(report['runs'])})")
+    if report['heavy_modules_loaded']:
+        print(f"  heavy modules loaded: {', '.join(report['heavy_modules_loaded'])}")
+        sys.exit(1)
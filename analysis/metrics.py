@@ -1,8 +1,7 @@
 import time
-import psutil
-import os
 from typing import Dict, Any, List
 from dataclasses import dataclass
+from algorithms.instrumentation import current_process
 
 
 @dataclass
@@ -19,7 +18,7 @@ class RuntimeMetrics:
 class MetricsCollector:
     
     def __init__(self):
-        self.process = psutil.Process(os.getpid())
+        self.process = current_process()
         self.active_measurements: Dict[str, RuntimeMetrics] = {}
     
     def start_measurement(self, measurement_id: str):
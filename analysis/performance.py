@@ -1,70 +1,57 @@
-import time
-import statistics
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import numpy as np
 from algorithms.base import PathResult
+from .results_store import ResultsStore
 
 
 class PerformanceAnalyzer:
-    def __init__(self):
-        self.results: List[PathResult] = []
+    def __init__(self, store: ResultsStore = None):
+        self.store = store if store is not None else ResultsStore()
+    
+    @property
+    def results(self) -> Tuple[PathResult, ...]:
+        #Read-only snapshot of the store: edits go through add_result(s) and clear_results
+        return tuple(self.store.to_results())
     
     def add_result(self, result: PathResult):
-        self.results.append(result)
+        self.store.append(result)
+    
+    def add_results(self, results: List[PathResult]):
+        self.store.extend(results)
     
     def clear_results(self):
-        self.results.clear()
+        self.store.clear()
+    
+    @staticmethod
+    def _describe(values: np.ndarray) -> Dict[str, float]:
+        return {
+            'mean': float(np.mean(values)),
+            'median': float(np.median(values)),
+            'min': values.min().item(),
+            'max': values.max().item(),
+            'std_dev': float(np.std(values, ddof=1)) if len(values) > 1 else 0
+        }
     
     def analyze_algorithm_performance(self, algorithm_name: str) -> Dict[str, Any]:
-        #performance analysis for a specific algorithm
-        algorithm_results = [r for r in self.results if r.algorithm_name == algorithm_name]
+        #performance analysis for a specific algorithm, reduced column-wise over the store
+        algorithm_mask = self.store.mask(algorithm_name)
+        total_runs = int(np.count_nonzero(algorithm_mask))
         
-        if not algorithm_results:
+        if total_runs == 0:
             return {}
         
-        successful_results = [r for r in algorithm_results if r.found]
+        successful_mask = algorithm_mask & self.store.column('found')
+        successful_runs = int(np.count_nonzero(successful_mask))
         
         analysis = {
             'algorithm_name': algorithm_name,
-            'total_runs': len(algorithm_results),
-            'successful_runs': len(successful_results),
+            'total_runs': total_runs,
+            'successful_runs': successful_runs,
         }
         
-        if successful_results:
-            nodes_expanded = [r.nodes_expanded for r in successful_results]
-            computation_times = [r.computation_time for r in successful_results]
-            memory_usage = [r.memory_usage for r in successful_results]
-            path_lengths = [r.path_length for r in successful_results]
-            
-            analysis.update({
-                'nodes_expanded': {
-                    'mean': statistics.mean(nodes_expanded),
-                    'median': statistics.median(nodes_expanded),
-                    'min': min(nodes_expanded),
-                    'max': max(nodes_expanded),
-                    'std_dev': statistics.stdev(nodes_expanded) if len(nodes_expanded) > 1 else 0
-                },
-                'computation_time': {
-                    'mean': statistics.mean(computation_times),
-                    'median': statistics.median(computation_times),
-                    'min': min(computation_times),
-                    'max': max(computation_times),
-                    'std_dev': statistics.stdev(computation_times) if len(computation_times) > 1 else 0
-                },
-                'memory_usage': {
-                    'mean': statistics.mean(memory_usage),
-                    'median': statistics.median(memory_usage),
-                    'min': min(memory_usage),
-                    'max': max(memory_usage),
-                    'std_dev': statistics.stdev(memory_usage) if len(memory_usage) > 1 else 0
-                },
-                'path_length': {
-                    'mean': statistics.mean(path_lengths),
-                    'median': statistics.median(path_lengths),
-                    'min': min(path_lengths),
-                    'max': max(path_lengths),
-                    'std_dev': statistics.stdev(path_lengths) if len(path_lengths) > 1 else 0
-                }
-            })
+        if successful_runs:
+            for metric in ['nodes_expanded', 'computation_time', 'memory_usage', 'path_length']:
+                analysis[metric] = self._describe(self.store.column(metric)[successful_mask])
         
         return analysis
     
@@ -83,26 +70,28 @@ class PerformanceAnalyzer:
         # Compare metrics if both have successful runs
         if 'nodes_expanded' in analysis1 and 'nodes_expanded' in analysis2:
             metrics = ['nodes_expanded', 'computation_time', 'memory_usage', 'path_length']
+            means1 = np.array([analysis1[metric]['mean'] for metric in metrics])
+            means2 = np.array([analysis2[metric]['mean'] for metric in metrics])
             
-            for metric in metrics:
-                mean1 = analysis1[metric]['mean']
-                mean2 = analysis2[metric]['mean']
-                
-                improvement = (mean1 - mean2) / mean1 * 100 if mean1 != 0 else 0
-                
+            nonzero = means1 != 0
+            improvements = np.zeros(len(metrics))
+            improvements[nonzero] = (means1[nonzero] - means2[nonzero]) / means1[nonzero] * 100
+            
+            for metric, improvement, mean1, mean2 in zip(metrics, improvements, means1, means2):
                 comparison[f'{metric}_improvement'] = {
-                    'algorithm2_vs_algorithm1_percent': improvement,
-                    'algorithm1_mean': mean1,
-                    'algorithm2_mean': mean2
+                    'algorithm2_vs_algorithm1_percent': float(improvement),
+                    'algorithm1_mean': float(mean1),
+                    'algorithm2_mean': float(mean2)
                 }
         
         return comparison
     
     def generate_summary_report(self) -> str:
-        if not self.results:
+        if len(self.store) == 0:
             return "No results to analyze."
         
-        algorithms = list(set(r.algorithm_name for r in self.results))
+        present = np.unique(self.store.column('algorithm_id'))
+        algorithms = [self.store.algorithm_names[i] for i in present]
         
         report = ["PATHFINDING ALGORITHM PERFORMANCE ANALYSIS"]
         report.append("=" * 50)
@@ -140,35 +129,26 @@ class PerformanceAnalyzer:
         return "\n".join(report)
     
     def get_efficiency_metrics(self, algorithm_name: str) -> Dict[str, float]:
-        algorithm_results = [r for r in self.results if r.algorithm_name == algorithm_name and r.found]
+        selected = self.store.mask(algorithm_name, found_only=True)
         
-        if not algorithm_results:
+        if not selected.any():
             return {}
         
         #Calculate efficiency ratios
-        efficiency_metrics = {}
+        path_lengths = self.store.column('path_length')[selected]
+        nodes_expanded = self.store.column('nodes_expanded')[selected]
+        computation_times = self.store.column('computation_time')[selected]
         
-        for result in algorithm_results:
-            path_length = result.path_length
-            nodes_expanded = result.nodes_expanded
-            
-            if path_length > 0 and nodes_expanded > 0:
-                path_efficiency = nodes_expanded / path_length
-                time_efficiency = result.computation_time / path_length
-                
-                if 'path_efficiency' not in efficiency_metrics:
-                    efficiency_metrics['path_efficiency'] = []
-                    efficiency_metrics['time_efficiency'] = []
-                
-                efficiency_metrics['path_efficiency'].append(path_efficiency)
-                efficiency_metrics['time_efficiency'].append(time_efficiency)
-        
-        if efficiency_metrics:
-            return {
-                'avg_path_efficiency': statistics.mean(efficiency_metrics['path_efficiency']),
-                'avg_time_efficiency': statistics.mean(efficiency_metrics['time_efficiency']),
-                'path_efficiency_std': statistics.stdev(efficiency_metrics['path_efficiency']) if len(efficiency_metrics['path_efficiency']) > 1 else 0,
-                'time_efficiency_std': statistics.stdev(efficiency_metrics['time_efficiency']) if len(efficiency_metrics['time_efficiency']) > 1 else 0
-            }
-        
-        return {} 
\ No newline at end of file
+        valid = (path_lengths > 0) & (nodes_expanded > 0)
+        if not valid.any():
+            return {}
+        
+        path_efficiency = nodes_expanded[valid] / path_lengths[valid]
+        time_efficiency = computation_times[valid] / path_lengths[valid]
+        
+        return {
+            'avg_path_efficiency': float(np.mean(path_efficiency)),
+            'avg_time_efficiency': float(np.mean(time_efficiency)),
+            'path_efficiency_std': float(np.std(path_efficiency, ddof=1)) if len(path_efficiency) > 1 else 0,
+            'time_efficiency_std': float(np.std(time_efficiency, ddof=1)) if len(time_efficiency) > 1 else 0
+        }
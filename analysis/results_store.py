@@ -0,0 +1,237 @@
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from algorithms.base import PathResult
+
+
+class ResultsStore:
+    #Append-only columnar storage for PathResults
+    #Scalar metrics live in NumPy columns, grid paths in one ragged (offsets, coords) buffer and
+    #CSR graph paths in a second ragged (offsets, node ids) buffer
+    COLUMNS = {
+        'algorithm_id': np.int32,
+        'nodes_expanded': np.int64,
+        'computation_time': np.float64,
+        'memory_usage': np.float64,
+        'path_length': np.float64,
+        'found': np.bool_,
+        'graph_path': np.bool_,
+        #NaN when the planner reported no cost
+        'path_cost': np.float64,
+        #Goal reached (find_path_to_any), -1 when none; graph rows keep the node id in goal_x
+        'goal_x': np.int32,
+        'goal_y': np.int32,
+    }
+    PATH_ARRAYS = ['path_offsets', 'path_coords', 'node_offsets', 'path_nodes']
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self.size = 0
+        self.algorithm_names: List[str] = []
+        self._algorithm_ids: Dict[str, int] = {}
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self._path_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._path_coords = np.zeros((capacity * 4, 2), dtype=np.int32)
+        self._node_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._path_nodes = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][:self.size]
+
+    @property
+    def path_offsets(self) -> np.ndarray:
+        return self._path_offsets[:self.size + 1]
+
+    @property
+    def path_coords(self) -> np.ndarray:
+        return self._path_coords[:self._path_offsets[self.size]]
+
+    @property
+    def node_offsets(self) -> np.ndarray:
+        return self._node_offsets[:self.size + 1]
+
+    @property
+    def path_nodes(self) -> np.ndarray:
+        return self._path_nodes[:self._node_offsets[self.size]]
+
+    def algorithm_id(self, algorithm_name: str) -> Optional[int]:
+        return self._algorithm_ids.get(algorithm_name)
+
+    def _intern_algorithm(self, algorithm_name: str) -> int:
+        algorithm_id = self._algorithm_ids.get(algorithm_name)
+        if algorithm_id is None:
+            algorithm_id = len(self.algorithm_names)
+            self._algorithm_ids[algorithm_name] = algorithm_id
+            self.algorithm_names.append(algorithm_name)
+        return algorithm_id
+
+    def _reserve(self, rows: int, coords: int, nodes: int = 0):
+        #Grow by doubling so appends stay amortised O(1); also detaches memory-mapped columns
+        needed_rows = self.size + rows
+        capacity = len(self._columns['found'])
+        if needed_rows > capacity or not self._columns['found'].flags.writeable:
+            new_capacity = max(needed_rows, capacity * 2)
+            for name, data in self._columns.items():
+                grown = np.zeros(new_capacity, dtype=data.dtype)
+                grown[:self.size] = data[:self.size]
+                self._columns[name] = grown
+            for name in ('_path_offsets', '_node_offsets'):
+                offsets = np.zeros(new_capacity + 1, dtype=np.int64)
+                offsets[:self.size + 1] = getattr(self, name)[:self.size + 1]
+                setattr(self, name, offsets)
+
+        used = int(self._path_offsets[self.size])
+        needed_coords = used + coords
+        if needed_coords > len(self._path_coords) or not self._path_coords.flags.writeable:
+            grown = np.zeros((max(needed_coords, len(self._path_coords) * 2, 1), 2), dtype=np.int32)
+            grown[:used] = self._path_coords[:used]
+            self._path_coords = grown
+
+        used = int(self._node_offsets[self.size])
+        needed_nodes = used + nodes
+        if needed_nodes > len(self._path_nodes) or not self._path_nodes.flags.writeable:
+            grown = np.zeros(max(needed_nodes, len(self._path_nodes) * 2, 1), dtype=np.int32)
+            grown[:used] = self._path_nodes[:used]
+            self._path_nodes = grown
+
+    def append(self, result: PathResult):
+        #CSR graph searches return int node ids rather than (x, y) cells
+        graph_path = len(result.path) > 0 and isinstance(result.path[0], (int, np.integer))
+        if graph_path:
+            nodes = np.asarray(result.path, dtype=np.int32)
+            path = nodes[:0].reshape(-1, 2)
+        else:
+            path = np.asarray(result.path, dtype=np.int32).reshape(-1, 2)
+            nodes = path[:0, 0]
+        self._reserve(1, len(path), len(nodes))
+
+        row = self.size
+        self._columns['algorithm_id'][row] = self._intern_algorithm(result.algorithm_name)
+        self._columns['nodes_expanded'][row] = result.nodes_expanded
+        self._columns['computation_time'][row] = result.computation_time
+        self._columns['memory_usage'][row] = result.memory_usage
+        self._columns['path_length'][row] = result.path_length
+        self._columns['found'][row] = result.found
+        self._columns['graph_path'][row] = graph_path
+        self._columns['path_cost'][row] = np.nan if result.path_cost is None else result.path_cost
+        goal = result.goal
+        if goal is None:
+            goal = (-1, -1)
+        elif isinstance(goal, (int, np.integer)):
+            goal = (goal, -1)
+        self._columns['goal_x'][row], self._columns['goal_y'][row] = goal
+
+        start = self._path_offsets[row]
+        self._path_coords[start:start + len(path)] = path
+        self._path_offsets[row + 1] = start + len(path)
+        start = self._node_offsets[row]
+        self._path_nodes[start:start + len(nodes)] = nodes
+        self._node_offsets[row + 1] = start + len(nodes)
+        self.size += 1
+
+    def extend(self, results: Iterable[PathResult]):
+        for result in results:
+            self.append(result)
+
+    def clear(self):
+        self.size = 0
+        self.algorithm_names = []
+        self._algorithm_ids = {}
+
+    def get_path(self, index: int) -> Union[List[Tuple[int, int]], List[int]]:
+        if not 0 <= index < self.size:
+            raise IndexError(f"Result index out of range: {index}")
+        if self._columns['graph_path'][index]:
+            start, end = self._node_offsets[index], self._node_offsets[index + 1]
+            return self._path_nodes[start:end].tolist()
+        start, end = self._path_offsets[index], self._path_offsets[index + 1]
+        return [tuple(pos) for pos in self._path_coords[start:end].tolist()]
+
+    def get_goal(self, index: int) -> Optional[Union[Tuple[int, int], int]]:
+        goal_x, goal_y = int(self._columns['goal_x'][index]), int(self._columns['goal_y'][index])
+        if goal_x < 0:
+            return None
+        return goal_x if self._columns['graph_path'][index] else (goal_x, goal_y)
+
+    def get_result(self, index: int) -> PathResult:
+        path = self.get_path(index)
+        path_cost = float(self._columns['path_cost'][index])
+        return PathResult(
+            path=path,
+            path_length=float(self._columns['path_length'][index]),
+            nodes_expanded=int(self._columns['nodes_expanded'][index]),
+            computation_time=float(self._columns['computation_time'][index]),
+            memory_usage=float(self._columns['memory_usage'][index]),
+            algorithm_name=self.algorithm_names[self._columns['algorithm_id'][index]],
+            found=bool(self._columns['found'][index]),
+            goal=self.get_goal(index),
+            path_cost=None if np.isnan(path_cost) else path_cost
+        )
+
+    def to_results(self) -> List[PathResult]:
+        return [self.get_result(i) for i in range(self.size)]
+
+    def mask(self, algorithm_name: str, found_only: bool = False) -> np.ndarray:
+        algorithm_id = self.algorithm_id(algorithm_name)
+        if algorithm_id is None:
+            return np.zeros(self.size, dtype=bool)
+        selected = self.column('algorithm_id') == algorithm_id
+        if found_only:
+            selected &= self.column('found')
+        return selected
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {name: self.column(name) for name in self.COLUMNS}
+        for name in self.PATH_ARRAYS:
+            arrays[name] = getattr(self, name)
+        return arrays
+
+    def save_npz(self, filename: str, compressed: bool = False):
+        arrays = self._arrays()
+        arrays['algorithm_names'] = np.array(self.algorithm_names, dtype=str)
+        if compressed:
+            np.savez_compressed(filename, **arrays)
+        else:
+            np.savez(filename, **arrays)
+
+    def save_arrays(self, directory: str):
+        #One raw .npy per column so large stores can be memory-mapped back
+        os.makedirs(directory, exist_ok=True)
+        for name, data in self._arrays().items():
+            np.save(os.path.join(directory, f"{name}.npy"), data)
+        with open(os.path.join(directory, "algorithm_names.json"), "w") as f:
+            json.dump(self.algorithm_names, f)
+
+    @classmethod
+    def _from_arrays(cls, arrays: Dict[str, np.ndarray], algorithm_names: List[str]) -> 'ResultsStore':
+        store = cls(capacity=1)
+        for name, dtype in cls.COLUMNS.items():
+            data = arrays[name]
+            if data.dtype != dtype:
+                raise ValueError(f"Column {name} has dtype {data.dtype}, expected {np.dtype(dtype)}")
+            store._columns[name] = data
+        for name in cls.PATH_ARRAYS:
+            setattr(store, '_' + name, arrays[name])
+        store.size = len(arrays['found'])
+        for algorithm_name in algorithm_names:
+            store._intern_algorithm(algorithm_name)
+        return store
+
+    @classmethod
+    def load_npz(cls, filename: str) -> 'ResultsStore':
+        with np.load(filename) as data:
+            arrays = {name: data[name] for name in data.files}
+        return cls._from_arrays(arrays, [str(name) for name in arrays.pop('algorithm_names')])
+
+    @classmethod
+    def load_arrays(cls, directory: str, mmap_mode: Optional[str] = 'r') -> 'ResultsStore':
+        names = list(cls.COLUMNS) + cls.PATH_ARRAYS
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+                  for name in names}
+        with open(os.path.join(directory, "algorithm_names.json")) as f:
+            algorithm_names = json.load(f)
+        return cls._from_arrays(arrays, algorithm_names)
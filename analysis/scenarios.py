@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import random
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Tuple
+from algorithms.serialization import load_arrays, save_arrays
+from environment import Grid, GridSnapshot, ObstacleGenerator
+
+
+FILE_MAGIC = b"SCENARIO1\n"
+#Bumped whenever generation or sampling changes so stale cache entries are never reused
+CORPUS_FORMAT = 1
+UNREACHABLE = -1
+
+GENERATORS = {
+    'empty': lambda grid, seed, **params: None,
+    'random': lambda grid, seed, density: ObstacleGenerator.generate_random_obstacles(grid, density, seed=seed),
+    'maze': lambda grid, seed: ObstacleGenerator.generate_maze_obstacles(grid, seed=seed),
+    'corridor': lambda grid, seed, num_corridors=3: ObstacleGenerator.generate_corridor_obstacles(
+        grid, num_corridors=num_corridors, seed=seed),
+    'clustered': lambda grid, seed, num_clusters=5: ObstacleGenerator.generate_clustered_obstacles(
+        grid, num_clusters=num_clusters, seed=seed),
+    'diagonal': lambda grid, seed, num_diagonals=3: ObstacleGenerator.generate_diagonal_obstacles(
+        grid, num_diagonals=num_diagonals, seed=seed),
+}
+
+
+@dataclass
+class ScenarioSpec:
+    name: str
+    generator: str
+    width: int
+    height: int
+    seed: int = 42
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class Query(NamedTuple):
+    start: Tuple[int, int]
+    goal: Tuple[int, int]
+    #Manhattan distance bucket, or UNREACHABLE when goal lies in another component
+    bucket: int
+
+
+@dataclass
+class Scenario:
+    name: str
+    width: int
+    height: int
+    occupancy: bytes
+    #Flat int32 (sx, sy, gx, gy, bucket) records
+    query_data: array
+
+    def queries(self) -> Iterator[Query]:
+        data = self.query_data
+        for i in range(0, len(data), 5):
+            yield Query((data[i], data[i + 1]), (data[i + 2], data[i + 3]), data[i + 4])
+
+    def to_grid(self) -> Grid:
+        return GridSnapshot(self.width, self.height, 0, base=self.occupancy).to_grid()
+
+    def apply_to(self, grid: Grid):
+        #Load this map into an existing grid so pathfinders bound to it can be reused
+        grid.clear_obstacles()
+        width = self.width
+        for index, blocked in enumerate(self.occupancy):
+            if blocked:
+                grid.add_obstacle(index % width, index // width)
+
+
+class ScenarioCorpus:
+    #Maps plus stratified query sets, generated once and cached on disk.
+    #Each cache entry is keyed by a hash of the generator parameters, seed and sampling settings,
+    #and scenarios() loads (or builds) one entry at a time as a benchmark consumes it.
+    def __init__(self, cache_dir: str, num_buckets: int = 4, queries_per_bucket: int = 8,
+                 unreachable_queries: int = 2):
+        self.cache_dir = cache_dir
+        self.num_buckets = num_buckets
+        self.queries_per_bucket = queries_per_bucket
+        self.unreachable_queries = unreachable_queries
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_key(self, spec: ScenarioSpec) -> str:
+        settings = {
+            'format': CORPUS_FORMAT, 'generator': spec.generator, 'width': spec.width,
+            'height': spec.height, 'seed': spec.seed, 'params': spec.params,
+            'num_buckets': self.num_buckets, 'queries_per_bucket': self.queries_per_bucket,
+            'unreachable_queries': self.unreachable_queries,
+        }
+        return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+    def cache_path(self, spec: ScenarioSpec) -> str:
+        return os.path.join(self.cache_dir, f"{spec.generator}-{self.cache_key(spec)}.scn")
+
+    def scenarios(self, specs: Iterable[ScenarioSpec]) -> Iterator[Scenario]:
+        for spec in specs:
+            yield self.get(spec)
+
+    def get(self, spec: ScenarioSpec) -> Scenario:
+        filename = self.cache_path(spec)
+        if os.path.exists(filename):
+            self.cache_hits += 1
+            _, arrays = load_arrays(filename, FILE_MAGIC)
+            return Scenario(spec.name, spec.width, spec.height,
+                            arrays['occupancy'].tobytes(), arrays['queries'])
+
+        self.cache_misses += 1
+        scenario = self.build(spec)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        #Write then rename so an interrupted run never leaves a truncated entry behind
+        save_arrays(filename + ".tmp", FILE_MAGIC, {'name': spec.name, 'key': self.cache_key(spec)},
+                    {'occupancy': array('B', scenario.occupancy), 'queries': scenario.query_data})
+        os.replace(filename + ".tmp", filename)
+        return scenario
+
+    def build(self, spec: ScenarioSpec) -> Scenario:
+        grid = Grid(spec.width, spec.height)
+        GENERATORS[spec.generator](grid, spec.seed, **spec.params)
+        occupancy = bytes(grid.occupancy)
+        return Scenario(spec.name, spec.width, spec.height, occupancy,
+                        self._sample_queries(occupancy, spec.width, spec.height, spec.seed))
+
+    def _components(self, occupancy: bytes, width: int, height: int) -> array:
+        #4-connected component label per cell (-1 for obstacles), one BFS sweep over the map
+        labels = array('i', [-1]) * (width * height)
+        label = 0
+        for seed_index in range(width * height):
+            if occupancy[seed_index] or labels[seed_index] >= 0:
+                continue
+            labels[seed_index] = label
+            queue = deque([seed_index])
+            while queue:
+                index = queue.popleft()
+                x, y = index % width, index // width
+                for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                    neighbor = ny * width + nx
+                    if (0 <= nx < width and 0 <= ny < height and not occupancy[neighbor]
+                            and labels[neighbor] < 0):
+                        labels[neighbor] = label
+                        queue.append(neighbor)
+            label += 1
+        return labels
+
+    def _sample_queries(self, occupancy: bytes, width: int, height: int, seed: int) -> array:
+        #Rejection-sample random pairs into equal-width Manhattan distance buckets plus an
+        #unreachable bucket; buckets a map cannot fill (e.g. long queries on tiny maps) stay short
+        free = [index for index in range(width * height) if not occupancy[index]]
+        data = array('i')
+        if len(free) < 2:
+            return data
+        labels = self._components(occupancy, width, height)
+        max_distance = max(width + height - 2, 1)
+        quotas = [self.queries_per_bucket] * self.num_buckets
+        unreachable_quota = self.unreachable_queries
+        rng = random.Random(seed)
+
+        for _ in range(50 * (sum(quotas) + unreachable_quota)):
+            if not any(quotas) and not unreachable_quota:
+                break
+            start, goal = rng.sample(free, 2)
+            sx, sy, gx, gy = start % width, start // width, goal % width, goal // width
+            if labels[start] != labels[goal]:
+                if not unreachable_quota:
+                    continue
+                unreachable_quota -= 1
+                bucket = UNREACHABLE
+            else:
+                distance = abs(sx - gx) + abs(sy - gy)
+                bucket = min(distance * self.num_buckets // max_distance, self.num_buckets - 1)
+                if not quotas[bucket]:
+                    continue
+                quotas[bucket] -= 1
+            data.extend((sx, sy, gx, gy, bucket))
+        return data
@@ -4,5 +4,6 @@ Environment package for grid-based maps and obstacle generation.
 
 from .grid import Grid
 from .obstacles import ObstacleGenerator
+from .snapshot import GridSnapshot
 
-__all__ = ['Grid', 'ObstacleGenerator'] 
\ No newline at end of file
+__all__ = ['Grid', 'ObstacleGenerator', 'GridSnapshot'] 
\ No newline at end of file
@@ -0,0 +1,74 @@
+class ClearanceMap:
+    #Chebyshev distance from every cell to the nearest obstacle or map edge, capped at max_clearance
+    #A cell fits a square agent of radius r (footprint (2r+1)x(2r+1)) when clearance > r
+    def __init__(self, grid, max_clearance: int):
+        if not 1 <= max_clearance <= 255:
+            raise ValueError("max_clearance must be between 1 and 255")
+        self.grid = grid
+        self.max_clearance = max_clearance
+        self.values = bytearray(grid.width * grid.height)
+        self.rebuild()
+
+    def array(self):
+        #Zero-copy (height, width) uint8 NumPy view of the clearance values
+        import numpy as np
+        return np.frombuffer(self.values, dtype=np.uint8).reshape(self.grid.height, self.grid.width)
+
+    @staticmethod
+    def _transform(free, pad_free, iterations: int):
+        #Count how many successive 3x3 erosions each free cell survives
+        #pad_free holds, per side (top, bottom, left, right), whether cells beyond the array count as free
+        import numpy as np
+        height, width = free.shape
+        clearance = np.zeros((height, width), dtype=np.uint8)
+        current = np.zeros((height + 2, width + 2), dtype=bool)
+        top, bottom, left, right = pad_free
+        current[0, :], current[-1, :], current[:, 0], current[:, -1] = top, bottom, left, right
+        current[1:-1, 1:-1] = free
+
+        for _ in range(iterations):
+            inner = current[1:-1, 1:-1]
+            if not inner.any():
+                break
+            clearance += inner
+            eroded = inner.copy()
+            for dy in (0, 1, 2):
+                for dx in (0, 1, 2):
+                    eroded &= current[dy:dy + height, dx:dx + width]
+            current[1:-1, 1:-1] = eroded
+        return clearance
+
+    def rebuild(self):
+        free = self.grid.occupancy_array() == 0
+        self.array()[:] = self._transform(free, (False, False, False, False), self.max_clearance)
+
+    def on_cell_changed(self, x: int, y: int, blocked: bool):
+        import numpy as np
+        cap = self.max_clearance
+        clearance = self.array()
+
+        if blocked:
+            #Only cells within cap of the new obstacle can get closer to an obstacle than they were
+            y0, y1 = max(0, y - cap), min(self.grid.height, y + cap + 1)
+            x0, x1 = max(0, x - cap), min(self.grid.width, x + cap + 1)
+            dy = np.abs(np.arange(y0, y1) - y)[:, None]
+            dx = np.abs(np.arange(x0, x1) - x)[None, :]
+            window = clearance[y0:y1, x0:x1]
+            np.minimum(window, np.maximum(dy, dx).astype(np.uint8), out=window)
+            return
+
+        #Cells within cap of the freed cell may grow; their capped values depend only on
+        #obstacles within 2 * cap, so recompute that window treating cells beyond it as free
+        reach = 2 * cap
+        y0, y1 = max(0, y - reach), min(self.grid.height, y + reach + 1)
+        x0, x1 = max(0, x - reach), min(self.grid.width, x + reach + 1)
+        free = self.grid.occupancy_array()[y0:y1, x0:x1] == 0
+        pad_free = (y0 > 0, y1 < self.grid.height, x0 > 0, x1 < self.grid.width)
+        window = self._transform(free, pad_free, cap)
+
+        iy0, iy1 = max(0, y - cap), min(self.grid.height, y + cap + 1)
+        ix0, ix1 = max(0, x - cap), min(self.grid.width, x + cap + 1)
+        clearance[iy0:iy1, ix0:ix1] = window[iy0 - y0:iy1 - y0, ix0 - x0:ix1 - x0]
+
+    def on_grid_reset(self):
+        self.rebuild()
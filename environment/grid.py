@@ -1,5 +1,9 @@
-from typing import Set, Tuple, List
+import weakref
+from array import array
+from typing import Dict, Optional, Set, Tuple, List
 import random
+from .clearance import ClearanceMap
+from .snapshot import GridSnapshot
 
 
 class Grid:
@@ -7,13 +11,59 @@ class Grid:
         self.width = width
         self.height = height
         self.obstacles: Set[Tuple[int, int]] = set()
+        #Row-major occupancy bytes (index y * width + x) mirrored from obstacles for array access
+        self.occupancy = bytearray(width * height)
+        #Bumped on every effective edit; snapshots record the version they were taken at
+        self.version = 0
+        self._last_snapshot: Optional[GridSnapshot] = None
+        #Cell edits since the last snapshot, None once they stop being worth tracking
+        self._pending_edits: Optional[Dict[int, int]] = {}
+        #Derived structures kept in sync on edits via on_cell_changed(x, y, blocked) / on_grid_reset().
+        #Held as weak references in notification order (not a WeakSet: clearance must go first), so
+        #a structure nobody else references stops being rebuilt as soon as it is collected
+        self._edit_listeners: List[weakref.ref] = []
+        self._clearance: Optional[ClearanceMap] = None
+        #Row-major float32 cost of entering each cell; None means every move costs 1.0.
+        #min_cost is kept current so A* can scale its heuristic without scanning the layer
+        self.costs: Optional[array] = None
+        self.min_cost = 1.0
+    
+    def add_edit_listener(self, listener, first: bool = False):
+        if listener not in self.edit_listeners():
+            self._edit_listeners.insert(0 if first else len(self._edit_listeners), weakref.ref(listener))
+    
+    def remove_edit_listener(self, listener):
+        self._edit_listeners = [ref for ref in self._edit_listeners if ref() not in (listener, None)]
+    
+    def edit_listeners(self) -> List:
+        #Live listeners in notification order; references to collected ones are dropped here
+        listeners = [ref() for ref in self._edit_listeners]
+        if None in listeners:
+            self._edit_listeners = [ref for ref in self._edit_listeners if ref() is not None]
+            listeners = [listener for listener in listeners if listener is not None]
+        return listeners
+    
+    def _record_edit(self, index: int, value: int):
+        self.version += 1
+        if self._pending_edits is not None:
+            self._pending_edits[index] = value
+            if len(self._pending_edits) > GridSnapshot.max_delta_fraction * len(self.occupancy):
+                self._pending_edits = None
+        x, y = index % self.width, index // self.width
+        for listener in self.edit_listeners():
+            listener.on_cell_changed(x, y, value == 1)
     
     def add_obstacle(self, x: int, y: int):
-        if 0 <= x < self.width and 0 <= y < self.height:
+        if 0 <= x < self.width and 0 <= y < self.height and (x, y) not in self.obstacles:
             self.obstacles.add((x, y))
+            self.occupancy[y * self.width + x] = 1
+            self._record_edit(y * self.width + x, 1)
     
     def remove_obstacle(self, x: int, y: int):
-        self.obstacles.discard((x, y))
+        if (x, y) in self.obstacles:
+            self.obstacles.discard((x, y))
+            self.occupancy[y * self.width + x] = 0
+            self._record_edit(y * self.width + x, 0)
     
     def is_obstacle(self, x: int, y: int) -> bool:
         return (x, y) in self.obstacles
@@ -25,6 +75,127 @@ class Grid:
     
     def clear_obstacles(self):
         self.obstacles.clear()
+        self.occupancy[:] = bytes(len(self.occupancy))
+        self.version += 1
+        self._pending_edits = None
+        for listener in self.edit_listeners():
+            listener.on_grid_reset()
+    
+    def set_costs(self, values):
+        #Bulk load a whole cost layer from a (height, width) NumPy array or any flat sequence
+        if hasattr(values, 'dtype'):
+            import numpy as np
+            costs = array('f', np.ascontiguousarray(values, dtype=np.float32).tobytes())
+        else:
+            costs = array('f', values)
+        if len(costs) != self.width * self.height:
+            raise ValueError(f"Expected {self.width * self.height} costs, got {len(costs)}")
+        if len(costs) and min(costs) <= 0:
+            raise ValueError("Cell costs must be positive")
+        self.costs = costs
+        self.costs_changed()
+    
+    def set_cost_region(self, x0: int, y0: int, x1: int, y1: int, cost: float):
+        #Set every cell in [x0, x1) x [y0, y1) to one cost, e.g. a ramp or congestion zone
+        if cost <= 0:
+            raise ValueError("Cell costs must be positive")
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if self.costs is None:
+            self.costs = array('f', [1.0]) * (self.width * self.height)
+        row = array('f', [cost]) * (x1 - x0)
+        #min_cost only needs a full rescan when a raised region held the old minimum
+        held_minimum = False
+        for y in range(y0, y1):
+            start = y * self.width
+            if not held_minimum and cost > self.min_cost:
+                held_minimum = min(self.costs[start + x0:start + x1]) <= self.min_cost
+            self.costs[start + x0:start + x1] = row
+        if held_minimum:
+            self.min_cost = self._scan_min_cost()
+        else:
+            self.min_cost = min(self.min_cost, row[0])
+        self._notify_costs_changed(x0, y0, x1, y1)
+    
+    def clear_costs(self):
+        self.costs = None
+        self.costs_changed()
+    
+    def cost_at(self, x: int, y: int) -> float:
+        return 1.0 if self.costs is None else self.costs[y * self.width + x]
+    
+    def cost_array(self):
+        #Zero-copy (height, width) float32 NumPy view of the cost layer (created on demand).
+        #After writing through the view, call costs_changed() so min_cost and listeners catch up
+        import numpy as np
+        if self.costs is None:
+            self.costs = array('f', [1.0]) * (self.width * self.height)
+        return np.frombuffer(self.costs, dtype=np.float32).reshape(self.height, self.width)
+    
+    def costs_changed(self, x0: int = 0, y0: int = 0, x1: Optional[int] = None, y1: Optional[int] = None):
+        #The layer may have changed anywhere (bulk load, writes through cost_array), so rescan it
+        self.min_cost = self._scan_min_cost()
+        self._notify_costs_changed(x0, y0, self.width if x1 is None else x1,
+                                   self.height if y1 is None else y1)
+    
+    def _scan_min_cost(self) -> float:
+        if not self.costs:
+            return 1.0
+        import numpy as np
+        return float(np.frombuffer(self.costs, dtype=np.float32).min())
+    
+    def _notify_costs_changed(self, x0: int, y0: int, x1: int, y1: int):
+        self.version += 1
+        #Listeners whose results depend on costs implement on_costs_changed(x0, y0, x1, y1)
+        for listener in self.edit_listeners():
+            handler = getattr(listener, 'on_costs_changed', None)
+            if handler is not None:
+                handler(x0, y0, x1, y1)
+    
+    def clearance_for(self, agent_radius: int) -> bytearray:
+        #Row-major clearance bytes valid for agent_radius; cells with value > agent_radius fit the agent
+        if self._clearance is None or self._clearance.max_clearance <= agent_radius:
+            if self._clearance is not None:
+                self.remove_edit_listener(self._clearance)
+            self._clearance = ClearanceMap(self, agent_radius + 1)
+            #Update clearance before any listener that filters cells through it
+            self.add_edit_listener(self._clearance, first=True)
+        return self._clearance.values
+    
+    def clearance_array(self, agent_radius: int = 0):
+        self.clearance_for(agent_radius)
+        return self._clearance.array()
+    
+    def snapshot(self) -> GridSnapshot:
+        #Immutable view of the current obstacles; stored as a delta on the previous snapshot when cheap
+        last = self._last_snapshot
+        if last is not None and last.version == self.version:
+            return last
+        
+        if (last is None or self._pending_edits is None or
+                last.depth >= GridSnapshot.max_chain_depth):
+            snapshot = GridSnapshot(self.width, self.height, self.version, base=bytes(self.occupancy))
+        else:
+            snapshot = GridSnapshot(self.width, self.height, self.version,
+                                    parent=last, delta=self._pending_edits)
+        
+        self._last_snapshot = snapshot
+        self._pending_edits = {}
+        return snapshot
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: GridSnapshot) -> 'Grid':
+        grid = cls(snapshot.width, snapshot.height)
+        grid.occupancy[:] = snapshot.occupancy()
+        grid.obstacles = set(snapshot.obstacle_positions())
+        return grid
+    
+    def occupancy_array(self):
+        #Zero-copy (height, width) uint8 NumPy view of the occupancy bytes
+        import numpy as np
+        return np.frombuffer(self.occupancy, dtype=np.uint8).reshape(self.height, self.width)
     
     def get_free_positions(self) -> List[Tuple[int, int]]:
         free_positions = []
@@ -45,13 +216,4 @@ class Grid:
         return len(self.obstacles) / total_cells if total_cells > 0 else 0.0
     
     def __str__(self) -> str:
-        result = []
-        for y in range(self.height):
-            row = ""
-            for x in range(self.width):
-                if self.is_obstacle(x, y):
-                    row += "█"  
-                else:
-                    row += "·" 
-            result.append(row)
-        return "\n".join(result) 
\ No newline at end of file
+        return GridSnapshot.render(self.occupancy, self.width, self.height)
\ No newline at end of file
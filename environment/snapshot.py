@@ -0,0 +1,82 @@
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class GridSnapshot:
+    #Immutable obstacle state of a Grid at a given version
+    #Either holds a full occupancy base or a small delta of cell edits on a parent snapshot
+    max_chain_depth = 32
+    max_delta_fraction = 0.125
+
+    __slots__ = ('width', 'height', 'version', 'depth', '_base', '_parent', '_delta')
+
+    _CELL_CHARS = {0: "·", 1: "█"}
+
+    def __init__(self, width: int, height: int, version: int, base: Optional[bytes] = None,
+                 parent: Optional['GridSnapshot'] = None, delta: Optional[Dict[int, int]] = None):
+        if (base is None) == (parent is None):
+            raise ValueError("Snapshot needs exactly one of base or parent")
+        self.width = width
+        self.height = height
+        self.version = version
+        self._base = base
+        self._parent = parent
+        self._delta = dict(delta) if delta else {}
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def is_obstacle(self, x: int, y: int) -> bool:
+        index = y * self.width + x
+        snapshot = self
+        while snapshot._base is None:
+            value = snapshot._delta.get(index)
+            if value is not None:
+                return value == 1
+            snapshot = snapshot._parent
+        return snapshot._base[index] == 1
+
+    def is_valid_position(self, x: int, y: int) -> bool:
+        return (0 <= x < self.width and
+                0 <= y < self.height and
+                not self.is_obstacle(x, y))
+
+    def occupancy(self) -> bytes:
+        #Materialize the full row-major occupancy by replaying deltas onto the nearest base
+        chain = []
+        snapshot = self
+        while snapshot._base is None:
+            chain.append(snapshot._delta)
+            snapshot = snapshot._parent
+        if not chain:
+            return snapshot._base
+
+        occupancy = bytearray(snapshot._base)
+        for delta in reversed(chain):
+            for index, value in delta.items():
+                occupancy[index] = value
+        return bytes(occupancy)
+
+    def obstacle_positions(self) -> Iterator[Tuple[int, int]]:
+        occupancy = self.occupancy()
+        index = occupancy.find(1)
+        while index != -1:
+            yield (index % self.width, index // self.width)
+            index = occupancy.find(1, index + 1)
+
+    def get_obstacle_density(self) -> float:
+        total_cells = self.width * self.height
+        return self.occupancy().count(1) / total_cells if total_cells > 0 else 0.0
+
+    def to_grid(self):
+        #Reopen as a mutable Grid, e.g. to replay a search on this exact map
+        from .grid import Grid
+        return Grid.from_snapshot(self)
+
+    @classmethod
+    def render(cls, occupancy, width: int, height: int) -> str:
+        text = bytes(occupancy).decode('latin-1').translate(cls._CELL_CHARS)
+        return "\n".join(text[y * width:(y + 1) * width] for y in range(height))
+
+    def __str__(self) -> str:
+        return self.render(self.occupancy(), self.width, self.height)
+
+    def __repr__(self) -> str:
+        return f"GridSnapshot({self.width}x{self.height}, version={self.version})"
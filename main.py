@@ -1,23 +1,43 @@
+import argparse
 import time
 import random
 from typing import Dict, List
-from environment import Grid, ObstacleGenerator
-from algorithms import DijkstraPathfinder, AStarPathfinder
-from analysis import PerformanceAnalyzer
-from visualization import PathPlotter
+from environment import Grid
+from algorithms import DijkstraPathfinder, AStarPathfinder, FringeSearchPathfinder
+from analysis.scenarios import ScenarioCorpus, ScenarioSpec
 
 
 class PathPlanningComparison:
-    def __init__(self, grid_size: int = 20):
+    def __init__(self, grid_size: int = 20, headless: bool = False,
+                 scenario_cache: str = "results/scenario_cache"):
         self.grid_size = grid_size
+        self.headless = headless
         self.grid = Grid(grid_size, grid_size)
         self.results = []
+        #Maps and query sets are generated once per parameter set and reloaded on later runs
+        self.corpus = ScenarioCorpus(scenario_cache)
         
         self.dijkstra = DijkstraPathfinder(self.grid)
         self.astar = AStarPathfinder(self.grid, heuristic_type="euclidean")
+        self.fringe = FringeSearchPathfinder(self.grid, heuristic_type="manhattan")
        
-        self.analyzer = PerformanceAnalyzer()
-        self.plotter = PathPlotter()
+        #Analysis and plotting pull in NumPy/matplotlib; load them only when first needed
+        self._analyzer = None
+        self._plotter = None
+    
+    @property
+    def analyzer(self):
+        if self._analyzer is None:
+            from analysis import PerformanceAnalyzer
+            self._analyzer = PerformanceAnalyzer()
+        return self._analyzer
+    
+    @property
+    def plotter(self):
+        if self._plotter is None:
+            from visualization import PathPlotter
+            self._plotter = PathPlotter(headless=self.headless)
+        return self._plotter
     
     def run_single_comparison(self, start, goal, scenario_name):
         print(f"\n--- {scenario_name} ---")
@@ -43,6 +63,15 @@ class PathPlanningComparison:
         if astar_result.found:
             print(f"  Path length: {astar_result.path_length:.2f}")
         
+        print("\nRunning Fringe Search...")
+        fringe_result = self.fringe.find_path(start, goal)
+        print(f"  Path found: {fringe_result.found}")
+        print(f"  Nodes expanded: {fringe_result.nodes_expanded}")
+        print(f"  Computation time: {fringe_result.computation_time:.4f}s")
+        print(f"  Memory usage: {fringe_result.memory_usage:.2f}MB")
+        if fringe_result.found:
+            print(f"  Path length: {fringe_result.path_length:.2f}")
+        
         if dijkstra_result.found and astar_result.found:
             node_improvement = ((dijkstra_result.nodes_expanded - astar_result.nodes_expanded) 
                               / dijkstra_result.nodes_expanded * 100)
@@ -60,15 +89,21 @@ class PathPlanningComparison:
             'goal': goal,
             'dijkstra': dijkstra_result,
             'astar': astar_result,
-            'grid_state': str(self.grid)
+            'fringe': fringe_result,
+            'grid_state': self.grid.snapshot()
         }
         self.results.append(scenario_result)
         
         if dijkstra_result.found and astar_result.found:
             print(f"\nGenerating visualization for {scenario_name}...")
-            fig = self.plotter.plot_comparison(self.grid, dijkstra_result, astar_result, start, goal)
-            
             plot_filename = f"results/plots/{scenario_name.replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'percent')}.png"
+            
+            if self.headless:
+                frame = self.plotter.render_comparison(self.grid, dijkstra_result, astar_result, start, goal)
+                self.plotter.save_frame(frame, plot_filename)
+                return
+            
+            fig = self.plotter.plot_comparison(self.grid, dijkstra_result, astar_result, start, goal)
             self.plotter.save_plot(plot_filename)
             
             self.plotter.show_plot()
@@ -77,53 +112,48 @@ class PathPlanningComparison:
         print("="*60)
         print("PATH PLANNING ALGORITHM COMPARISON")
         print("="*60)
-        print("Comparing Dijkstra vs A* algorithms")
+        print("Comparing Dijkstra, A* and Fringe Search algorithms")
         print("Analyzing: Node expansions, computation time, memory usage")
         
-        scenarios = [
-            ("Empty Grid", self.setup_empty_grid),
-            ("Random Obstacles (20%)", lambda: self.setup_random_obstacles(0.2)),
-            ("Random Obstacles (40%)", lambda: self.setup_random_obstacles(0.4)),
-            ("Maze Environment", self.setup_maze_environment),
-            ("Corridor Environment", self.setup_corridor_environment),
-        ]
-        
-        for scenario_name, setup_func in scenarios:
-            setup_func()
+        for scenario in self.corpus.scenarios(self.scenario_specs()):
+            scenario.apply_to(self.grid)
             
-            free_positions = self.grid.get_free_positions()
-            if len(free_positions) < 2:
-                print(f"Skipping {scenario_name} - insufficient free space")
+            queries = [query for query in scenario.queries() if query.bucket >= 0]
+            if not queries:
+                print(f"Skipping {scenario.name} - insufficient free space")
                 continue
             
-            start = free_positions[0]
-            goal = free_positions[-1]
-            distance = ((start[0] - goal[0]) ** 2 + (start[1] - goal[1]) ** 2) ** 0.5
-            if distance < self.grid_size * 0.3:
-                for pos in reversed(free_positions):
-                    dist = ((start[0] - pos[0]) ** 2 + (start[1] - pos[1]) ** 2) ** 0.5
-                    if dist >= self.grid_size * 0.3:
-                        goal = pos
-                        break
-            
-            self.run_single_comparison(start, goal, scenario_name)
+            #One representative long query is reported and plotted; the rest feed the summary
+            representative = max(queries, key=lambda query: query.bucket)
+            self.run_single_comparison(representative.start, representative.goal, scenario.name)
+            self.run_query_set(scenario.name, [query for query in queries if query is not representative])
         
+        print(f"\nScenario cache: {self.corpus.cache_hits} loaded, {self.corpus.cache_misses} generated")
         self.generate_summary_report()
     
-    def setup_empty_grid(self):
-        self.grid.clear_obstacles()
-    
-    def setup_random_obstacles(self, density: float):
-        self.grid.clear_obstacles()
-        ObstacleGenerator.generate_random_obstacles(self.grid, density, seed=42)
-    
-    def setup_maze_environment(self):
-        self.grid.clear_obstacles()
-        ObstacleGenerator.generate_maze_obstacles(self.grid, seed=42)
+    def scenario_specs(self) -> List[ScenarioSpec]:
+        size = self.grid_size
+        return [
+            ScenarioSpec("Empty Grid", "empty", size, size),
+            ScenarioSpec("Random Obstacles (20%)", "random", size, size, params={'density': 0.2}),
+            ScenarioSpec("Random Obstacles (40%)", "random", size, size, params={'density': 0.4}),
+            ScenarioSpec("Maze Environment", "maze", size, size),
+            ScenarioSpec("Corridor Environment", "corridor", size, size, params={'num_corridors': 3}),
+        ]
     
-    def setup_corridor_environment(self):
-        self.grid.clear_obstacles()
-        ObstacleGenerator.generate_corridor_obstacles(self.grid, num_corridors=3, seed=42)
+    def run_query_set(self, scenario_name: str, queries):
+        #Stratified queries without per-query output or plots
+        for query in queries:
+            self.results.append({
+                'scenario_name': scenario_name,
+                'start': query.start,
+                'goal': query.goal,
+                'dijkstra': self.dijkstra.find_path(query.start, query.goal),
+                'astar': self.astar.find_path(query.start, query.goal),
+                'fringe': self.fringe.find_path(query.start, query.goal),
+                'grid_state': self.grid.snapshot()
+            })
+        print(f"  Ran {len(queries)} additional stratified queries")
     
     def generate_summary_report(self):
         if not self.results:
@@ -135,6 +165,7 @@ class PathPlanningComparison:
         
         dijkstra_stats = {'nodes': [], 'time': [], 'memory': []}
         astar_stats = {'nodes': [], 'time': [], 'memory': []}
+        fringe_stats = {'nodes': [], 'time': [], 'memory': []}
         
         for result in self.results:
             if result['dijkstra'].found:
@@ -146,6 +177,11 @@ class PathPlanningComparison:
                 astar_stats['nodes'].append(result['astar'].nodes_expanded)
                 astar_stats['time'].append(result['astar'].computation_time)
                 astar_stats['memory'].append(result['astar'].memory_usage)
+            
+            if result['fringe'].found:
+                fringe_stats['nodes'].append(result['fringe'].nodes_expanded)
+                fringe_stats['time'].append(result['fringe'].computation_time)
+                fringe_stats['memory'].append(result['fringe'].memory_usage)
         
         print(f"\nDijkstra Algorithm Performance:")
         if dijkstra_stats['nodes']:
@@ -159,6 +195,12 @@ class PathPlanningComparison:
             print(f"  Average computation time: {sum(astar_stats['time'])/len(astar_stats['time']):.4f}s")
             print(f"  Average memory usage: {sum(astar_stats['memory'])/len(astar_stats['memory']):.2f}MB")
         
+        print(f"\nFringe Search Performance:")
+        if fringe_stats['nodes']:
+            print(f"  Average nodes expanded: {sum(fringe_stats['nodes'])/len(fringe_stats['nodes']):.1f}")
+            print(f"  Average computation time: {sum(fringe_stats['time'])/len(fringe_stats['time']):.4f}s")
+            print(f"  Average memory usage: {sum(fringe_stats['memory'])/len(fringe_stats['memory']):.2f}MB")
+        
         if dijkstra_stats['nodes'] and astar_stats['nodes']:
             avg_dijkstra_nodes = sum(dijkstra_stats['nodes']) / len(dijkstra_stats['nodes'])
             avg_astar_nodes = sum(astar_stats['nodes']) / len(astar_stats['nodes'])
@@ -183,24 +225,37 @@ class PathPlanningComparison:
         
         dijkstra_results = [r['dijkstra'] for r in self.results if r['dijkstra'].found]
         astar_results = [r['astar'] for r in self.results if r['astar'].found]
+        fringe_results = [r['fringe'] for r in self.results if r['fringe'].found]
         
         if dijkstra_results and astar_results:
             results_dict = {
                 'Dijkstra': dijkstra_results,
                 'A*': astar_results
             }
+            if fringe_results:
+                results_dict['Fringe Search'] = fringe_results
             
             fig = self.plotter.plot_performance_comparison(results_dict)
             
             self.plotter.save_plot("results/plots/performance_comparison.png")
             
             self.plotter.show_plot()
+        
+        self.plotter.wait_for_frames()
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Compare Dijkstra and A* path planning")
+    parser.add_argument("--headless", action="store_true",
+                        help="render frames to PNG in the background and never open windows")
+    parser.add_argument("--scenario-cache", default="results/scenario_cache",
+                        help="directory holding generated maps and query sets between runs")
+    args = parser.parse_args()
+    
     print("Initializing Path Planning Algorithm Comparison...")
     
-    comparison = PathPlanningComparison(grid_size=15)
+    comparison = PathPlanningComparison(grid_size=15, headless=args.headless,
+                                        scenario_cache=args.scenario_cache)
     
     comparison.run_comprehensive_analysis()
 
@@ -4,12 +4,22 @@ Test cases for pathfinding algorithms.
 
 import sys
 import os
+import random
+import tempfile
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from environment import Grid, ObstacleGenerator
-from algorithms import DijkstraPathfinder, AStarPathfinder
+from algorithms import (DijkstraPathfinder, AStarPathfinder, PathResult, FlowField,
+                        WavefrontPathfinder, IDAStarPathfinder, ContractionHierarchy, PathDatabase,
+                        SubgoalGraph, QuadtreePathfinder, RectangularSymmetryReduction,
+                        FringeSearchPathfinder, GridPath, line_of_sight, CSRGraph, GoalIndex)
+from analysis import ResultsStore
+
+
+#Endpoint pairs just outside a 10x10 map, each aliasing a valid flat cell index
+OFF_MAP_QUERIES = [((-1, 5), (5, 5)), ((5, 5), (10, 5)), ((5, 5), (-1, -1)), ((0, 0), (0, 10))]
 
 
 def test_basic_pathfinding():
@@ -65,13 +75,619 @@ def test_with_obstacles():
     return True
 
 
+def test_expansion_recording():
+    """Test opt-in expansion logs against the reported node counts."""
+    grid = Grid(12, 12)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.2, seed=7)
+    start, goal = (0, 0), (11, 11)
+    grid.remove_obstacle(*start)
+    grid.remove_obstacle(*goal)
+    
+    for pathfinder in [DijkstraPathfinder(grid, record_expansions=True),
+                       AStarPathfinder(grid, record_expansions=True)]:
+        result = pathfinder.find_path(start, goal)
+        log = result.expansion_log
+        
+        assert log.num_expanded == result.nodes_expanded
+        assert log.expanded_positions()[0] == start
+        assert log.num_insertions >= log.num_expanded
+        
+        heatmap = log.expansion_heatmap()
+        assert heatmap[start[1], start[0]] == 0
+        assert (heatmap >= 0).sum() == result.nodes_expanded
+        assert log.insertion_heatmap().sum() == log.num_insertions
+    
+    assert DijkstraPathfinder(grid).find_path(start, goal).expansion_log is None
+
+
+def test_flow_field_matches_dijkstra():
+    """Test flow field costs and paths, including incremental repair after edits."""
+    grid = Grid(14, 14)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.25, seed=9)
+    goal = (13, 13)
+    grid.remove_obstacle(*goal)
+    
+    flow_field = FlowField(grid, goal)
+    dijkstra = DijkstraPathfinder(grid)
+    rng = random.Random(2)
+    
+    for _ in range(20):
+        x, y = rng.randrange(grid.width), rng.randrange(grid.height)
+        if (x, y) == goal:
+            continue
+        if grid.is_obstacle(x, y):
+            grid.remove_obstacle(x, y)
+        else:
+            grid.add_obstacle(x, y)
+        
+        #Fields built inside the loop are dropped again, so only flow_field keeps following edits
+        fresh = FlowField(grid, goal)
+        assert list(flow_field.costs) == list(fresh.costs)
+        assert grid.edit_listeners() == [flow_field, fresh]
+        
+        for start in [(0, 0), (5, 2), (2, 11)]:
+            if not grid.is_valid_position(*start):
+                continue
+            expected = dijkstra.find_path(start, goal)
+            result = flow_field.find_path(start, goal)
+            assert result.found == expected.found
+            assert result.path_length == expected.path_length
+            if result.found:
+                assert result.path[0] == start and result.path[-1] == goal
+    
+    agents = flow_field.step_agents([goal, (0, 0), (-1, 3)])
+    assert agents[0] == goal and agents[2] == (-1, 3)
+    for start in [(-1, 5), (14, 0), (3, -2)]:
+        assert not flow_field.find_path(start, goal).found
+        assert flow_field.cost_to_goal(start) == float('inf')
+    
+    with FlowField(grid, goal) as scoped:
+        assert grid.edit_listeners() == [flow_field, fresh, scoped]
+    assert grid.edit_listeners() == [flow_field, fresh]
+    del fresh
+    assert grid.edit_listeners() == [flow_field]
+
+
+def test_wavefront_matches_dijkstra():
+    """Test that the vectorized BFS finds paths as short as Dijkstra's."""
+    for density, seed in [(0.0, 1), (0.3, 4), (0.45, 8)]:
+        grid = Grid(25, 20)
+        ObstacleGenerator.generate_random_obstacles(grid, density, seed=seed)
+        start, goal = (0, 0), (24, 19)
+        grid.remove_obstacle(*start)
+        grid.remove_obstacle(*goal)
+        
+        expected = DijkstraPathfinder(grid).find_path(start, goal)
+        result = WavefrontPathfinder(grid).find_path(start, goal)
+        
+        assert result.found == expected.found
+        assert result.path_length == expected.path_length
+        if result.found:
+            assert result.path[0] == start and result.path[-1] == goal
+            assert all(grid.is_valid_position(x, y) for x, y in result.path)
+        
+        distances = WavefrontPathfinder(grid).distance_field(start)
+        assert (distances >= 0).sum() == len(_reachable_cells(grid, start))
+    
+    #Off-map coordinates must not wrap around to the far edge of the distance field
+    wavefront = WavefrontPathfinder(Grid(10, 10))
+    for start, goal in [((0, 0), (-1, -1)), ((0, 0), (10, 0)), ((-1, 0), (9, 0))]:
+        result = wavefront.find_path(start, goal)
+        assert not result.found and result.path == []
+
+
+def _reachable_cells(grid, start):
+    seen = {start}
+    stack = [start]
+    pathfinder = DijkstraPathfinder(grid)
+    while stack:
+        for neighbor, _ in pathfinder.get_neighbors(stack.pop()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def test_ida_star_memory_bounded():
+    """Test that IDA* stays optimal with a tiny transposition table."""
+    grid = Grid(12, 12)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.25, seed=42)
+    start, goal = (0, 0), (11, 11)
+    grid.remove_obstacle(*start)
+    grid.remove_obstacle(*goal)
+    
+    expected = AStarPathfinder(grid).find_path(start, goal)
+    for table_size in [8, 100000]:
+        #Without the reachability pre-pass the table cap is a hard ceiling
+        ida_star = IDAStarPathfinder(grid, max_table_size=table_size, reachability_check=False)
+        result = ida_star.find_path(start, goal)
+        
+        assert result.found == expected.found
+        assert result.path_length == expected.path_length
+        assert ida_star.peak_stored_nodes <= table_size + len(result.path)
+    
+    grid.add_obstacle(11, 10)
+    grid.add_obstacle(10, 11)
+    assert not IDAStarPathfinder(grid).find_path(start, goal).found
+    
+    #Unreachable goals are rejected before any deepening, however small the table
+    walled = Grid(20, 20)
+    for x in range(20):
+        walled.add_obstacle(x, 10)
+    ida_star = IDAStarPathfinder(walled, max_table_size=20)
+    result = ida_star.find_path((0, 0), (19, 19))
+    assert not result.found and ida_star.iterations == 0
+    #The pre-pass work shows up in the stats: every cell of the upper half is visited once
+    assert result.nodes_expanded == 200 and ida_star.peak_stored_nodes > 0
+
+
+def test_contraction_hierarchy_queries():
+    """Test hierarchy queries against Dijkstra, before and after a save/load roundtrip."""
+    grid = Grid(20, 20)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.25, seed=5)
+    hierarchy = ContractionHierarchy(grid)
+    hierarchy.build()
+    assert hierarchy.preprocessing_time > 0
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "grid.ch")
+        hierarchy.save(filename)
+        loaded = ContractionHierarchy.load(filename, grid)
+        
+        other_grid = Grid(20, 20)
+        try:
+            ContractionHierarchy.load(filename, other_grid)
+            assert False, "loading against a different map should fail"
+        except ValueError:
+            pass
+    
+    dijkstra = DijkstraPathfinder(grid)
+    free_positions = grid.get_free_positions()
+    rng = random.Random(3)
+    for _ in range(40):
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = dijkstra.find_path(start, goal)
+        for pathfinder in [hierarchy, loaded]:
+            result = pathfinder.find_path(start, goal)
+            assert result.found == expected.found
+            assert result.path_length == expected.path_length
+            if result.found:
+                assert result.path[0] == start and result.path[-1] == goal
+                assert all(abs(x1 - x2) + abs(y1 - y2) == 1
+                           for (x1, y1), (x2, y2) in zip(result.path, result.path[1:]))
+    
+    #Off-map endpoints must not alias cells on the other side of the map
+    open_hierarchy = ContractionHierarchy(Grid(10, 10))
+    for start, goal in OFF_MAP_QUERIES:
+        assert not open_hierarchy.find_path(start, goal).found
+
+
+def test_path_database_queries():
+    """Test first-move table queries, parallel build and save/load."""
+    grid = Grid(16, 16)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.3, seed=12)
+    database = PathDatabase(grid)
+    database.build(workers=2, chunk_size=40)
+    assert database.compression_ratio > 1
+    
+    serial = PathDatabase(grid)
+    serial.build(workers=1)
+    assert serial.run_starts == database.run_starts
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "grid.cpd")
+        database.save(filename)
+        loaded = PathDatabase.load(filename, grid)
+    
+    dijkstra = DijkstraPathfinder(grid)
+    free_positions = grid.get_free_positions()
+    rng = random.Random(8)
+    for _ in range(40):
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = dijkstra.find_path(start, goal)
+        result = loaded.find_path(start, goal)
+        assert result.found == expected.found
+        assert result.path_length == expected.path_length
+        if result.found:
+            assert result.path[-1] == goal
+            assert all(grid.is_valid_position(x, y) for x, y in result.path)
+    
+    open_database = PathDatabase(Grid(10, 10))
+    for start, goal in OFF_MAP_QUERIES:
+        assert not open_database.find_path(start, goal).found
+
+
+def test_subgoal_graph_incremental():
+    """Test subgoal graph queries stay optimal while obstacles are edited."""
+    grid = Grid(20, 20)
+    ObstacleGenerator.generate_clustered_obstacles(grid, num_clusters=6, seed=4)
+    subgoal_graph = SubgoalGraph(grid)
+    dijkstra = DijkstraPathfinder(grid)
+    rng = random.Random(6)
+    
+    for step in range(30):
+        x, y = rng.randrange(grid.width), rng.randrange(grid.height)
+        if grid.is_obstacle(x, y):
+            grid.remove_obstacle(x, y)
+        else:
+            grid.add_obstacle(x, y)
+        
+        free_positions = grid.get_free_positions()
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = dijkstra.find_path(start, goal)
+        result = subgoal_graph.find_path(start, goal)
+        assert result.found == expected.found
+        assert result.path_length == expected.path_length
+        if result.found:
+            assert result.path[0] == start and result.path[-1] == goal
+            assert all(grid.is_valid_position(px, py) for px, py in result.path)
+    
+    with SubgoalGraph(grid) as rebuilt:
+        assert rebuilt.subgoals == subgoal_graph.subgoals
+        assert rebuilt.edges == subgoal_graph.edges
+        #Disconnected subgoals leave no stale coverage behind
+        assert rebuilt._coverage == subgoal_graph._coverage
+    assert rebuilt not in grid.edit_listeners()
+
+
+def test_quadtree_decomposition():
+    """Test quadtree paths are valid, near-optimal and survive incremental edits."""
+    grid = Grid(32, 32)
+    quadtree = QuadtreePathfinder(grid)
+    assert len(quadtree.leaves) == 1
+    open_result = quadtree.find_path((0, 0), (31, 31))
+    assert open_result.path_length == 62
+    assert open_result.nodes_expanded < AStarPathfinder(grid).find_path((0, 0), (31, 31)).nodes_expanded
+    
+    ObstacleGenerator.generate_random_obstacles(grid, 0.15, seed=21)
+    dijkstra = DijkstraPathfinder(grid)
+    rng = random.Random(21)
+    for _ in range(30):
+        x, y = rng.randrange(grid.width), rng.randrange(grid.height)
+        if grid.is_obstacle(x, y):
+            grid.remove_obstacle(x, y)
+        else:
+            grid.add_obstacle(x, y)
+        
+        free_positions = grid.get_free_positions()
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = dijkstra.find_path(start, goal)
+        result = quadtree.find_path(start, goal)
+        assert result.found == expected.found
+        if result.found:
+            assert expected.path_length <= result.path_length <= 1.5 * expected.path_length + 2
+            assert result.path[0] == start and result.path[-1] == goal
+            assert all(grid.is_valid_position(px, py) for px, py in result.path)
+    
+    with QuadtreePathfinder(grid) as rebuilt:
+        assert sorted(rebuilt.leaves.values()) == sorted(quadtree.leaves.values())
+    assert rebuilt not in grid.edit_listeners()
+
+
+def test_rectangular_symmetry_reduction():
+    """Test RSR as a neighbour provider keeps both pathfinders optimal across edits."""
+    grid = Grid(24, 24)
+    ObstacleGenerator.generate_clustered_obstacles(grid, num_clusters=5, seed=2)
+    rsr = RectangularSymmetryReduction(grid)
+    dijkstra = DijkstraPathfinder(grid)
+    pruned = [DijkstraPathfinder(grid, neighbor_provider=rsr),
+              AStarPathfinder(grid, neighbor_provider=rsr)]
+    rng = random.Random(2)
+    
+    for step in range(30):
+        if step % 2 == 0:
+            x, y = rng.randrange(grid.width), rng.randrange(grid.height)
+            if grid.is_obstacle(x, y):
+                grid.remove_obstacle(x, y)
+            else:
+                grid.add_obstacle(x, y)
+        
+        free_positions = grid.get_free_positions()
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = dijkstra.find_path(start, goal)
+        for pathfinder in pruned:
+            result = pathfinder.find_path(start, goal)
+            assert result.found == expected.found
+            assert result.path_length == expected.path_length
+            if result.found:
+                assert result.path[0] == start and result.path[-1] == goal
+                assert all(abs(x1 - x2) + abs(y1 - y2) == 1
+                           for (x1, y1), (x2, y2) in zip(result.path, result.path[1:]))
+    
+    open_grid = Grid(30, 30)
+    with RectangularSymmetryReduction(open_grid) as open_rsr:
+        result = DijkstraPathfinder(open_grid, neighbor_provider=open_rsr).find_path((5, 5), (29, 29))
+    assert result.path_length == 48
+    assert result.nodes_expanded < DijkstraPathfinder(open_grid).find_path((5, 5), (29, 29)).nodes_expanded / 4
+    assert open_grid.edit_listeners() == []
+    
+    #Freed cells are merged back, so edits that are undone do not fragment the map
+    with RectangularSymmetryReduction(open_grid) as open_rsr:
+        for y in range(open_grid.height):
+            open_grid.add_obstacle(15, y)
+        assert len(open_rsr.rects) == 2
+        for y in range(open_grid.height):
+            open_grid.remove_obstacle(15, y)
+        assert len(open_rsr.rects) == 1
+        
+        try:
+            DijkstraPathfinder(open_grid, agent_radius=1, neighbor_provider=open_rsr)
+            assert False, "a radius would be ignored by the neighbour provider"
+        except ValueError:
+            pass
+    
+    #A discarded provider is not rebuilt on later edits
+    rsr.detach()
+    RectangularSymmetryReduction(grid)
+    assert grid.edit_listeners() == []
+
+
+def test_find_path_to_any():
+    """Test multi-goal searches against one search per goal."""
+    grid = Grid(40, 40)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.25, seed=17)
+    rng = random.Random(5)
+    dijkstra = DijkstraPathfinder(grid)
+    searches = [dijkstra] + [AStarPathfinder(grid, heuristic) for heuristic in
+                             ("euclidean", "manhattan", "diagonal")]
+    
+    for _ in range(10):
+        free_positions = grid.get_free_positions()
+        start = rng.choice(free_positions)
+        goals = rng.sample(free_positions, 12)
+        lengths = [dijkstra.find_path(start, goal) for goal in goals]
+        best = min((result.path_length for result in lengths if result.found), default=None)
+        for pathfinder in searches:
+            result = pathfinder.find_path_to_any(start, goals)
+            if best is None:
+                assert not result.found
+                continue
+            assert result.found and result.goal in goals
+            assert result.path[0] == start and result.path[-1] == result.goal
+            assert abs(result.path_length - best) < 1e-9
+    
+    open_grid = Grid(60, 60)
+    goals = [(59, y) for y in range(60)]
+    one_goal = AStarPathfinder(open_grid).find_path((0, 30), (59, 30))
+    any_goal = AStarPathfinder(open_grid).find_path_to_any((0, 30), goals)
+    assert any_goal.path_length == one_goal.path_length
+    assert any_goal.nodes_expanded <= 2 * one_goal.nodes_expanded
+
+
+def test_find_path_to_any_with_costs():
+    """Test that multi-goal A* stays optimal when cells cost less than one."""
+    grid = Grid(48, 48)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.2, seed=79)
+    grid.set_cost_region(0, 0, 48, 48, 0.5)
+    grid.set_cost_region(10, 10, 30, 30, 2.0)
+    rng = random.Random(79)
+    dijkstra = DijkstraPathfinder(grid)
+    searches = [AStarPathfinder(grid, heuristic) for heuristic in ("euclidean", "manhattan", "diagonal")]
+    
+    for _ in range(10):
+        free_positions = grid.get_free_positions()
+        start = rng.choice(free_positions)
+        goals = rng.sample(free_positions, 8)
+        expected = dijkstra.find_path_to_any(start, goals)
+        for pathfinder in searches:
+            result = pathfinder.find_path_to_any(start, goals)
+            assert result.found == expected.found
+            if result.found:
+                assert abs(result.path_cost - expected.path_cost) < 1e-6
+    
+    #The index works on unscaled distances, so a scaled heuristic cannot end its scan early
+    goal_index = GoalIndex([(0, 15), (16, 7)], lambda a, b: ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5)
+    assert goal_index.nearest((7, 7)) == ((16, 7), 9.0)
+
+
+def test_grid_path():
+    """Test the compact path type, compression and smoothing."""
+    grid = Grid(30, 30)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.2, seed=23)
+    free_positions = grid.get_free_positions()
+    start, goal = free_positions[0], free_positions[-1]
+    result = AStarPathfinder(grid).find_path(start, goal)
+    assert result.found
+    
+    path = result.path
+    assert isinstance(path, GridPath)
+    assert path[0] == start and path[-1] == goal
+    assert path == list(path) and len(path.to_list()) == len(path)
+    assert path.coords().shape == (len(path), 2)
+    assert path.nbytes == 8 * len(path)
+    assert path.is_valid(grid)
+    assert abs(path.length() - (len(path) - 1)) < 1e-9
+    
+    for mode in ("waypoints", "runs"):
+        compressed = path.compress(mode)
+        assert compressed.expand() == path
+        assert compressed.nbytes <= path.nbytes
+    
+    smoothed = path.smooth(grid)
+    assert smoothed[0] == start and smoothed[-1] == goal
+    assert smoothed.length() <= path.length() + 1e-9
+    assert all(line_of_sight(grid, a, b) for a, b in zip(smoothed, smoothed[1:]))
+    
+    open_grid = Grid(10, 10)
+    straight = GridPath.from_points([(0, y) for y in range(10)] + [(x, 9) for x in range(1, 10)])
+    assert straight.compress().expand() == straight
+    assert len(straight.compress().data) == 6
+    assert straight.smooth(open_grid) == [(0, 0), (9, 9)]
+    open_grid.add_obstacle(4, 4)
+    assert len(straight.smooth(open_grid)) > 2
+    assert not GridPath.from_points([(0, 0), (1, 1)]).is_valid(open_grid)
+    assert GridPath.from_points([(0, 0), (1, 1)]).is_valid(open_grid, diagonal=True)
+    assert path[2:5] == path.to_list()[2:5] and path[::-3] == path.to_list()[::-3]
+
+
+def test_grid_path_rejects_non_unit_steps():
+    """Test that compression refuses paths it could not expand back, e.g. smoothed ones."""
+    for points in ([(0, 0), (9, 3)], [(0, 0), (1, 0), (3, 0)], [(2, 2), (2, 2)]):
+        for mode in ("waypoints", "runs"):
+            try:
+                GridPath.from_points(points).compress(mode)
+                assert False, "non-unit step should not compress"
+            except ValueError:
+                pass
+
+
+def test_csr_graph_backend():
+    """Test Dijkstra and A* on CSR graphs against grid searches and across file formats."""
+    grid = Grid(25, 25)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.25, seed=31)
+    graph = CSRGraph.from_grid(grid)
+    rng = random.Random(8)
+    for _ in range(15):
+        free_positions = grid.get_free_positions()
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = DijkstraPathfinder(grid).find_path(start, goal)
+        node_start, node_goal = start[1] * 25 + start[0], goal[1] * 25 + goal[0]
+        for pathfinder in (DijkstraPathfinder(graph), AStarPathfinder(graph, record_expansions=True)):
+            result = pathfinder.find_path(node_start, node_goal)
+            assert result.found == expected.found
+            assert result.path_length == expected.path_length
+            if result.found:
+                assert result.path[0] == node_start and result.path[-1] == node_goal
+            if result.expansion_log is not None:
+                log = result.expansion_log
+                assert log.graph and log.expansion_heatmap().shape == (graph.num_nodes,)
+                assert all(isinstance(node, int) for node in log.expanded_positions())
+    
+    #Weighted road-like graph: random points joined to nearby points, weights >= distance
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+    sources, targets, weights = [], [], []
+    for u, (x1, y1) in enumerate(points):
+        for v, (x2, y2) in enumerate(points):
+            distance = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+            if u < v and distance < 15:
+                sources.append(u)
+                targets.append(v)
+                weights.append(distance * rng.uniform(1.0, 2.0))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        edge_file, coordinate_file = os.path.join(tmp, "edges.txt"), os.path.join(tmp, "nodes.txt")
+        with open(edge_file, "w") as f:
+            f.write("# source target weight\n")
+            f.writelines(f"{u} {v} {w}\n" for u, v, w in zip(sources, targets, weights))
+        with open(coordinate_file, "w") as f:
+            f.writelines(f"{x} {y}\n" for x, y in points)
+        road = CSRGraph.from_edge_list(edge_file, directed=False, coordinates_file=coordinate_file)
+        assert road.num_nodes == 200 and road.num_edges == 2 * len(sources)
+        
+        road.save(os.path.join(tmp, "road.csr"))
+        mapped = CSRGraph.load(os.path.join(tmp, "road.csr"))
+        assert isinstance(mapped.offsets, memoryview)
+        assert list(mapped.targets) == list(road.targets)
+        
+        for _ in range(20):
+            start, goal = rng.randrange(200), rng.randrange(200)
+            expected = DijkstraPathfinder(road).find_path(start, goal)
+            for pathfinder in (DijkstraPathfinder(mapped), AStarPathfinder(mapped)):
+                result = pathfinder.find_path(start, goal)
+                assert result.found == expected.found
+                assert abs(result.path_length - expected.path_length) < 1e-6
+            if expected.found:
+                assert AStarPathfinder(road).find_path(start, goal).nodes_expanded <= expected.nodes_expanded
+        #Release the memory map before the directory is removed
+        del mapped, pathfinder, result
+    
+    #Node-id paths survive the columnar results store alongside grid paths
+    store = ResultsStore(capacity=1)
+    graph_result = DijkstraPathfinder(road).find_path(0, 1)
+    grid_result = DijkstraPathfinder(grid).find_path(*grid.get_free_positions()[:2])
+    for path in ([0, 1, 2], [0, 1, 2, 3]):
+        store.append(PathResult(path, 3.0, 4, 0.0, 0.0, "Dijkstra (CSR)"))
+    store.extend([graph_result, grid_result])
+    assert store.get_path(0) == [0, 1, 2] and store.get_path(1) == [0, 1, 2, 3]
+    assert store.get_path(2) == list(graph_result.path)
+    assert store.get_path(3) == list(grid_result.path)
+    
+    #Graph goals are bucketed by their coordinates for the multi-goal heuristic
+    for _ in range(10):
+        start, goals = rng.randrange(200), rng.sample(range(200), 25)
+        expected = DijkstraPathfinder(road).find_path_to_any(start, goals)
+        result = AStarPathfinder(road).find_path_to_any(start, goals)
+        assert result.found == expected.found
+        if result.found:
+            assert result.goal in goals and abs(result.path_length - expected.path_length) < 1e-6
+
+
+def test_fringe_search():
+    """Test Fringe Search against A* on grids, cost layers, providers and graphs."""
+    grid = Grid(30, 30)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.3, seed=41)
+    rng = random.Random(3)
+    for step in range(3):
+        if step == 1:
+            grid.set_cost_region(5, 5, 25, 20, 2.5)
+        for heuristic in ("manhattan", "euclidean", "diagonal"):
+            astar = AStarPathfinder(grid, heuristic)
+            fringe = FringeSearchPathfinder(grid, heuristic, record_expansions=True)
+            for _ in range(5):
+                free_positions = grid.get_free_positions()
+                start, goal = rng.choice(free_positions), rng.choice(free_positions)
+                expected = astar.find_path(start, goal)
+                result = fringe.find_path(start, goal)
+                assert result.found == expected.found
+                if result.found:
+                    assert abs(result.path_cost - expected.path_cost) < 1e-6
+                    assert result.path[0] == start and result.path[-1] == goal
+                    assert result.expansion_log.num_expanded == result.nodes_expanded
+        grid.clear_costs()
+    
+    rsr = RectangularSymmetryReduction(grid)
+    graph = CSRGraph.from_grid(grid)
+    free_positions = grid.get_free_positions()
+    for _ in range(5):
+        start, goal = rng.choice(free_positions), rng.choice(free_positions)
+        expected = AStarPathfinder(grid).find_path(start, goal)
+        pruned = FringeSearchPathfinder(grid, neighbor_provider=rsr).find_path(start, goal)
+        assert pruned.found == expected.found and pruned.path_length == expected.path_length
+        on_graph = FringeSearchPathfinder(graph).find_path(start[1] * 30 + start[0], goal[1] * 30 + goal[0])
+        assert on_graph.found == expected.found and on_graph.path_length == expected.path_length
+    
+    assert FringeSearchPathfinder(grid).find_path(start, start).path == [start]
+    
+    #Multi-goal queries run the fringe loop, not the inherited heap-based A*
+    fringe = FringeSearchPathfinder(grid)
+    for _ in range(5):
+        goals = rng.sample(free_positions, 4)
+        start = rng.choice(free_positions)
+        expected = AStarPathfinder(grid).find_path_to_any(start, goals)
+        result = fringe.find_path_to_any(start, goals)
+        assert result.found == expected.found and result.algorithm_name == "Fringe Search"
+        if result.found:
+            assert fringe.iterations > 0 and result.goal in goals
+            assert abs(result.path_cost - expected.path_cost) < 1e-6
+            assert result.path[0] == start and result.path[-1] == result.goal
+    assert not fringe.find_path((0, 0), (30, 0)).found
+    open_fringe = FringeSearchPathfinder(Grid(10, 10))
+    for start, goal in OFF_MAP_QUERIES:
+        assert not open_fringe.find_path(start, goal).found
+
+
 if __name__ == '__main__':
     print("Running pathfinding algorithm tests...")
     
     success1 = test_basic_pathfinding()
     success2 = test_with_obstacles()
+    test_expansion_recording()
+    test_flow_field_matches_dijkstra()
+    test_wavefront_matches_dijkstra()
+    test_ida_star_memory_bounded()
+    test_contraction_hierarchy_queries()
+    test_path_database_queries()
+    test_subgoal_graph_incremental()
+    test_quadtree_decomposition()
+    test_rectangular_symmetry_reduction()
+    test_find_path_to_any()
+    test_find_path_to_any_with_costs()
+    test_grid_path()
+    test_grid_path_rejects_non_unit_steps()
+    test_csr_graph_backend()
+    test_fringe_search()
     
     if success1 and success2:
         print("\nAll tests passed! ✓")
     else:
-        print("\nSome tests failed! ✗") 
\ No newline at end of file
+        print("\nSome tests failed! ✗") 
@@ -0,0 +1,142 @@
+"""
+Test cases for performance analysis and result storage.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import PathResult
+from analysis import PerformanceAnalyzer, ResultsStore
+
+
+def _make_results():
+    return [
+        PathResult([(0, 0), (0, 1), (1, 1)], 2.0, 10, 0.01, 0.5, "Dijkstra"),
+        PathResult([(0, 0), (1, 0), (1, 1)], 2.0, 4, 0.005, 0.25, "A*"),
+        PathResult([], 0.0, 30, 0.02, 0.0, "Dijkstra", found=False),
+        PathResult([(2, 2), (2, 3)], 1.0, 6, 0.004, 0.1, "Dijkstra"),
+    ]
+
+
+def test_results_store_roundtrip():
+    """Test columnar storage, npz export and memory-mapped reload."""
+    store = ResultsStore(capacity=1)
+    store.extend(_make_results())
+    
+    assert len(store) == 4
+    assert store.get_result(0) == _make_results()[0]
+    assert store.get_path(2) == []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        npz_file = os.path.join(tmp, "results.npz")
+        store.save_npz(npz_file)
+        assert ResultsStore.load_npz(npz_file).to_results() == _make_results()
+        
+        store.save_arrays(os.path.join(tmp, "columns"))
+        mapped = ResultsStore.load_arrays(os.path.join(tmp, "columns"))
+        assert mapped.to_results() == _make_results()
+        
+        #Appending to a memory-mapped store copies it into writable memory
+        mapped.append(_make_results()[1])
+        assert len(mapped) == 5
+        assert mapped.get_result(4) == _make_results()[1]
+        del mapped
+
+
+def test_results_store_keeps_cost_and_goal():
+    """Test that weighted path costs and reached goals survive the store."""
+    weighted = PathResult([(0, 0), (0, 1)], 1.0, 3, 0.001, 0.0, "A*", goal=(0, 1), path_cost=12.0)
+    graph = PathResult([4, 7], 2.5, 2, 0.001, 0.0, "A* (CSR)", goal=7, path_cost=2.5)
+    analyzer = PerformanceAnalyzer()
+    analyzer.add_results(_make_results() + [weighted, graph])
+    
+    results = analyzer.results
+    assert results[-2] == weighted and results[-1] == graph
+    assert results[0].path_cost is None and results[0].goal is None
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        npz_file = os.path.join(tmp, "results.npz")
+        analyzer.store.save_npz(npz_file)
+        assert ResultsStore.load_npz(npz_file).to_results()[-2:] == [weighted, graph]
+    
+    #The snapshot cannot be appended to, so results never silently miss the store
+    try:
+        analyzer.results.append(weighted)
+        assert False, "results should be read-only"
+    except AttributeError:
+        pass
+    analyzer.add_result(weighted)
+    assert len(analyzer.results) == len(results) + 1 == len(analyzer.store)
+
+
+def test_vectorized_analysis():
+    """Test that analysis reductions match the per-result definitions."""
+    analyzer = PerformanceAnalyzer()
+    analyzer.add_results(_make_results())
+    
+    analysis = analyzer.analyze_algorithm_performance("Dijkstra")
+    assert analysis['total_runs'] == 3
+    assert analysis['successful_runs'] == 2
+    assert analysis['nodes_expanded']['mean'] == 8
+    assert analysis['nodes_expanded']['min'] == 6
+    assert analysis['path_length']['median'] == 1.5
+    
+    comparison = analyzer.compare_algorithms("Dijkstra", "A*")
+    assert comparison['nodes_expanded_improvement']['algorithm2_vs_algorithm1_percent'] == 50.0
+    
+    efficiency = analyzer.get_efficiency_metrics("Dijkstra")
+    assert efficiency['avg_path_efficiency'] == 5.5
+    assert analyzer.analyze_algorithm_performance("Unknown") == {}
+    assert "A* Performance" in analyzer.generate_summary_report()
+
+
+def test_core_imports_stay_light():
+    """Test that the planning core imports without third-party packages."""
+    from analysis.import_time import measure_import_time
+    
+    report = measure_import_time(repeats=1)
+    assert report['heavy_modules_loaded'] == []
+    assert report['median_seconds'] > 0
+    
+    report = measure_import_time(('analysis', 'visualization'), repeats=1)
+    assert report['heavy_modules_loaded'] == []
+
+
+def test_scenario_corpus_cache():
+    """Test stratified query generation and the on-disk scenario cache."""
+    import tempfile
+    from analysis import ScenarioCorpus, ScenarioSpec
+    from algorithms import DijkstraPathfinder
+    
+    specs = [ScenarioSpec("Random", "random", 24, 24, seed=3, params={'density': 0.35}),
+             ScenarioSpec("Corridor", "corridor", 24, 24, seed=3)]
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = ScenarioCorpus(tmp, num_buckets=3, queries_per_bucket=4, unreachable_queries=2)
+        first = list(corpus.scenarios(specs))
+        assert corpus.cache_misses == 2 and corpus.cache_hits == 0
+        
+        reloaded = ScenarioCorpus(tmp, num_buckets=3, queries_per_bucket=4, unreachable_queries=2)
+        second = list(reloaded.scenarios(specs))
+        assert reloaded.cache_hits == 2 and reloaded.cache_misses == 0
+        for a, b in zip(first, second):
+            assert a.occupancy == b.occupancy
+            assert list(a.queries()) == list(b.queries())
+        
+        #A different seed or sampling setting is a different cache entry
+        other = ScenarioSpec("Random", "random", 24, 24, seed=4, params={'density': 0.35})
+        assert corpus.cache_key(other) != corpus.cache_key(specs[0])
+        assert ScenarioCorpus(tmp, num_buckets=2).cache_key(specs[0]) != corpus.cache_key(specs[0])
+        
+        scenario = first[0]
+        grid = scenario.to_grid()
+        queries = list(scenario.queries())
+        assert sum(1 for query in queries if query.bucket >= 0) <= 3 * 4
+        assert {query.bucket for query in queries} <= {-1, 0, 1, 2}
+        dijkstra = DijkstraPathfinder(grid)
+        for query in queries:
+            assert not grid.is_obstacle(*query.start) and not grid.is_obstacle(*query.goal)
+            assert dijkstra.find_path(query.start, query.goal).found == (query.bucket >= 0)
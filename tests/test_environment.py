@@ -0,0 +1,185 @@
+"""
+Test cases for grid environments.
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from environment import Grid, ObstacleGenerator, GridSnapshot
+from algorithms import AStarPathfinder
+
+
+def test_grid_snapshots():
+    """Test that snapshots are immutable, chained as deltas and replayable."""
+    grid = Grid(10, 8)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.2, seed=3)
+    base = grid.snapshot()
+    base_text = str(grid)
+    assert grid.snapshot() is base
+    
+    history = [base]
+    for step in range(5):
+        grid.add_obstacle(step, 7)
+        grid.remove_obstacle(*next(iter(grid.obstacles)))
+        history.append(grid.snapshot())
+    
+    assert history[-1].depth == 5
+    assert [s.version for s in history] == sorted(set(s.version for s in history))
+    assert str(base) == base_text
+    assert str(history[-1]) == str(grid)
+    assert set(history[-1].obstacle_positions()) == grid.obstacles
+    assert history[-1].is_obstacle(4, 7)
+    
+    replay = base.to_grid()
+    assert replay.obstacles != grid.obstacles
+    assert str(replay) == base_text
+    assert AStarPathfinder(replay).find_path((0, 0), (0, 0)).found
+
+
+def test_snapshot_chain_rebases():
+    """Test that long delta chains and bulk edits fall back to a full base."""
+    grid = Grid(6, 6)
+    grid.snapshot()
+    for i in range(GridSnapshot.max_chain_depth + 1):
+        if (0, 0) in grid.obstacles:
+            grid.remove_obstacle(0, 0)
+        else:
+            grid.add_obstacle(0, 0)
+        assert grid.snapshot().depth == (i + 1) % (GridSnapshot.max_chain_depth + 1)
+    
+    grid.clear_obstacles()
+    assert grid.snapshot().depth == 0
+    assert str(grid.snapshot()) == "\n".join(["······"] * 6)
+
+
+def _brute_force_clearance(grid, cap):
+    values = {}
+    for x in range(grid.width):
+        for y in range(grid.height):
+            if grid.is_obstacle(x, y):
+                values[(x, y)] = 0
+                continue
+            # Distance to the map edge counts as distance to an obstacle
+            best = min(x + 1, y + 1, grid.width - x, grid.height - y)
+            for ox, oy in grid.obstacles:
+                best = min(best, max(abs(ox - x), abs(oy - y)))
+            values[(x, y)] = min(best, cap)
+    return values
+
+
+def test_clearance_map_incremental():
+    """Test that incremental clearance updates match a full recomputation."""
+    import random
+    
+    grid = Grid(17, 13)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.1, seed=11)
+    clearance = grid.clearance_array(agent_radius=2)
+    
+    rng = random.Random(5)
+    for _ in range(25):
+        x, y = rng.randrange(grid.width), rng.randrange(grid.height)
+        if grid.is_obstacle(x, y):
+            grid.remove_obstacle(x, y)
+        else:
+            grid.add_obstacle(x, y)
+        
+        expected = _brute_force_clearance(grid, 3)
+        assert all(clearance[y, x] == value for (x, y), value in expected.items())
+    
+    grid.clear_obstacles()
+    assert clearance.max() == 3
+
+
+def test_agent_radius_pathfinding():
+    """Test that large agents route around gaps they cannot fit through."""
+    from algorithms import DijkstraPathfinder
+    
+    grid = Grid(15, 15)
+    for y in range(15):
+        if y != 7:
+            grid.add_obstacle(7, y)
+    for y in range(0, 15, 14):
+        grid.remove_obstacle(7, y)
+    
+    for pathfinder_cls in [DijkstraPathfinder, AStarPathfinder]:
+        small = pathfinder_cls(grid).find_path((3, 7), (11, 7))
+        large = pathfinder_cls(grid, agent_radius=1).find_path((3, 7), (11, 7))
+        
+        assert small.found and small.path_length == 8
+        # The one-cell gap in the middle is too tight and edge gaps touch the map border
+        assert not large.found
+        
+        grid.remove_obstacle(7, 6)
+        grid.remove_obstacle(7, 8)
+        wide = pathfinder_cls(grid, agent_radius=1).find_path((3, 7), (11, 7))
+        assert wide.found and wide.path_length == 8
+        grid.add_obstacle(7, 6)
+        grid.add_obstacle(7, 8)
+
+
+def test_cost_layer():
+    """Test bulk and regional cost edits and the listeners that depend on them."""
+    import random
+    import numpy as np
+    from algorithms import DijkstraPathfinder, IDAStarPathfinder, FlowField, ContractionHierarchy
+    
+    grid = Grid(20, 20)
+    ObstacleGenerator.generate_random_obstacles(grid, 0.2, seed=12)
+    rng = np.random.default_rng(4)
+    grid.set_costs(rng.choice([1.0, 1.5, 3.0], size=(20, 20)))
+    assert grid.min_cost == 1.0
+    assert grid.cost_array().dtype == np.float32
+    assert grid.cost_at(3, 2) == grid.cost_array()[2, 3]
+    
+    field = FlowField(grid, goal=grid.get_free_positions()[0])
+    dijkstra = DijkstraPathfinder(grid)
+    searches = [AStarPathfinder(grid, heuristic) for heuristic in ("euclidean", "manhattan", "diagonal")]
+    searches.append(IDAStarPathfinder(grid))
+    positions = random.Random(6)
+    
+    for step in range(3):
+        if step:
+            grid.set_cost_region(5, 5, 15, 12, 4.0 * step)
+            assert grid.cost_at(7, 7) == 4.0 * step and grid.min_cost == 1.0
+        for _ in range(6):
+            free_positions = grid.get_free_positions()
+            start, goal = positions.choice(free_positions), positions.choice(free_positions)
+            expected = dijkstra.find_path(start, goal)
+            if not expected.found:
+                continue
+            entered = sum(grid.cost_at(x, y) for x, y in expected.path[1:])
+            assert abs(entered - expected.path_cost) < 1e-6
+            for search in searches:
+                assert abs(search.find_path(start, goal).path_cost - expected.path_cost) < 1e-6
+            
+            to_goal = dijkstra.find_path(start, field.goal)
+            if to_goal.found:
+                assert abs(field.cost_to_goal(start) - to_goal.path_cost) < 1e-6
+    
+    grid.set_cost_region(0, 0, 20, 20, 2.0)
+    assert grid.min_cost == 2.0
+    
+    #Incremental min_cost tracking agrees with a full scan of the layer
+    edits = random.Random(9)
+    for _ in range(40):
+        x0, y0 = edits.randrange(20), edits.randrange(20)
+        grid.set_cost_region(x0, y0, x0 + edits.randrange(1, 8), y0 + edits.randrange(1, 8),
+                             edits.choice([0.5, 1.25, 2.0, 6.0]))
+        assert grid.min_cost == min(grid.costs)
+    
+    try:
+        ContractionHierarchy(grid).find_path((0, 0), (1, 0))
+        assert False, "unit-cost planners must reject cost layers"
+    except ValueError:
+        pass
+    
+    grid.clear_costs()
+    assert grid.costs is None and grid.min_cost == 1.0
+    try:
+        grid.set_costs([0.0] * 400)
+        assert False, "non-positive costs must be rejected"
+    except ValueError:
+        pass
@@ -0,0 +1,70 @@
+"""
+Test cases for headless rendering.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib.image as mpimg
+
+from environment import Grid
+from algorithms import DijkstraPathfinder, AStarPathfinder
+from visualization import PathPlotter
+from visualization.raster import COLORS, rasterize_grid
+
+
+def test_rasterize_grid():
+    """Test that cells land on the right pixels with the y axis pointing up."""
+    grid = Grid(4, 3)
+    grid.add_obstacle(1, 0)
+    
+    image = rasterize_grid(grid, path=[(0, 0), (0, 1)], start=(0, 0), goal=(0, 1), scale=2)
+    
+    assert image.shape == (6, 8, 3)
+    # y=0 is the bottom pixel row
+    assert tuple(image[-1, 2]) == COLORS['obstacle']
+    assert tuple(image[-1, 0]) == COLORS['start']
+    assert tuple(image[-3, 0]) == COLORS['goal']
+    assert tuple(image[0, 0]) == COLORS['free']
+
+
+def test_headless_comparison_frames():
+    """Test that headless frames are written by the worker pool."""
+    grid = Grid(10, 10)
+    start, goal = (0, 0), (9, 9)
+    dijkstra_result = DijkstraPathfinder(grid).find_path(start, goal)
+    astar_result = AStarPathfinder(grid).find_path(start, goal)
+    
+    plotter = PathPlotter(headless=True, max_workers=2)
+    frame = plotter.render_comparison(grid, dijkstra_result, astar_result, start, goal, scale=3)
+    assert frame.shape == (30, 63, 3)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        filenames = [os.path.join(tmp, f"frame_{i}.png") for i in range(3)]
+        for filename in filenames:
+            plotter.save_frame(frame, filename)
+        plotter.close_all()
+        
+        assert mpimg.imread(filenames[-1]).shape[:2] == frame.shape[:2]
+
+
+def test_expansion_frames():
+    """Test animation frames grow with the recorded expansions."""
+    grid = Grid(8, 8)
+    start, goal = (0, 0), (7, 7)
+    dijkstra_result = DijkstraPathfinder(grid, record_expansions=True).find_path(start, goal)
+    astar_result = AStarPathfinder(grid, record_expansions=True).find_path(start, goal)
+    
+    plotter = PathPlotter(headless=True)
+    frames = plotter.render_expansion_frames(grid, dijkstra_result, astar_result, start, goal,
+                                             num_frames=5, scale=1)
+    
+    assert len(frames) == 5
+    assert frames[0].shape == (8, 17, 3)
+    expanded_color = (frames[-2] == COLORS['expanded']).all(axis=2).sum()
+    assert expanded_color > (frames[1] == COLORS['expanded']).all(axis=2).sum()
+    plotter.close_all()
@@ -1,3 +1,13 @@
-from .plotter import PathPlotter
+import importlib
+
+#Submodules pull in matplotlib and NumPy, so each one is imported on first attribute access
+_EXPORTS = {'PathPlotter': '.plotter'}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['PathPlotter'] 
\ No newline at end of file
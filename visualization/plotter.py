@@ -4,11 +4,18 @@ import numpy as np
 from typing import List, Tuple
 from algorithms.base import PathResult
 from environment.grid import Grid
+from .raster import FrameWriter, hstack_frames, rasterize_grid
 
 
 class PathPlotter:
-    def __init__(self, figsize=(12, 8)):
+    def __init__(self, figsize=(12, 8), headless: bool = False, max_workers: int = 4):
         self.figsize = figsize
+        self.headless = headless
+        self.max_workers = max_workers
+        self._frame_writer = None
+        if headless:
+            #Non-interactive backend so nothing can block on a window
+            plt.switch_backend('Agg')
         plt.style.use('default') 
     
     def plot_grid_with_path(self, grid: Grid, path: List[Tuple[int, int]], 
@@ -17,12 +24,7 @@ class PathPlotter:
       
         fig, ax = plt.subplots(figsize=self.figsize)
     
-        grid_array = np.zeros((grid.height, grid.width))
-      
-        for x, y in grid.obstacles:
-            grid_array[y, x] = 1
-       
-        ax.imshow(grid_array, cmap='binary', origin='lower')
+        ax.imshow(grid.occupancy_array(), cmap='binary', origin='lower', vmin=0, vmax=1)
         
     
         if path:
@@ -43,8 +45,8 @@ class PathPlotter:
         ax.grid(True, alpha=0.3)
         
     
-        ax.set_xticks(range(grid.width))
-        ax.set_yticks(range(grid.height))
+        ax.set_xticks(range(0, grid.width, max(1, grid.width//10)))
+        ax.set_yticks(range(0, grid.height, max(1, grid.height//10)))
         
         plt.tight_layout()
         return fig, ax
@@ -80,12 +82,7 @@ class PathPlotter:
                            start: Tuple[int, int], goal: Tuple[int, int], 
                            algorithm_name: str):
         
-        grid_array = np.zeros((grid.height, grid.width))
-        
-        for x, y in grid.obstacles:
-            grid_array[y, x] = 1
-        
-        ax.imshow(grid_array, cmap='binary', origin='lower')
+        ax.imshow(grid.occupancy_array(), cmap='binary', origin='lower', vmin=0, vmax=1)
        
         if result.found and result.path:
             path_x = [pos[0] for pos in result.path]
@@ -117,6 +114,57 @@ class PathPlotter:
         ax.set_xticks(range(0, grid.width, max(1, grid.width//10)))
         ax.set_yticks(range(0, grid.height, max(1, grid.height//10)))
     
+    def plot_expansion_heatmaps(self, grid: Grid, dijkstra_result: PathResult,
+                                astar_result: PathResult, start: Tuple[int, int],
+                                goal: Tuple[int, int]):
+        """Show expansion order of both searches; needs results recorded with record_expansions=True."""
+        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        
+        for ax, result, name in zip(axes, [dijkstra_result, astar_result], ["Dijkstra", "A*"]):
+            if result.expansion_log is None:
+                raise ValueError(f"{name} result has no expansion log; enable record_expansions")
+            
+            order = np.ma.masked_less(result.expansion_log.expansion_heatmap(), 0)
+            ax.imshow(grid.occupancy_array(), cmap='binary', origin='lower', vmin=0, vmax=1)
+            image = ax.imshow(order, cmap='viridis', origin='lower', alpha=0.85)
+            fig.colorbar(image, ax=ax, label='Expansion order')
+            
+            if result.found and result.path:
+                path_x = [pos[0] for pos in result.path]
+                path_y = [pos[1] for pos in result.path]
+                ax.plot(path_x, path_y, 'r-', linewidth=2, alpha=0.8, label='Path')
+            
+            ax.plot(start[0], start[1], 'go', markersize=10, label='Start')
+            ax.plot(goal[0], goal[1], 'ro', markersize=10, label='Goal')
+            ax.set_title(f"{name}\nExpanded: {result.expansion_log.num_expanded}, "
+                         f"Insertions: {result.expansion_log.num_insertions}", fontsize=10)
+            ax.legend(fontsize=8)
+        
+        plt.tight_layout()
+        return fig
+    
+    def render_expansion_frames(self, grid: Grid, dijkstra_result: PathResult,
+                                astar_result: PathResult, start: Tuple[int, int],
+                                goal: Tuple[int, int], num_frames: int = 50,
+                                scale: int = 4) -> List[np.ndarray]:
+        """Rasterize side-by-side animation frames of both searches' expansion fronts."""
+        ranks = []
+        for result in [dijkstra_result, astar_result]:
+            if result.expansion_log is None:
+                raise ValueError(f"{result.algorithm_name} result has no expansion log; enable record_expansions")
+            ranks.append(result.expansion_log.expansion_heatmap())
+        
+        total = max(int(rank.max()) + 1 for rank in ranks)
+        frames = []
+        for step in np.linspace(0, total, max(2, num_frames)).astype(int):
+            panels = []
+            for rank, result in zip(ranks, [dijkstra_result, astar_result]):
+                expanded = (rank >= 0) & (rank < step)
+                path = result.path if result.found and step >= total else None
+                panels.append(rasterize_grid(grid, path, start, goal, expanded=expanded, scale=scale))
+            frames.append(hstack_frames(panels, gap=scale))
+        return frames
+    
     def plot_performance_comparison(self, results_dict):
         algorithms = list(results_dict.keys())
         if len(algorithms) < 2:
@@ -164,14 +212,44 @@ class PathPlotter:
         plt.subplots_adjust(top=0.93)
         return fig
     
+    def render_result(self, grid: Grid, result: PathResult, start: Tuple[int, int],
+                      goal: Tuple[int, int], expanded=None, scale: int = 4) -> np.ndarray:
+        """Rasterize a single result into an RGB array without matplotlib."""
+        path = result.path if result.found else None
+        return rasterize_grid(grid, path, start, goal, expanded=expanded, scale=scale)
+    
+    def render_comparison(self, grid: Grid, dijkstra_result: PathResult,
+                          astar_result: PathResult, start: Tuple[int, int],
+                          goal: Tuple[int, int], scale: int = 4) -> np.ndarray:
+        """Rasterize Dijkstra and A* results side by side."""
+        return hstack_frames([
+            self.render_result(grid, dijkstra_result, start, goal, scale=scale),
+            self.render_result(grid, astar_result, start, goal, scale=scale),
+        ], gap=scale)
+    
+    def save_frame(self, image: np.ndarray, filename: str):
+        """Queue a rendered frame to be written as PNG by the worker pool."""
+        if self._frame_writer is None:
+            self._frame_writer = FrameWriter(self.max_workers)
+        return self._frame_writer.submit(image, filename)
+    
+    def wait_for_frames(self):
+        """Block until all queued frames are written."""
+        if self._frame_writer is not None:
+            self._frame_writer.wait()
+    
     def save_plot(self, filename: str, dpi: int = 300):
         plt.savefig(filename, dpi=dpi, bbox_inches='tight')
         print(f"Plot saved to {filename}")
     
     def show_plot(self):
         """Display the current plot."""
-        plt.show()
+        if not self.headless:
+            plt.show()
     
     def close_all(self):
         """Close all open plots."""
-        plt.close('all') 
\ No newline at end of file
+        plt.close('all')
+        if self._frame_writer is not None:
+            self._frame_writer.close()
+            self._frame_writer = None 
\ No newline at end of file
@@ -0,0 +1,93 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+import matplotlib.image as mpimg
+import numpy as np
+from environment.grid import Grid
+
+
+COLORS = {
+    'free': (255, 255, 255),
+    'obstacle': (0, 0, 0),
+    'expanded': (255, 200, 120),
+    'path': (40, 90, 220),
+    'start': (30, 170, 60),
+    'goal': (220, 40, 40),
+    'separator': (128, 128, 128),
+}
+
+
+def _paint_positions(image: np.ndarray, positions, color: Tuple[int, int, int]):
+    if positions is None:
+        return
+    positions = np.asarray(positions)
+    if positions.dtype == bool:
+        #Boolean (height, width) mask
+        image[positions] = color
+        return
+    positions = positions.reshape(-1, 2)
+    if len(positions):
+        image[positions[:, 1], positions[:, 0]] = color
+
+
+def rasterize_grid(grid: Grid, path: Optional[Sequence[Tuple[int, int]]] = None,
+                   start: Optional[Tuple[int, int]] = None, goal: Optional[Tuple[int, int]] = None,
+                   expanded=None, scale: int = 1) -> np.ndarray:
+    #Render straight into an RGB uint8 array, one pixel block per cell, y axis pointing up
+    occupancy = grid.occupancy_array().astype(bool)
+    image = np.empty((grid.height, grid.width, 3), dtype=np.uint8)
+    image[:] = COLORS['free']
+    image[occupancy] = COLORS['obstacle']
+
+    _paint_positions(image, expanded, COLORS['expanded'])
+    if path:
+        _paint_positions(image, path, COLORS['path'])
+    if start is not None:
+        image[start[1], start[0]] = COLORS['start']
+    if goal is not None:
+        image[goal[1], goal[0]] = COLORS['goal']
+
+    image = image[::-1]
+    if scale > 1:
+        image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+    return np.ascontiguousarray(image)
+
+
+def hstack_frames(frames: List[np.ndarray], gap: int = 2) -> np.ndarray:
+    #Place equally tall frames side by side with a separator column between them
+    height = max(frame.shape[0] for frame in frames)
+    separator = np.empty((height, gap, 3), dtype=np.uint8)
+    separator[:] = COLORS['separator']
+
+    parts = []
+    for i, frame in enumerate(frames):
+        if i > 0 and gap > 0:
+            parts.append(separator)
+        parts.append(frame)
+    return np.concatenate(parts, axis=1)
+
+
+class FrameWriter:
+    #Writes PNG frames from a background thread pool; encoding releases the GIL
+    def __init__(self, max_workers: int = 4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending: List[Future] = []
+
+    def submit(self, image: np.ndarray, filename: str) -> Future:
+        future = self.executor.submit(mpimg.imsave, filename, image)
+        self.pending.append(future)
+        return future
+
+    def wait(self):
+        pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        self.wait()
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()